@@ -42,3 +42,4 @@ DEFAULT_FILE_FORMAT = "parquet"
 
 # Performance settings
 MAX_WORKERS = 4  # Default number of worker threads/processes
+MAX_DOWNLOAD_WORKERS = 8  # Concurrent ticker downloads, kept low for Yahoo rate limits
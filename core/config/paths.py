@@ -10,8 +10,9 @@ All other files should use these functions to get paths.
 from pathlib import Path
 from typing import Optional
 
-# Get the project root directory (core/config/../../)
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+# Get the project root directory (core/config/../../), resolved once at import
+# so the path helpers below don't have to hit the filesystem on every call
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 # Base directories
 TICKERS_DIR = PROJECT_ROOT / "tickers"
@@ -36,8 +37,8 @@ def get_ticker_data_path(ticker: str, date: str) -> str:
         String path to the ticker's data file
         Format: "tickers/{ticker}/data/{date}_{ticker}_data.csv"
     """
-    # Ensure the path is absolute and normalized
-    path = (TICKERS_DIR / TICKER_DATA_PATTERN.format(ticker=ticker, date=date)).resolve()
+    # TICKERS_DIR is already absolute and normalized
+    path = TICKERS_DIR / TICKER_DATA_PATTERN.format(ticker=ticker, date=date)
     return str(path)
 
 def get_signal_file_path(ticker: str, date: str, confidence_type: str = 'dynamic') -> str:
@@ -53,11 +54,11 @@ def get_signal_file_path(ticker: str, date: str, confidence_type: str = 'dynamic
         String path to the signal file
         Format: "tickers/{ticker}/signals/{date}_{ticker}_signal_{confidence_type}.csv"
     """
-    path = (TICKERS_DIR / SIGNAL_FILE_PATTERN.format(
+    path = TICKERS_DIR / SIGNAL_FILE_PATTERN.format(
         ticker=ticker, 
         date=date,
         confidence_type=confidence_type
-    )).resolve()
+    )
     return str(path)
 
 
@@ -20,6 +20,7 @@ from core.data.cleaner import (
 
 from core.data.pipeline import (
     process_ticker_data,
+    process_ticker_data_with_frame,
     process_all_tickers
 )
 
@@ -36,5 +37,6 @@ __all__ = [
     "clean_ticker_data",
     "validate_ticker_data",
     "process_ticker_data",
+    "process_ticker_data_with_frame",
     "process_all_tickers"
 ]
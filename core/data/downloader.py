@@ -5,8 +5,10 @@ Handles downloading historical OHLCV data for stock tickers by date.
 import os
 import pytz
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Callable, Optional, Union, Tuple
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 import pandas as pd
 import yfinance as yf
 from pathlib import Path
@@ -21,6 +23,7 @@ from core.db.crud.tickers_signals_db import insert_signal
 
 # Import path configuration
 from core.config import get_ticker_data_path
+from core.config.constants import MAX_DOWNLOAD_WORKERS
 
 # Default parameters
 DEFAULT_INTERVAL = "5m"
@@ -29,16 +32,33 @@ TICKERS_FILE = Path("tickers.json")
 FILE_FORMAT = "csv"  # Using CSV instead of parquet to avoid dependency issues
 
 
+@lru_cache(maxsize=4)
+def _load_tickers_cached(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Parse a tickers file, cached per path and modification time.
+    
+    Args:
+        path (str): Path to the tickers JSON file
+        mtime_ns (int): File modification time, part of the cache key only
+    
+    Returns:
+        Tuple[str, ...]: Ticker symbols
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+    return tuple(data.get("tickers", []))
+
+
 def load_tickers() -> List[str]:
     """
     Load ticker symbols from the tickers.json file.
     
+    The parsed file is cached until its modification time changes.
+    
     Returns:
         List[str]: List of ticker symbols
     """
-    with open(TICKERS_FILE, "r") as f:
-        data = json.load(f)
-    return data.get("tickers", [])
+    return list(_load_tickers_cached(str(TICKERS_FILE), TICKERS_FILE.stat().st_mtime_ns))
 
 
 def download_ticker_data(
@@ -100,7 +120,9 @@ def download_ticker_data(
     if start_date is None and end_date is None and period is None:
         period = DEFAULT_PERIOD
     
-    # Create ticker object
+    # Create ticker object. yfinance keeps one process-wide HTTP session
+    # (YfData is a singleton), so concurrent downloads already share its
+    # connection pool and cookie instead of reconnecting per ticker
     ticker_obj = yf.Ticker(ticker)
     
     # Download data
@@ -275,9 +297,18 @@ def download_all_tickers(
     period: Optional[str] = None,
     progress: Optional['Progress'] = None,
     task_id: Optional[int] = None,
-) -> Dict[str, Tuple[int, int]]:
+    max_workers: int = MAX_DOWNLOAD_WORKERS,
+    tickers: Optional[List[str]] = None,
+    download_func: Optional[Callable[[str], Any]] = None,
+    on_result: Optional[Callable[[str, Any], None]] = None,
+) -> Dict[str, Any]:
     """
-    Download data for all tickers in the tickers.json file and save to database.
+    Download data for many tickers concurrently and save it to the database.
+    
+    This is the single place tickers are fanned out to download threads.
+    Downloads are network-bound, so up to ``max_workers`` tickers are fetched
+    concurrently on a thread pool; wall time approaches that of the slowest
+    tickers rather than the sum over all of them.
     
     Args:
         start_date (Optional[Union[str, datetime]]): Start date for data download
@@ -286,14 +317,29 @@ def download_all_tickers(
         period (Optional[str]): Period to download
         progress (Optional[Progress]): Rich Progress instance (if already in a progress context)
         task_id (Optional[int]): Task ID for the progress bar (if already in a progress context)
+        max_workers (int): Maximum concurrent downloads
+        tickers (Optional[List[str]]): Tickers to download, defaults to the tickers.json file
+        download_func (Optional[Callable[[str], Any]]): Called with each ticker instead of
+            download_and_save_ticker_data; must return (inserted, updated) unless
+            on_result is given
+        on_result (Optional[Callable[[str, Any], None]]): Called in the calling thread with
+            each ticker and its result as soon as it completes (failed tickers get (0, 0));
+            replaces the per-ticker and summary output
     
     Returns:
-        Dict[str, Tuple[int, int]]: Dictionary mapping ticker symbols to (inserted, updated) counts
+        Dict[str, Any]: Dictionary mapping ticker symbols to their results, (inserted, updated)
+        counts by default, in ticker order
     """
     from rich.console import Console
     from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
     
-    tickers = load_tickers()
+    if tickers is None:
+        tickers = load_tickers()
+    if download_func is None:
+        download_func = partial(
+            download_and_save_ticker_data,
+            start_date=start_date, end_date=end_date, interval=interval, period=period
+        )
     results = {}
     console = Console()
     
@@ -322,41 +368,51 @@ def download_all_tickers(
             task = progress.add_task("Downloading tickers...", total=len(tickers))
     
     try:
-        for i, ticker in enumerate(tickers):
-            if progress_bar is not None and task is not None:
-                progress_bar.update(task, description=f"Processing {ticker}")
-            else:
-                console.print(f"Processing {ticker} ({i+1}/{len(tickers)})...")
-            
-            try:
-                # Download and save data for this ticker
-                inserted, updated = download_and_save_ticker_data(
-                    ticker, start_date, end_date, interval, period
-                )
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as executor:
+            futures = {executor.submit(download_func, ticker): ticker for ticker in tickers}
+            for i, future in enumerate(as_completed(futures)):
+                ticker = futures[future]
+                if progress_bar is None:
+                    console.print(f"Processed {ticker} ({i+1}/{len(tickers)})")
                 
-                results[ticker] = (inserted, updated)
-                if progress_bar is not None:
-                    progress_bar.print(f"✓ {ticker}: {inserted} new, {updated} updated")
-                else:
-                    console.print(f"  ✓ {ticker}: {inserted} new, {updated} updated")
+                try:
+                    results[ticker] = future.result()
+                    
+                    if on_result is None:
+                        inserted, updated = results[ticker]
+                        if progress_bar is not None:
+                            progress_bar.print(f"✓ {ticker}: {inserted} new, {updated} updated")
+                        else:
+                            console.print(f"  ✓ {ticker}: {inserted} new, {updated} updated")
+                    
+                except Exception as e:
+                    error_msg = f"✗ Error processing {ticker}: {str(e)}"
+                    if progress_bar is not None:
+                        progress_bar.print(error_msg)
+                    else:
+                        console.print(error_msg)
+                    results[ticker] = (0, 0)
                 
-            except Exception as e:
-                error_msg = f"✗ Error processing {ticker}: {str(e)}"
-                if progress_bar is not None:
-                    progress_bar.print(error_msg)
-                else:
-                    console.print(error_msg)
-                results[ticker] = (0, 0)
-            
-            # Update progress if we're using a progress bar
-            if progress_bar is not None and task is not None:
-                progress_bar.update(task, advance=1, refresh=True)
+                if on_result is not None:
+                    on_result(ticker, results[ticker])
+                
+                # Update progress if we're using a progress bar
+                if progress_bar is not None and task is not None:
+                    progress_bar.update(
+                        task, advance=1, description=f"Downloaded {ticker}", refresh=True
+                    )
+        
+        # Report in ticker order regardless of completion order
+        results = {ticker: results[ticker] for ticker in tickers}
     
     finally:
         # Only stop the progress bar if we created it
         if progress is None and progress_bar is not None:
             progress_bar.stop()
     
+    if on_result is not None:
+        return results
+    
     # Print summary
     total_inserted = sum(r[0] for r in results.values())
     total_updated = sum(r[1] for r in results.values())
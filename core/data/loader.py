@@ -3,17 +3,36 @@ Data loading utilities for the trading system.
 
 This module provides functions to load and manage ticker data.
 """
+import csv
 import json
+import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import List, Optional, Dict, Union
 from datetime import datetime
 
+# Optional PyArrow CSV reader
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    import pyarrow.parquet as pq
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
 # Project root directory (two levels up from this file)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 TICKERS_JSON = PROJECT_ROOT / "tickers.json"
 TICKERS_DIR = PROJECT_ROOT / "tickers"
 
+# Price columns read as float32 (either spelling may appear in the CSV header)
+PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+_PRICE_COLUMN_NAMES = PRICE_COLUMNS + [col.capitalize() for col in PRICE_COLUMNS]
+
+# Ticker data file types picked up by load_historical_data
+DATA_FILE_SUFFIXES = ('.parquet', '.csv')
+
 def get_all_tickers() -> List[str]:
     """
     Get a list of all ticker symbols from the tickers.json file.
@@ -54,6 +73,140 @@ def get_ticker_data(ticker: str) -> Optional[dict]:
         return None
 
 
+def _select_columns(
+    names: List[str],
+    columns: Optional[List[str]],
+    file_path: Union[str, Path]
+) -> Optional[List[str]]:
+    """
+    Match requested columns case-insensitively against a file's column names.
+    
+    Args:
+        names: Column names in file order
+        columns: Requested columns, or None for all of them
+        file_path: Path of the file, for the error message
+        
+    Returns:
+        Optional[List[str]]: Matching names in file order, or None for all columns
+        
+    Raises:
+        ValueError: If a requested column is not in the file. An empty
+            selection would mean "every column" to PyArrow but "no columns"
+            to pandas, so it is never passed on
+    """
+    if columns is None:
+        return None
+    wanted = {col.lower() for col in columns}
+    include = [name for name in names if name.lower() in wanted]
+    missing = wanted - {name.lower() for name in include}
+    if missing:
+        raise ValueError(f"Columns not found in {file_path}: {', '.join(sorted(missing))}")
+    return include
+
+
+def read_price_csv(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a ticker data CSV with the first column as a datetime index.
+    
+    Uses the multithreaded PyArrow CSV reader when available and falls back
+    to pandas otherwise. Price columns are read as float32 either way, and
+    the index is parsed by pandas in both cases, so timestamps with a UTC
+    offset keep it instead of being converted to UTC.
+    
+    Args:
+        file_path: Path to the CSV file
+        columns: Columns to read (case-insensitive, e.g. ['timestamp', 'close']).
+                 The first selected column in file order becomes the index.
+                 Reads every column when None.
+        
+    Returns:
+        pd.DataFrame: File contents indexed by the first column
+        
+    Raises:
+        ValueError: If a requested column is not in the file
+    """
+    with open(file_path, 'rb') as f:
+        # Files are read front to back in one go, so ask the kernel for
+        # aggressive readahead (no-op where posix_fadvise is unavailable)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        # Both readers skip a UTF-8 byte order mark and unquote the header
+        header = next(csv.reader([f.readline().decode('utf-8-sig')]), [])
+        f.seek(0)
+        include = _select_columns(header, columns, file_path)
+        
+        if not _HAVE_PYARROW:
+            return pd.read_csv(
+                f,
+                index_col=0,
+                usecols=include,
+                parse_dates=True,
+                dtype={col: np.float32 for col in _PRICE_COLUMN_NAMES}
+            )
+        
+        column_types = {col: pa.float32() for col in _PRICE_COLUMN_NAMES}
+        # PyArrow would convert offset timestamps to UTC, so the index column
+        # is read as text and parsed below as the pandas reader does
+        index_column = include[0] if include else next(iter(header), None)
+        if index_column is not None:
+            column_types[index_column] = pa.string()
+        convert_options = pacsv.ConvertOptions(
+            column_types=column_types,
+            include_columns=include
+        )
+        table = pacsv.read_csv(f, convert_options=convert_options)
+    
+    df = table.to_pandas()
+    df = df.set_index(df.columns[0])
+    if not isinstance(df.index, pd.DatetimeIndex):
+        try:
+            df.index = pd.to_datetime(df.index)
+        except (ValueError, TypeError):
+            pass
+    return df
+
+
+def read_price_file(
+    file_path: Union[str, Path],
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a ticker data file (.parquet or .csv) with a datetime index.
+    
+    Parquet files are read with column projection, so only the selected
+    columns are materialized. Other files go through read_price_csv.
+    
+    Args:
+        file_path: Path to the data file
+        columns: Columns to read (case-insensitive). Reads every column when None.
+        
+    Returns:
+        pd.DataFrame: File contents with price columns as float32
+        
+    Raises:
+        ValueError: If a requested column is not in the file
+    """
+    if Path(file_path).suffix != '.parquet':
+        return read_price_csv(file_path, columns)
+    
+    include = None
+    if columns is not None:
+        include = _select_columns(pq.read_schema(file_path).names, columns, file_path)
+    
+    df = pd.read_parquet(file_path, columns=include, engine='pyarrow')
+    # Files written without the pandas index metadata keep it as the first column
+    if not isinstance(df.index, pd.DatetimeIndex) and len(df.columns) > 0:
+        df = df.set_index(df.columns[0])
+    price_columns = [col for col in df.columns if col in _PRICE_COLUMN_NAMES]
+    if price_columns:
+        df[price_columns] = df[price_columns].astype(np.float32)
+    return df
+
+
 def load_historical_data(ticker: str) -> Optional[pd.DataFrame]:
     """
     Load all available historical data for a ticker from all data files.
@@ -74,26 +227,26 @@ def load_historical_data(ticker: str) -> Optional[pd.DataFrame]:
     
     print(f"Looking for data files in: {ticker_dir}")
     
-    # First, list all CSV files in the directory for debugging
-    all_csv_files = list(ticker_dir.glob("*.csv"))
-    print(f"\nAll CSV files in {ticker_dir}:")
+    # First, list all data files in the directory for debugging
+    all_csv_files = sorted(f for f in ticker_dir.iterdir() if f.suffix in DATA_FILE_SUFFIXES)
+    print(f"\nAll data files in {ticker_dir}:")
     for f in all_csv_files:
         print(f"  - {f.name}")
     
-    # Try different patterns to find data files
+    # Try different patterns to find data files (.parquet or .csv)
     patterns_to_try = [
-        f"*_{ticker}_data.csv",       # Timestamped files (YYYYMMDDHHMM_TICKER_data.csv)
-        f"[0-9]{{6}}_{ticker}_data.csv",  # Monthly files (YYYYMM_TICKER_data.csv)
-        f"{ticker}_data.csv",          # Main data file (TICKER_data.csv)
-        f"{ticker}_*.csv",             # Any CSV file starting with ticker
-        f"*{ticker}*.csv"              # Any CSV file containing ticker name
+        f"*_{ticker}_data.*",       # Timestamped files (YYYYMMDDHHMM_TICKER_data.parquet)
+        f"[0-9]{{6}}_{ticker}_data.*",  # Monthly files (YYYYMM_TICKER_data.parquet)
+        f"{ticker}_data.*",          # Main data file (TICKER_data.parquet)
+        f"{ticker}_*.*",             # Any data file starting with ticker
+        f"*{ticker}*.*"              # Any data file containing ticker name
     ]
     
     data_files = []
     
     for pattern in patterns_to_try:
         try:
-            files = list(ticker_dir.glob(pattern))
+            files = [f for f in ticker_dir.glob(pattern) if f.suffix in DATA_FILE_SUFFIXES]
             if files:
                 print(f"\nFound {len(files)} files with pattern '{pattern}':")
                 for f in files:
@@ -106,7 +259,7 @@ def load_historical_data(ticker: str) -> Optional[pd.DataFrame]:
     
     # If still no files found, try a more aggressive search
     if not data_files and all_csv_files:
-        print("\nNo files matched specific patterns, trying all CSV files...")
+        print("\nNo files matched specific patterns, trying all data files...")
         data_files = all_csv_files
     
     if not data_files:
@@ -129,7 +282,7 @@ def load_historical_data(ticker: str) -> Optional[pd.DataFrame]:
             print(f"  - Full path: {file_path}")
             
             # Read the file
-            df = pd.read_csv(file_path, index_col=0, parse_dates=True)
+            df = read_price_file(file_path)
             print(f"  - Read {len(df)} rows")
             print(f"  - Columns: {df.columns.tolist()}")
             print(f"  - First row: {df.iloc[0].to_dict() if not df.empty else 'Empty'}")
@@ -5,7 +5,7 @@ Data pipeline module for ticker data.
 This module provides functions to orchestrate the flow of data from
 downloading to cleaning to saving.
 """
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import os
 import pandas as pd
@@ -43,6 +43,40 @@ def process_ticker_data(
     Returns:
         str: Path to the saved file
         
+    Raises:
+        ValueError: If data validation fails
+    """
+    file_path, _ = process_ticker_data_with_frame(
+        ticker, start_date, end_date, interval, period, save_date
+    )
+    return file_path
+
+
+def process_ticker_data_with_frame(
+    ticker: str,
+    start_date: Optional[Union[str, datetime]] = None,
+    end_date: Optional[Union[str, datetime]] = None,
+    interval: str = "5m",
+    period: Optional[str] = None,
+    save_date: Optional[datetime] = None,
+) -> Tuple[str, pd.DataFrame]:
+    """
+    Process ticker data through the complete pipeline and keep the data.
+    
+    Same as process_ticker_data, but also returns the cleaned DataFrame so
+    callers that need it (e.g. for a preview) don't have to download it again.
+    
+    Args:
+        ticker (str): Ticker symbol
+        start_date (Optional[Union[str, datetime]]): Start date for data download
+        end_date (Optional[Union[str, datetime]]): End date for data download
+        interval (str): Data interval (e.g., "1d", "1h", "5m")
+        period (Optional[str]): Period to download
+        save_date (Optional[datetime]): Date to use for the file name, defaults to today
+    
+    Returns:
+        Tuple[str, pd.DataFrame]: Path to the saved file and the cleaned data
+        
     Raises:
         ValueError: If data validation fails
     """
@@ -59,7 +93,7 @@ def process_ticker_data(
     # Step 4: Save cleaned data
     file_path = save_ticker_data(ticker, cleaned_data, save_date)
     
-    return file_path
+    return file_path, cleaned_data
 
 
 def process_all_tickers(
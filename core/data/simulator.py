@@ -5,10 +5,18 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Union
 import random
 
 from core.config.paths import get_ticker_data_path
+from core.config.constants import DEFAULT_FILE_FORMAT
+
+# Optional Parquet support
+try:
+    import pyarrow  # noqa: F401
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
 
 class DataSimulator:
     """Simulates 5-minute OHLCV data for backtesting and development."""
@@ -77,7 +85,10 @@ class DataSimulator:
     def save_simulated_data(self, ticker: str, num_candles: int = 1, 
                            timestamp: Optional[datetime] = None) -> str:
         """
-        Generate and save simulated data to a CSV file with timestamp in the filename.
+        Generate and save simulated data to a file with timestamp in the filename.
+        
+        Files are written as Parquet when DEFAULT_FILE_FORMAT is "parquet" and
+        pyarrow is installed, and as CSV otherwise.
         
         Args:
             ticker: Ticker symbol for the file name
@@ -87,36 +98,139 @@ class DataSimulator:
         Returns:
             str: Path to the saved file
         """
-        # Generate the data ending at the specified timestamp
-        df = self.generate_candles(num_candles, timestamp)
-        
-        # Use the end time of the last candle as the file timestamp
-        if timestamp is None:
-            file_timestamp = datetime.now()
-        else:
-            # If timestamp was provided, use it directly
-            file_timestamp = timestamp
-            
-        # Format: YYYYMMDDHHMM_TICKER_data.csv
-        timestamp_str = file_timestamp.strftime("%Y%m%d%H%M")
+        file_path, _ = self.save_simulated_frame(ticker, num_candles, timestamp)
+        return file_path
+    
+    def save_simulated_frame(self, ticker: str, num_candles: int = 1,
+                             timestamp: Optional[datetime] = None) -> Tuple[str, pd.DataFrame]:
+        """
+        Generate and save simulated data, also returning the generated frame.
         
-        # Get the file path using the path module
-        file_path = Path(get_ticker_data_path(
-            ticker=ticker.upper(),
-            date=timestamp_str  # Using full timestamp as the date part
-        ))
+        Lets callers use the candles directly instead of reading the CSV back.
         
-        # Ensure the directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            ticker: Ticker symbol for the file name
+            num_candles: Number of 5-minute candles to generate
+            timestamp: Timestamp for the file name (defaults to now)
+            
+        Returns:
+            Tuple[str, pd.DataFrame]: Path to the saved file and the saved data
+            (with a ``timestamp`` column alongside the index)
+        """
+        # Generate the data ending at the specified timestamp
+        df = self.generate_candles(num_candles, timestamp)
+        return write_simulated_data(ticker, df, timestamp)
+
+
+def write_simulated_data(ticker: str, df: pd.DataFrame,
+                         timestamp: Optional[datetime] = None) -> Tuple[str, pd.DataFrame]:
+    """
+    Save simulated candles to a ticker data file with timestamp in the filename.
+    
+    Files are written as Parquet when DEFAULT_FILE_FORMAT is "parquet" and
+    pyarrow is installed, and as CSV otherwise.
+    
+    Args:
+        ticker: Ticker symbol for the file name
+        df: Candles with a datetime index, as returned by generate_candles
+        timestamp: Timestamp for the file name (defaults to now)
         
-        # Add timestamp column for compatibility with signal generation
-        df_to_save = df.copy()
-        df_to_save['timestamp'] = df_to_save.index
+    Returns:
+        Tuple[str, pd.DataFrame]: Path to the saved file and the saved data
+        (with a ``timestamp`` column alongside the index)
+    """
+    # Use the end time of the last candle as the file timestamp
+    if timestamp is None:
+        file_timestamp = datetime.now()
+    else:
+        # If timestamp was provided, use it directly
+        file_timestamp = timestamp
         
-        # Always create a new file (no appending)
+    # Format: YYYYMMDDHHMM_TICKER_data.parquet (or .csv)
+    timestamp_str = file_timestamp.strftime("%Y%m%d%H%M")
+    
+    # Get the file path using the path module
+    file_path = Path(get_ticker_data_path(
+        ticker=ticker.upper(),
+        date=timestamp_str  # Using full timestamp as the date part
+    ))
+    
+    # Ensure the directory exists
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Add timestamp column for compatibility with signal generation
+    df_to_save = df.copy()
+    df_to_save['timestamp'] = df_to_save.index
+    
+    # Always create a new file (no appending)
+    if DEFAULT_FILE_FORMAT == "parquet" and _HAVE_PYARROW:
+        file_path = file_path.with_suffix(".parquet")
+        df_to_save.to_parquet(
+            file_path, engine='pyarrow', index=True,
+            compression='zstd', use_dictionary=True
+        )
+    else:
         df_to_save.to_csv(file_path, index=True)
+    
+    return str(file_path), df_to_save
+
+
+def batch_simulate(tickers: List[str], base_prices: Dict[str, float],
+                   num_candles: int = 1, volatility: float = 0.01,
+                   volume_range: Tuple[int, int] = (1000, 10000),
+                   timestamp: Optional[datetime] = None,
+                   seed: Optional[Union[int, np.random.Generator]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Simulate 5-minute OHLCV candles for many tickers at once.
+    
+    Prices follow the same walk as DataSimulator.generate_candles, where each
+    candle moves the price by a uniform fraction in [-volatility, volatility].
+    The steps for every ticker and candle are drawn in one (tickers x candles)
+    call and accumulated with a single cumulative product, instead of looping
+    per ticker and per candle.
+    
+    Args:
+        tickers: Ticker symbols to simulate
+        base_prices: Starting price for each ticker (defaults to 100.0)
+        num_candles: Number of 5-minute candles to generate per ticker
+        volatility: Largest per-candle move, as a fraction of the current price
+        volume_range: Range for random volume generation (min, max)
+        timestamp: Starting timestamp (defaults to now - num_candles * 5 minutes)
+        seed: Seed or Generator for reproducible output
         
-        return str(file_path)
+    Returns:
+        Dict[str, pd.DataFrame]: Candles per ticker, in the same format as
+        DataSimulator.generate_candles
+    """
+    rng = np.random.default_rng(seed)
+    if timestamp is None:
+        timestamp = datetime.now() - timedelta(minutes=5 * num_candles)
+    index = pd.date_range(timestamp, periods=num_candles, freq='5min', name='Datetime')
+    
+    shape = (len(tickers), num_candles)
+    base = np.array([base_prices.get(ticker, 100.0) for ticker in tickers], dtype=float)
+    steps = rng.uniform(-1, 1, shape) * volatility
+    closes = base[:, None] * np.cumprod(1 + steps, axis=1)
+    opens = np.concatenate([base[:, None], closes[:, :-1]], axis=1)
+    # Wicks extend up to 0.2% beyond the candle body
+    highs = np.maximum(opens, closes) * (1 + rng.random(shape) * 0.002)
+    lows = np.minimum(opens, closes) * (1 - rng.random(shape) * 0.002)
+    volumes = rng.integers(volume_range[0], volume_range[1], size=shape, endpoint=True)
+    
+    return {
+        ticker: pd.DataFrame(
+            {
+                'open': opens[i],
+                'high': highs[i],
+                'low': lows[i],
+                'close': closes[i],
+                'volume': volumes[i],
+                'timestamp': index,
+            },
+            index=index
+        )
+        for i, ticker in enumerate(tickers)
+    }
 
 
 def simulate_ticker_data(ticker: str, num_candles: int = 1, 
@@ -1,6 +1,7 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import pytz
+import numpy as np
 import pandas as pd
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.dialects.postgresql import insert
@@ -138,6 +139,29 @@ def save_ticker_data(db, ticker: str, df: pd.DataFrame, batch_size: int = 100, b
 def get_prices_for_ticker(db, ticker: str):
     return db.query(TickersData).filter(TickersData.ticker == ticker).all()
 
+def get_close_for_ticker(db: Session, ticker: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get only the timestamps and close prices for a ticker, oldest first.
+    
+    Args:
+        db: Database session
+        ticker: Ticker symbol
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (timestamps, closes); closes are float64
+        with NaN for missing values
+    """
+    rows = db.query(TickersData.timestamp, TickersData.close)\
+        .filter(TickersData.ticker == ticker)\
+        .order_by(TickersData.timestamp)\
+        .all()
+    
+    if not rows:
+        return np.array([], dtype=object), np.array([], dtype=np.float64)
+    
+    timestamps, closes = zip(*rows)
+    return np.array(timestamps, dtype=object), np.array(closes, dtype=np.float64)
+
 def delete_old_prices(db, before_timestamp):
     """Delete price records older than the specified timestamp."""
     db.query(TickersData).filter(TickersData.timestamp < before_timestamp).delete()
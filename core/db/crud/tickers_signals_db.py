@@ -1,8 +1,11 @@
 """
 CRUD operations for tickers_signals table.
 """
+import csv
+import io
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import select, literal
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
@@ -28,6 +31,108 @@ def insert_signal(db: Session, signal_data: dict) -> int:
     return signal_id
 
 
+def insert_signal_if_absent(db: Session, signal_data: dict) -> Optional[int]:
+    """
+    Insert a signal unless one already exists for the same ticker and timestamp.
+    
+    The existence check and the insert are a single
+    ``INSERT ... SELECT ... WHERE NOT EXISTS ... RETURNING id`` statement, so a
+    new signal takes one round trip instead of a SELECT followed by an INSERT.
+    
+    Args:
+        db: Database session
+        signal_data: Dictionary containing signal data (must include ticker
+            and timestamp)
+        
+    Returns:
+        The ID of the created signal record, or None if a signal already exists
+    """
+    table = TickersSignals.__table__
+    columns = list(signal_data)
+    already_exists = (
+        select(TickersSignals.id)
+        .where(
+            TickersSignals.ticker == signal_data['ticker'],
+            TickersSignals.timestamp == signal_data['timestamp']
+        )
+        .exists()
+    )
+    values = select(
+        *[literal(signal_data[col], type_=table.c[col].type) for col in columns]
+    ).where(~already_exists)
+    stmt = (
+        table.insert()
+        .from_select(columns, values)
+        .returning(table.c.id)
+    )
+    
+    try:
+        signal_id = db.execute(stmt).scalar()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return signal_id
+
+
+def _copy_signals(db: Session, signals: List[Dict[str, Any]]) -> None:
+    """
+    Stream signals into tickers_signals with PostgreSQL COPY.
+    
+    The rows are written to an in-memory CSV buffer and sent over the
+    session's own connection, so they share its transaction.
+    
+    Args:
+        db: Database session bound to a psycopg2 engine
+        signals: List of signal dictionaries, all with the same keys
+    """
+    columns = list(signals[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for sig in signals:
+        writer.writerow([r'\N' if sig[col] is None else sig[col] for col in columns])
+    buffer.seek(0)
+    
+    sql = (
+        f"COPY {TickersSignals.__tablename__} ({', '.join(columns)}) "
+        "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(sql, buffer)
+
+
+def bulk_insert_signals(db: Session, signals: List[Dict[str, Any]]) -> int:
+    """
+    Insert many signals with a single executemany statement and one commit.
+    
+    Uses a Core insert rather than ORM objects, so there is no per-row
+    unit-of-work overhead. On PostgreSQL (psycopg2) the rows are sent with
+    COPY instead, which avoids per-row statement overhead altogether. The
+    transaction is rolled back if the insert fails.
+    
+    Args:
+        db: Database session
+        signals: List of signal dictionaries (ticker, timestamp, signal,
+            signal_type, confidence, reasoning)
+            
+    Returns:
+        int: Number of records inserted
+    """
+    if not signals:
+        return 0
+    
+    try:
+        if db.get_bind().dialect.driver == 'psycopg2':
+            _copy_signals(db, signals)
+        else:
+            db.execute(TickersSignals.__table__.insert(), signals)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(signals)
+
+
 def get_signals_for_ticker(db: Session, ticker: str, limit: int = 100) -> List[TickersSignals]:
     """
     Get signals for a specific ticker, most recent first.
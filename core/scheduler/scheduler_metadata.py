@@ -21,6 +21,21 @@ def ensure_metadata_dir() -> None:
     METADATA_DIR.mkdir(exist_ok=True, parents=True)
 
 
+def read_signal_column(signal_file: str) -> pd.Series:
+    """
+    Read only the signal column from a Parquet or CSV signal file.
+    
+    Args:
+        signal_file: Path to the signal file
+        
+    Returns:
+        pd.Series: Signal values (BUY/SELL/STAY)
+    """
+    if Path(signal_file).suffix == ".parquet":
+        return pd.read_parquet(signal_file, columns=["signal"])["signal"]
+    return pd.read_csv(signal_file, usecols=["signal"])["signal"]
+
+
 def save_signal_metadata(results: List[Dict[str, Any]], timestamp: datetime) -> str:
     """
     Save a summary JSON with signal counts per job.
@@ -57,10 +72,10 @@ def save_signal_metadata(results: List[Dict[str, Any]], timestamp: datetime) ->
             # Read the signal file to count signal types
             signal_file = result["signal_file"]
             try:
-                df = pd.read_csv(signal_file)
-                if not df.empty:
+                signals = read_signal_column(signal_file)
+                if not signals.empty:
                     # Count each signal type
-                    signal_types = df["signal"].value_counts().to_dict()
+                    signal_types = signals.value_counts().to_dict()
                     for signal_type, count in signal_types.items():
                         if signal_type in signal_counts:
                             signal_counts[signal_type] += count
@@ -127,20 +127,23 @@ def cleanup_old_files(directory: Union[str, Path], days_to_keep: int = 30) -> No
         
     cutoff_time = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
     
-    for item in directory.iterdir():
-        if item.is_file() and item.stat().st_mtime < cutoff_time:
-            try:
-                item.unlink()
-                console.log(f"Removed old file: {item}")
-            except Exception as e:
-                console.log(f"Error removing {item}: {e}", style="red")
-        elif item.is_dir():
-            # Recursively clean subdirectories
-            cleanup_old_files(item, days_to_keep)
-            # Remove empty directories
-            try:
-                item.rmdir()
-                console.log(f"Removed empty directory: {item}")
-            except OSError:
-                # Directory not empty, skip
-                pass
+    # scandir entries carry the file type from the directory listing, so only
+    # files need a stat call for their modification time
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                try:
+                    os.unlink(entry.path)
+                    console.log(f"Removed old file: {entry.path}")
+                except Exception as e:
+                    console.log(f"Error removing {entry.path}: {e}", style="red")
+            elif entry.is_dir():
+                # Recursively clean subdirectories
+                cleanup_old_files(entry.path, days_to_keep)
+                # Remove empty directories
+                try:
+                    os.rmdir(entry.path)
+                    console.log(f"Removed empty directory: {entry.path}")
+                except OSError:
+                    # Directory not empty, skip
+                    pass
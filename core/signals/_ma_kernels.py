@@ -0,0 +1,400 @@
+"""
+Streaming rolling-window kernels for moving average signals.
+
+Each kernel walks the input once: rolling means keep a running sum (add the
+new value, subtract the one leaving the window) and the rolling max keeps a
+monotonic deque of indices in a ring buffer sized to the window. NaN
+handling matches pandas ``rolling(w)`` with the default ``min_periods=w``:
+the output is NaN until the window is full and whenever the window
+contains a NaN.
+
+Outputs have the same dtype as the input, so float32 closes give float32
+indicators. Running sums are always accumulated in float64.
+
+The kernels are compiled with Numba when it is installed. Without Numba the
+same functions run as plain Python, which is correct but slow, so callers
+should check HAVE_NUMBA before preferring them over vectorized fallbacks.
+Compiled kernels release the GIL (nogil=True), so calls from the worker
+threads in generate_all_ma_signals run in parallel.
+"""
+import numpy as np
+from typing import Tuple
+
+# Optional Numba support
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Passthrough decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# fastmath is left off on purpose: it lets Numba assume no NaNs, which would
+# break the NaN window bookkeeping below.
+@njit(cache=True, nogil=True)
+def rolling_mean(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    Rolling mean over a fixed window using a running sum.
+
+    Args:
+        x: Input values
+        w: Window size
+
+    Returns:
+        np.ndarray: Rolling means, NaN where the window is not full or has NaNs
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=x.dtype)
+    s = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+        if i >= w:
+            old = x[i - w]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+        if i >= w - 1 and nan_count == 0:
+            out[i] = s / w
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_max_deque(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    Rolling max over a fixed window using a monotonic deque of indices.
+
+    Args:
+        x: Input values
+        w: Window size
+
+    Returns:
+        np.ndarray: Rolling maxima, NaN where the window is not full or has NaNs
+    """
+    n = x.shape[0]
+    out = np.empty(n, dtype=x.dtype)
+    # Ring buffer of at most w indices; head is the oldest, tail the next free slot
+    dq = np.empty(w, dtype=np.int64)
+    head = 0
+    tail = 0
+    size = 0
+    nan_count = 0
+    for i in range(n):
+        if i >= w and np.isnan(x[i - w]):
+            nan_count -= 1
+        while size > 0 and dq[head] <= i - w:
+            head = head + 1 if head + 1 < w else 0
+            size -= 1
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            while size > 0 and x[dq[tail - 1 if tail > 0 else w - 1]] <= v:
+                tail = tail - 1 if tail > 0 else w - 1
+                size -= 1
+            dq[tail] = i
+            tail = tail + 1 if tail + 1 < w else 0
+            size += 1
+        if i >= w - 1 and nan_count == 0:
+            out[i] = x[dq[head]]
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, nogil=True)
+def compute_indicators(
+    close: np.ndarray,
+    short_w: int,
+    long_w: int,
+    peak_w: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute both moving averages and the peak-window max in one pass.
+
+    Args:
+        close: Close prices in chronological order
+        short_w: Short-term moving average window
+        long_w: Long-term moving average window
+        peak_w: Window for detecting local price peaks
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (ma_short, ma_long, recent_max)
+    """
+    n = close.shape[0]
+    ma_short = np.empty(n, dtype=close.dtype)
+    ma_long = np.empty(n, dtype=close.dtype)
+    recent_max = np.empty(n, dtype=close.dtype)
+
+    s_short = 0.0
+    s_long = 0.0
+    nan_short = 0
+    nan_long = 0
+    nan_peak = 0
+    dq = np.empty(peak_w, dtype=np.int64)
+    head = 0
+    tail = 0
+    size = 0
+
+    for i in range(n):
+        v = close[i]
+        v_nan = np.isnan(v)
+
+        # Short window running sum
+        if v_nan:
+            nan_short += 1
+        else:
+            s_short += v
+        if i >= short_w:
+            old = close[i - short_w]
+            if np.isnan(old):
+                nan_short -= 1
+            else:
+                s_short -= old
+        if i >= short_w - 1 and nan_short == 0:
+            ma_short[i] = s_short / short_w
+        else:
+            ma_short[i] = np.nan
+
+        # Long window running sum
+        if v_nan:
+            nan_long += 1
+        else:
+            s_long += v
+        if i >= long_w:
+            old = close[i - long_w]
+            if np.isnan(old):
+                nan_long -= 1
+            else:
+                s_long -= old
+        if i >= long_w - 1 and nan_long == 0:
+            ma_long[i] = s_long / long_w
+        else:
+            ma_long[i] = np.nan
+
+        # Peak window monotonic deque
+        if i >= peak_w and np.isnan(close[i - peak_w]):
+            nan_peak -= 1
+        while size > 0 and dq[head] <= i - peak_w:
+            head = head + 1 if head + 1 < peak_w else 0
+            size -= 1
+        if v_nan:
+            nan_peak += 1
+        else:
+            while size > 0 and close[dq[tail - 1 if tail > 0 else peak_w - 1]] <= v:
+                tail = tail - 1 if tail > 0 else peak_w - 1
+                size -= 1
+            dq[tail] = i
+            tail = tail + 1 if tail + 1 < peak_w else 0
+            size += 1
+        if i >= peak_w - 1 and nan_peak == 0:
+            recent_max[i] = close[dq[head]]
+        else:
+            recent_max[i] = np.nan
+
+    return ma_short, ma_long, recent_max
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def batch_compute_indicators(
+    flat_close: np.ndarray,
+    offsets: np.ndarray,
+    short_w: int,
+    long_w: int,
+    peak_w: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run compute_indicators for many tickers in parallel.
+
+    Close series are passed concatenated into one array; ticker ``t`` spans
+    ``flat_close[offsets[t]:offsets[t + 1]]``. Outputs use the same layout.
+
+    Args:
+        flat_close: All tickers' close prices, concatenated
+        offsets: Start offset of each ticker plus the total length (len = tickers + 1)
+        short_w: Short-term moving average window
+        long_w: Long-term moving average window
+        peak_w: Window for detecting local price peaks
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Concatenated (ma_short, ma_long, recent_max)
+    """
+    total = flat_close.shape[0]
+    ma_short = np.empty(total, dtype=flat_close.dtype)
+    ma_long = np.empty(total, dtype=flat_close.dtype)
+    recent_max = np.empty(total, dtype=flat_close.dtype)
+    for t in prange(offsets.shape[0] - 1):
+        start = offsets[t]
+        end = offsets[t + 1]
+        s, l, m = compute_indicators(flat_close[start:end], short_w, long_w, peak_w)
+        ma_short[start:end] = s
+        ma_long[start:end] = l
+        recent_max[start:end] = m
+    return ma_short, ma_long, recent_max
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_std(x: np.ndarray, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample standard deviation with ``min_periods=1``.
+    
+    Uses Welford's online update to add the new value and remove the one
+    leaving the window. Matches pandas ``rolling(w, min_periods=1)``: NaNs
+    are skipped, the mean is NaN only for an all-NaN window, the standard
+    deviation (ddof=1) is NaN with fewer than two values and exactly zero
+    when every value in the window is the same.
+    
+    Args:
+        x: Input values
+        w: Window size
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (mean, std) as float64
+    """
+    n = x.shape[0]
+    mean_out = np.empty(n, dtype=np.float64)
+    std_out = np.empty(n, dtype=np.float64)
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+    # Run length of identical values, so a constant window gives exactly 0
+    same_count = 0
+    prev = np.nan
+    for i in range(n):
+        if i >= w:
+            old = x[i - w]
+            if not np.isnan(old):
+                nobs -= 1
+                if nobs > 0:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    ssqdm -= ((nobs + 1) * delta * delta) / nobs
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+        v = x[i]
+        if not np.isnan(v):
+            nobs += 1
+            delta = v - mean
+            mean += delta / nobs
+            ssqdm += ((nobs - 1) * delta * delta) / nobs
+            if v == prev:
+                same_count += 1
+            else:
+                same_count = 1
+            prev = v
+        if nobs == 0:
+            mean_out[i] = np.nan
+            std_out[i] = np.nan
+            continue
+        mean_out[i] = mean
+        if nobs < 2:
+            std_out[i] = np.nan
+        elif same_count >= nobs or ssqdm <= 0.0:
+            std_out[i] = 0.0
+        else:
+            std_out[i] = np.sqrt(ssqdm / (nobs - 1))
+    return mean_out, std_out
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def decide_signals(
+    close: np.ndarray,
+    ma_short: np.ndarray,
+    ma_long: np.ndarray,
+    recent_max: np.ndarray,
+    peak_threshold: float,
+    confidence: np.ndarray,
+    signal: np.ndarray,
+    insufficient: np.ndarray,
+    is_peak_zone: np.ndarray
+) -> None:
+    """
+    Derive confidence, raw signal codes and peak zones in one pass.
+    
+    Writes into the given output arrays. Arithmetic stays in the dtype of the
+    inputs, so ``peak_threshold`` should be passed as a scalar of that dtype to
+    match the NumPy path bit for bit.
+    
+    Args:
+        close: Close prices
+        ma_short: Short moving average
+        ma_long: Long moving average
+        recent_max: Peak-window max
+        peak_threshold: Threshold for peak detection (0-1)
+        confidence: Output, |ma_short - ma_long| / ma_long, 0 where insufficient
+        signal: Output int8 codes: 1 (BUY) where ma_short > ma_long, 2 (SELL)
+            where ma_short < ma_long, else 0 (STAY, also where insufficient)
+        insufficient: Output, True where any indicator is NaN
+        is_peak_zone: Output, close >= recent_max * peak_threshold
+    """
+    for i in range(close.shape[0]):
+        s = ma_short[i]
+        l = ma_long[i]
+        m = recent_max[i]
+        missing = np.isnan(s) or np.isnan(l) or np.isnan(m)
+        insufficient[i] = missing
+        is_peak_zone[i] = close[i] >= m * peak_threshold
+        if missing:
+            confidence[i] = 0.0
+            signal[i] = 0
+        else:
+            confidence[i] = abs(s - l) / l
+            if s > l:
+                signal[i] = 1
+            elif s < l:
+                signal[i] = 2
+            else:
+                signal[i] = 0
+
+
+# Signatures compiled at import so the first ticker doesn't pay JIT latency.
+# cache=True persists them in __pycache__, so later processes only load them.
+_EAGER_SIGNATURES = {
+    compute_indicators: [
+        "(float64[::1], int64, int64, int64)",
+        "(float32[::1], int64, int64, int64)",
+    ],
+    batch_compute_indicators: [
+        "(float64[::1], int64[::1], int64, int64, int64)",
+        "(float32[::1], int64[::1], int64, int64, int64)",
+    ],
+    rolling_mean_std: [
+        "(float64[::1], int64)",
+    ],
+    decide_signals: [
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64,"
+        " float64[::1], int8[::1], boolean[::1], boolean[::1])",
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float32,"
+        " float32[::1], int8[::1], boolean[::1], boolean[::1])",
+    ],
+}
+
+
+def warmup() -> None:
+    """
+    Compile (or load from the on-disk cache) the kernels used by signal generation.
+
+    Does nothing when Numba is not installed.
+    """
+    if not HAVE_NUMBA:
+        return
+    for kernel, signatures in _EAGER_SIGNATURES.items():
+        for signature in signatures:
+            kernel.compile(signature)
+
+
+warmup()
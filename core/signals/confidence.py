@@ -11,6 +11,7 @@ import pandas as pd
 
 from core.config import console
 from core.config.constants import WINDOW_CONF, Z_MIN, QUANTILE_MIN, USE_QUANTILE, USE_DYNAMIC_CONFIDENCE
+from ._ma_kernels import HAVE_NUMBA, rolling_mean_std
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -42,9 +43,16 @@ def calculate_dynamic_threshold(
     # Initialize output series with fallback threshold
     thresholds = pd.Series(index=values.index, dtype=float)
     
-    # Calculate rolling statistics
-    rolling_mean = values.rolling(window=window, min_periods=1).mean()
-    rolling_std = values.rolling(window=window, min_periods=1).std()
+    # Calculate rolling statistics (one compiled pass when Numba is available)
+    if HAVE_NUMBA:
+        mean_values, std_values = rolling_mean_std(
+            np.ascontiguousarray(values.to_numpy(dtype=np.float64)), window
+        )
+        rolling_mean = pd.Series(mean_values, index=values.index)
+        rolling_std = pd.Series(std_values, index=values.index)
+    else:
+        rolling_mean = values.rolling(window=window, min_periods=1).mean()
+        rolling_std = values.rolling(window=window, min_periods=1).std()
     
     # Calculate threshold based on selected method
     if use_quantile:
@@ -20,6 +20,9 @@ near a local maximum (within a configurable percentage threshold).
 Signals with low confidence or SELL signals not near peaks are downgraded to STAY to reduce false positives.
 """
 import os
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 from typing import Optional, Tuple, Dict, Any, List, Union
@@ -28,7 +31,7 @@ from datetime import datetime, timedelta
 import logging
 
 # Rich progress bar
-from rich.progress import Progress, TaskProgressColumn, TimeRemainingColumn, TextColumn, BarColumn, SpinnerColumn
+from rich.progress import Progress
 
 # Import logger configuration
 import logging
@@ -43,16 +46,654 @@ from core.config.paths import get_ticker_data_path, get_signal_file_path
 # Import data loading
 from core.data.loader import load_historical_data
 
-# Import console
-from core.config.console import console
-from core.config.settings import DEBUG
+from core.config.constants import MAX_WORKERS, WINDOW_CONF, Z_MIN, QUANTILE_MIN, USE_QUANTILE
 
 # Import confidence threshold utilities
-from .confidence import apply_confidence_filter
+from .confidence import apply_confidence_filter, calculate_dynamic_threshold
 
 # Import load_tickers from downloader module
 from core.data.downloader import load_tickers as get_all_tickers
 
+# Optional PyArrow support for Parquet signal files
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
+# Streaming rolling-window kernels (compiled when Numba is installed)
+from ._ma_kernels import HAVE_NUMBA, compute_indicators, batch_compute_indicators, decide_signals
+from .peaks import rolling_max
+
+# Optional TA-Lib and bottleneck support for the rolling windows
+try:
+    import talib
+    _HAVE_TALIB = True
+except ImportError:
+    _HAVE_TALIB = False
+
+try:
+    import bottleneck as bn
+    _HAVE_BN = True
+except ImportError:
+    _HAVE_BN = False
+
+# Signal file formats understood by generate_ma_signals
+SIGNAL_FILE_SUFFIXES = {"parquet": ".parquet", "csv": ".csv"}
+
+# Buffer size for signal CSVs written by pandas (no PyArrow)
+SIGNAL_WRITE_BUFFER = 1 << 20
+
+# Number of tickers between progress bar refreshes in generate_all_ma_signals
+PROGRESS_UPDATE_EVERY = 16
+
+# Signal codes used by the array core
+SIGNAL_STAY = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = 2
+
+# Signal names, indexed by signal code
+_SIGNAL_NAMES = np.array(["STAY", "BUY", "SELL"], dtype=object)
+_SIGNAL_DTYPE = pd.CategoricalDtype(categories=list(_SIGNAL_NAMES))
+
+# Reason codes for the reasoning column
+REASON_NONE = 0
+REASON_BUY = 1
+REASON_SELL = 2
+REASON_LOW_CONFIDENCE = 3
+REASON_NOT_PEAK = 4
+REASON_INSUFFICIENT = 5
+
+# Reason code lookup indexed by (insufficient << 3) | (sell_not_peak << 2) | signal
+# code. Insufficient data wins over not-peak, which wins over the final signal;
+# a STAY that is neither was downgraded for low confidence.
+_REASON_LUT = np.empty(16, dtype=np.int8)
+for _index in range(16):
+    if _index & 8:
+        _REASON_LUT[_index] = REASON_INSUFFICIENT
+    elif _index & 4:
+        _REASON_LUT[_index] = REASON_NOT_PEAK
+    else:
+        _REASON_LUT[_index] = (
+            REASON_LOW_CONFIDENCE, REASON_BUY, REASON_SELL, REASON_NONE
+        )[_index & 3]
+del _index
+
+# Fixed reasoning text, indexed by reason code
+_REASON_TEXT = np.array([
+    "",
+    "",
+    "",
+    "",
+    "STAY: Price not near recent peak",
+    "STAY: Insufficient data for signal generation",
+], dtype=object)
+
+# Reasoning text that embeds the row's confidence and threshold
+_REASON_TEMPLATES = {
+    REASON_BUY: "BUY: Short MA crossed above Long MA with confidence {:.4f} (threshold: {:.4f})",
+    REASON_SELL: "SELL: Short MA crossed below Long MA with confidence {:.4f} (threshold: {:.4f}) and price near recent peak",
+    REASON_LOW_CONFIDENCE: "STAY: Confidence too low ({:.4f} < {:.4f})",
+}
+
+
+def _materialize_reasoning(
+    reason_code: np.ndarray,
+    confidence: np.ndarray,
+    thresholds: np.ndarray
+) -> np.ndarray:
+    """
+    Turn an array of reason codes into the reasoning text column.
+    
+    Fixed messages come from a single lookup into ``_REASON_TEXT``; only the rows
+    whose message embeds numbers are formatted individually.
+    
+    Args:
+        reason_code: int8 array of REASON_* codes
+        confidence: Confidence value per row
+        thresholds: Confidence threshold per row
+        
+    Returns:
+        np.ndarray: Object array of reasoning strings
+    """
+    reasoning = _REASON_TEXT[reason_code]
+    for code, template in _REASON_TEMPLATES.items():
+        rows = np.flatnonzero(reason_code == code)
+        if rows.size:
+            reasoning[rows] = [
+                template.format(conf, thresh)
+                for conf, thresh in zip(confidence[rows], thresholds[rows])
+            ]
+    return reasoning
+
+
+class _KernelBuffers:
+    """
+    Per-thread scratch arrays for _generate_ma_signals_arrays.
+    
+    Buffers grow by 1.5x when a longer history is seen and are otherwise
+    reused across tickers, so a run over many tickers doesn't allocate
+    fresh output arrays for each one.
+    """
+    
+    def __init__(self):
+        self.capacity = 0
+        self.confidence = np.empty(0, dtype=np.float64)
+        self.confidence32 = np.empty(0, dtype=np.float32)
+        self.is_peak_zone = np.empty(0, dtype=bool)
+        self.signal = np.empty(0, dtype=np.int8)
+        self.insufficient = np.empty(0, dtype=bool)
+        self.scratch = np.empty(0, dtype=bool)
+        self.shifted = np.empty(0, dtype=np.int8)
+    
+    def ensure(self, n: int) -> None:
+        """
+        Make sure every buffer holds at least ``n`` elements.
+        
+        Args:
+            n: Required length
+        """
+        if n <= self.capacity:
+            return
+        capacity = max(n, int(self.capacity * 1.5))
+        self.confidence = np.empty(capacity, dtype=np.float64)
+        self.confidence32 = np.empty(capacity, dtype=np.float32)
+        self.is_peak_zone = np.empty(capacity, dtype=bool)
+        self.signal = np.empty(capacity, dtype=np.int8)
+        self.insufficient = np.empty(capacity, dtype=bool)
+        self.scratch = np.empty(capacity, dtype=bool)
+        self.shifted = np.empty(capacity, dtype=np.int8)
+        self.capacity = capacity
+
+
+_thread_buffers = threading.local()
+
+
+def _get_kernel_buffers(n: int) -> _KernelBuffers:
+    """
+    Return this thread's kernel buffers, sized for at least ``n`` rows.
+    
+    Args:
+        n: Required length
+        
+    Returns:
+        _KernelBuffers: Buffers owned by the calling thread
+    """
+    buffers = getattr(_thread_buffers, "buffers", None)
+    if buffers is None:
+        buffers = _thread_buffers.buffers = _KernelBuffers()
+    buffers.ensure(n)
+    return buffers
+
+
+def _rolling_indicators(
+    close: np.ndarray,
+    short_window: int,
+    long_window: int,
+    peak_window: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the short/long moving averages and the peak-window max.
+    
+    Uses the fused Numba kernel when Numba is installed, then TA-Lib, then
+    bottleneck, and falls back to cumulative-sum / sliding-window NumPy. Every backend
+    leaves NaN until a window is full. Results have the dtype of ``close``
+    (TA-Lib only computes in float64, so its output is cast back).
+    
+    Args:
+        close: Close prices in chronological order (float32 or float64)
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        peak_window: Window for detecting local price peaks
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (ma_short, ma_long, recent_max)
+    """
+    dtype = close.dtype
+    if HAVE_NUMBA:
+        return compute_indicators(
+            np.ascontiguousarray(close), short_window, long_window, peak_window
+        )
+    if _HAVE_TALIB:
+        close64 = np.ascontiguousarray(close, dtype=np.float64)
+        return (
+            talib.SMA(close64, timeperiod=short_window).astype(dtype, copy=False),
+            talib.SMA(close64, timeperiod=long_window).astype(dtype, copy=False),
+            talib.MAX(close64, timeperiod=peak_window).astype(dtype, copy=False),
+        )
+    if _HAVE_BN:
+        return (
+            bn.move_mean(close, short_window, min_count=short_window),
+            bn.move_mean(close, long_window, min_count=long_window),
+            bn.move_max(close, peak_window, min_count=peak_window),
+        )
+    ma_short, ma_long = _numpy_rolling_means(close, short_window, long_window)
+    return ma_short, ma_long, rolling_max(close, peak_window)
+
+
+def _numpy_rolling_means(x: np.ndarray, *windows: int) -> Tuple[np.ndarray, ...]:
+    """
+    Rolling means as differences of cumulative sums, O(n) in plain NumPy.
+    
+    The cumulative sums are built once and shared by every window, so the
+    short and long averages cost a single pass over ``x``. Matches pandas
+    ``rolling(w).mean()``: NaN until the window is full and wherever the
+    window contains a NaN. Sums are accumulated in float64 and the results
+    are cast back to the dtype of ``x``.
+    
+    Args:
+        x: Input values
+        *windows: Window sizes
+        
+    Returns:
+        Tuple[np.ndarray, ...]: Rolling means, one array per window
+    """
+    n = x.shape[0]
+    nan_mask = np.isnan(x)
+    csum = np.zeros(n + 1, dtype=np.float64)
+    np.cumsum(np.where(nan_mask, 0.0, x), out=csum[1:])
+    nan_count = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(nan_mask, out=nan_count[1:])
+    
+    results = []
+    for w in windows:
+        out = np.full(n, np.nan, dtype=x.dtype)
+        if n >= w:
+            means = (csum[w:] - csum[:-w]) / w
+            means[(nan_count[w:] - nan_count[:-w]) > 0] = np.nan
+            out[w - 1:] = means
+        results.append(out)
+    return tuple(results)
+
+
+def _adjusted_windows(n_rows: int, short_window: int, long_window: int) -> Tuple[int, int]:
+    """
+    Scale the moving average windows down for a history shorter than two long windows.
+    
+    Args:
+        n_rows: Number of price rows
+        short_window: Requested short-term moving average window
+        long_window: Requested long-term moving average window
+        
+    Returns:
+        Tuple[int, int]: (short_window, long_window) to use, unchanged when
+        there is enough data
+    """
+    if n_rows >= long_window * 2:
+        return short_window, long_window
+    # At least 5 for the short window
+    ratio = max(5, n_rows // 2) / long_window
+    return max(5, int(short_window * ratio)), max(10, int(long_window * ratio))
+
+
+def _batch_rolling_indicators(
+    closes: List[np.ndarray],
+    short_window: int,
+    long_window: int,
+    peak_window: int,
+    dtype: type = np.float64
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Compute the rolling indicators for many tickers in one parallel kernel call.
+    
+    Args:
+        closes: Close price arrays, one per ticker
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        peak_window: Window for detecting local price peaks
+        dtype: Float dtype to compute in (np.float64 or np.float32)
+        
+    Returns:
+        List[Tuple[np.ndarray, np.ndarray, np.ndarray]]: (ma_short, ma_long,
+        recent_max) per ticker, in the order of ``closes``
+    """
+    if not closes:
+        return []
+    lengths = np.fromiter((len(c) for c in closes), dtype=np.int64, count=len(closes))
+    offsets = np.zeros(len(closes) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat_close = np.concatenate([np.asarray(c, dtype=dtype) for c in closes])
+    
+    ma_short, ma_long, recent_max = batch_compute_indicators(
+        flat_close, offsets, short_window, long_window, peak_window
+    )
+    return [
+        (ma_short[start:end], ma_long[start:end], recent_max[start:end])
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+def _generate_ma_signals_arrays(
+    close: np.ndarray,
+    short_window: int,
+    long_window: int,
+    peak_window: int,
+    peak_threshold: float,
+    emit_recent_max: bool = False,
+    rolling: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute moving averages, peak zones, confidence and raw signals from closes.
+    
+    This is the numeric core of generate_ma_signals. It works on plain NumPy
+    arrays so callers that already hold a close-price array don't need to
+    build a DataFrame for the math.
+    
+    The ``is_peak_zone``, ``confidence``, ``signal`` and ``insufficient``
+    arrays are views into per-thread buffers and are only valid until the
+    next call on the same thread; copy them (e.g. by assigning to a
+    DataFrame column) before calling again.
+    
+    Args:
+        close: Close prices in chronological order. A float32 array keeps the
+            moving averages and confidence in float32
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        peak_window: Window for detecting local price peaks
+        peak_threshold: Threshold for peak detection (0-1)
+        emit_recent_max: Also return the rolling peak-window max
+        rolling: Precomputed (ma_short, ma_long, recent_max) for ``close`` with
+            the same windows, e.g. from _batch_rolling_indicators
+        
+    Returns:
+        Dict[str, np.ndarray]: Arrays keyed by ``ma_short``, ``ma_long``,
+        ``is_peak_zone``, ``confidence``, ``signal`` (SIGNAL_* codes),
+        ``insufficient`` and, if requested, ``recent_max``
+    """
+    n = len(close)
+    buffers = _get_kernel_buffers(n)
+    
+    if rolling is not None:
+        # recent_max may be scaled in place below, so work on a copy
+        ma_short, ma_long, recent_max = rolling[0], rolling[1], rolling[2].copy()
+    else:
+        ma_short, ma_long, recent_max = _rolling_indicators(
+            close, short_window, long_window, peak_window
+        )
+    
+    insufficient = buffers.insufficient[:n]
+    is_peak_zone = buffers.is_peak_zone[:n]
+    signal = buffers.signal[:n]
+    if ma_short.dtype == np.float32:
+        confidence = buffers.confidence32[:n]
+    else:
+        confidence = buffers.confidence[:n]
+    
+    if HAVE_NUMBA and close.dtype == ma_short.dtype:
+        # One compiled pass over the rows instead of a dozen array passes
+        decide_signals(
+            np.ascontiguousarray(close), np.ascontiguousarray(ma_short),
+            np.ascontiguousarray(ma_long), np.ascontiguousarray(recent_max),
+            close.dtype.type(peak_threshold), confidence, signal, insufficient, is_peak_zone
+        )
+    else:
+        # Not enough history for one of the windows
+        scratch = buffers.scratch[:n]
+        np.isnan(ma_short, out=insufficient)
+        np.logical_or(insufficient, np.isnan(ma_long, out=scratch), out=insufficient)
+        np.logical_or(insufficient, np.isnan(recent_max, out=scratch), out=insufficient)
+        
+        if emit_recent_max:
+            np.greater_equal(close, recent_max * peak_threshold, out=is_peak_zone)
+        else:
+            # Scale the rolling max in place; it is not part of the output
+            np.greater_equal(
+                close, np.multiply(recent_max, peak_threshold, out=recent_max), out=is_peak_zone
+            )
+        
+        # Confidence is the normalized absolute distance between the MAs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.subtract(ma_short, ma_long, out=confidence)
+            np.abs(confidence, out=confidence)
+            np.divide(confidence, ma_long, out=confidence)
+        
+        # Branchless signal codes: BUY (1) from ma_short > ma_long, SELL (2) from
+        # ma_short < ma_long, then zeroed (STAY) where history is insufficient
+        shifted = buffers.shifted[:n]
+        np.greater(ma_short, ma_long, out=scratch)
+        np.copyto(signal, scratch.view(np.int8))
+        np.less(ma_short, ma_long, out=scratch)
+        np.left_shift(scratch.view(np.int8), 1, out=shifted)
+        np.bitwise_or(signal, shifted, out=signal)
+        np.logical_not(insufficient, out=scratch)
+        np.multiply(signal, scratch.view(np.int8), out=signal)
+        np.copyto(confidence, 0.0, where=insufficient)
+    
+    indicators = {
+        "ma_short": ma_short,
+        "ma_long": ma_long,
+        "is_peak_zone": is_peak_zone,
+        "confidence": confidence,
+        "signal": signal,
+        "insufficient": insufficient,
+    }
+    if emit_recent_max:
+        indicators["recent_max"] = recent_max
+    return indicators
+
+
+def _signal_output_path(path: Union[str, Path], output_format: str) -> Path:
+    """
+    Resolve the on-disk signal file path for an output format.
+    
+    Parquet is only used when pyarrow is installed; otherwise the signal
+    file falls back to CSV.
+    
+    Args:
+        path: Signal file path as returned by get_signal_file_path
+        output_format: Requested format ('parquet' or 'csv')
+        
+    Returns:
+        Path: Signal file path with the matching suffix
+    """
+    if output_format not in SIGNAL_FILE_SUFFIXES:
+        raise ValueError(
+            f"Unsupported signal file format '{output_format}'. "
+            f"Expected one of {list(SIGNAL_FILE_SUFFIXES)}"
+        )
+    if output_format == "parquet" and not _HAVE_PYARROW:
+        output_format = "csv"
+    return Path(path).with_suffix(SIGNAL_FILE_SUFFIXES[output_format])
+
+
+def _write_signal_file(signals: pd.DataFrame, path: Path) -> None:
+    """
+    Write a signals DataFrame as Parquet or CSV based on the path suffix.
+    
+    CSV files are written with PyArrow's multithreaded writer when available.
+    
+    Args:
+        signals: Signals to write
+        path: Destination path from _signal_output_path
+    """
+    if path.suffix == ".parquet":
+        table = pa.Table.from_pandas(signals, preserve_index=False)
+        dictionary_cols = [c for c in ("signal", "reasoning") if c in signals.columns]
+        pq.write_table(table, path, compression="zstd", use_dictionary=dictionary_cols)
+    elif _HAVE_PYARROW:
+        table = pa.Table.from_pandas(signals, preserve_index=False)
+        pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(include_header=True))
+    else:
+        # Block-buffered so pandas' many small writes become a few large ones
+        with open(path, "w", newline="", buffering=SIGNAL_WRITE_BUFFER) as f:
+            signals.to_csv(f, index=False)
+
+
+class SignalFileBatchWriter:
+    """
+    Collect signal files from many tickers and write them in batches.
+    
+    Pass an instance as ``batch_writer`` to generate_ma_signals or
+    generate_all_ma_signals. Signal generation then only queues its frames;
+    they are written together on a small thread pool once ``flush_every``
+    files are pending and when the ``with`` block exits, so compute threads
+    don't stall on file IO. Files keep their usual per-ticker paths, so
+    incremental runs and readers are unaffected. Safe to use from several
+    threads.
+    
+    Example:
+        with SignalFileBatchWriter() as writer:
+            generate_all_ma_signals(date=date, batch_writer=writer)
+    """
+    
+    def __init__(self, flush_every: int = 256, max_workers: int = MAX_WORKERS):
+        """
+        Args:
+            flush_every: Pending file count that triggers a flush
+            max_workers: Threads used to write a batch
+        """
+        self.flush_every = flush_every
+        self.max_workers = max_workers
+        self._pending: List[Tuple[pd.DataFrame, Path]] = []
+        self._lock = threading.Lock()
+    
+    def write(self, signals: pd.DataFrame, path: Path) -> None:
+        """Queue a signal file; flushes if the batch is full."""
+        with self._lock:
+            self._pending.append((signals, path))
+            if len(self._pending) < self.flush_every:
+                return
+            batch, self._pending = self._pending, []
+        self._write_batch(batch)
+    
+    def flush(self) -> None:
+        """Write every pending signal file."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        self._write_batch(batch)
+    
+    def _write_batch(self, batch: List[Tuple[pd.DataFrame, Path]]) -> None:
+        if not batch:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batch))) as executor:
+            # list() re-raises the first write error
+            list(executor.map(lambda item: _write_signal_file(*item), batch))
+    
+    def __enter__(self) -> "SignalFileBatchWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+
+class SignalDbBatchWriter:
+    """
+    Collect signal rows from many tickers and insert them in large batches.
+    
+    Pass an instance as ``db_writer`` to generate_ma_signals or
+    generate_all_ma_signals. Rows are inserted with bulk_insert_signals once
+    ``flush_every`` are pending and when the ``with`` block exits, so a full
+    regeneration commits a few large transactions instead of one per ticker.
+    A batch that fails to insert is logged with its tickers and counted in
+    ``failed`` (the exceptions are kept in ``errors``) rather than raised
+    into whichever ticker's call triggered the flush. Safe to use from
+    several threads.
+    
+    Example:
+        with SignalDbBatchWriter() as db_writer:
+            generate_all_ma_signals(date=date, db_writer=db_writer)
+    """
+    
+    def __init__(self, flush_every: int = 10_000):
+        """
+        Args:
+            flush_every: Pending row count that triggers a flush
+        """
+        self.flush_every = flush_every
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[Exception] = []
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+    
+    def add(self, rows: List[Dict[str, Any]]) -> None:
+        """Queue signal rows; flushes if the batch is full."""
+        with self._lock:
+            self._pending.extend(rows)
+            if len(self._pending) < self.flush_every:
+                return
+            batch, self._pending = self._pending, []
+        self._insert_batch(batch)
+    
+    def flush(self) -> None:
+        """Insert every pending signal row."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        self._insert_batch(batch)
+    
+    def _insert_batch(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        from core.db.crud.tickers_signals_db import bulk_insert_signals
+        from core.db.deps import get_db
+        
+        try:
+            with get_db() as db:
+                inserted = bulk_insert_signals(db, batch)
+        except Exception as e:
+            tickers = sorted({row['ticker'] for row in batch})
+            logger.error(
+                f"Database error inserting {len(batch)} queued signals for {', '.join(tickers)}: {str(e)}",
+                exc_info=True
+            )
+            with self._lock:
+                self.failed += len(batch)
+                self.errors.append(e)
+            return
+        with self._lock:
+            self.inserted += inserted
+    
+    def __enter__(self) -> "SignalDbBatchWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+
+def _read_last_signal_timestamp(path: Path) -> Optional[pd.Timestamp]:
+    """
+    Read the latest timestamp from a previously written signal file.
+    
+    Parquet files are memory-mapped and only the timestamp column is read.
+    
+    Args:
+        path: Signal file path (.parquet or .csv)
+        
+    Returns:
+        Optional[pd.Timestamp]: Latest timestamp, or None if the file has none
+    """
+    if path.suffix == ".parquet":
+        table = pq.read_table(path, columns=["timestamp"], memory_map=True)
+        timestamps = table.column("timestamp").to_pandas()
+    else:
+        last_signals = pd.read_csv(path, usecols=lambda c: c == "timestamp")
+        if "timestamp" not in last_signals.columns:
+            return None
+        timestamps = pd.to_datetime(last_signals["timestamp"], infer_datetime_format=True)
+    if timestamps.empty:
+        return None
+    return timestamps.max()
+
+
+def _to_naive_timestamps(values) -> pd.DatetimeIndex:
+    """
+    Convert timestamps that are already datetimes (e.g. from the database) to a
+    timezone-naive DatetimeIndex without going through string format inference.
+    
+    Args:
+        values: Sequence of datetime objects or a datetime64 Series
+        
+    Returns:
+        pd.DatetimeIndex: Timezone-naive timestamps
+    """
+    timestamps = pd.DatetimeIndex(values)
+    if timestamps.tz is not None:
+        timestamps = timestamps.tz_localize(None)
+    return timestamps
+
+
 def generate_ma_signals(
     ticker: str,
     date: Optional[Union[str, datetime]] = None,
@@ -64,7 +705,14 @@ def generate_ma_signals(
     peak_threshold: float = 0.99,
     progress: Optional[Progress] = None,
     task_id: Optional[int] = None,
-    df: Optional[pd.DataFrame] = None
+    df: Optional[pd.DataFrame] = None,
+    output_format: str = "parquet",
+    emit_recent_max: bool = False,
+    need_ohlcv: bool = False,
+    rolling: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    float32: bool = False,
+    batch_writer: Optional["SignalFileBatchWriter"] = None,
+    db_writer: Optional["SignalDbBatchWriter"] = None
 ) -> pd.DataFrame:
     """
     Generate moving average signals from OHLCV data using dynamic confidence thresholds.
@@ -91,15 +739,30 @@ def generate_ma_signals(
         progress (Optional[Progress]): Rich progress bar instance
         task_id (Optional[int]): Task ID for progress tracking
         df (Optional[pd.DataFrame]): Optional DataFrame with price data
+        output_format (str): Signal file format, 'parquet' (default, needs pyarrow)
+            or 'csv'
+        emit_recent_max (bool): Include the rolling peak-window max as a
+            ``recent_max`` output column
+        need_ohlcv (bool): Load and require open/high/low/volume as well as close.
+            Only close is used for the signals; the other columns are passed
+            through to the output when present
+        rolling (Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]): Precomputed
+            (ma_short, ma_long, recent_max) for the rows of ``df``. Ignored if the
+            rows or windows change (incremental runs, short histories)
+        float32 (bool): Compute the moving averages, peak max and confidence in
+            float32 instead of float64. Halves memory traffic, but crossovers
+            and thresholds are then compared at single precision
+        batch_writer (Optional[SignalFileBatchWriter]): Queue the signal files
+            on this writer instead of writing them immediately
+        db_writer (Optional[SignalDbBatchWriter]): Queue the database rows on
+            this writer instead of inserting them immediately
     
     Returns:
         pd.DataFrame: DataFrame containing the generated signals
     """
-    # Only show debug info if we're not using a progress bar
-    if progress is None or task_id is None:
-        console.print(f"\n[yellow]=== Processing {ticker} ===[/yellow]")
-    elif progress is not None and task_id is not None:
+    if progress is not None and task_id is not None:
         progress.update(task_id, description=f"Processing {ticker}")
+    logger.debug("Processing %s", ticker)
     
     # If no DataFrame provided, try to get data from database
     if df is None:
@@ -108,40 +771,26 @@ def generate_ma_signals(
                 progress.update(task_id, description=f"Fetching data for {ticker}")
             
             from core.db.deps import get_db
-            from core.db.crud.tickers_data_db import get_prices_for_ticker
+            from core.db.crud.tickers_data_db import get_close_for_ticker
             
             try:
                 with get_db() as db:
-                    prices = get_prices_for_ticker(db, ticker)
-                    if not prices:
+                    if need_ohlcv:
+                        df = _load_ohlcv_frame(db, ticker)
+                    else:
+                        timestamps, closes = get_close_for_ticker(db, ticker)
+                        df = pd.DataFrame({'timestamp': timestamps, 'close': closes})
+                    
+                    if df.empty:
                         msg = f"No price data found for {ticker} in database"
                         logger.warning(msg)
                         if progress is not None and task_id is not None:
                             progress.print(f"[yellow]{msg}[/yellow]")
                         return pd.DataFrame()
-                        
-                    # Convert to DataFrame
-                    if progress is not None and task_id is not None:
-                        progress.update(task_id, description=f"Processing {ticker} data")
-                    
-                    # Create DataFrame from prices
-                    data = []
-                    for p in prices:
-                        data.append({
-                            'timestamp': p.timestamp,
-                            'open': p.open,
-                            'high': p.high,
-                            'low': p.low,
-                            'close': p.close,
-                            'volume': p.volume,
-                            'ticker': ticker
-                        })
-                    
-                    df = pd.DataFrame(data)
                     
                     # Ensure timestamp is timezone-naive
                     if not df.empty and 'timestamp' in df.columns:
-                        df['timestamp'] = pd.to_datetime(df['timestamp']).dt.tz_localize(None)
+                        df['timestamp'] = _to_naive_timestamps(df['timestamp'])
             
             except Exception as e:
                 error_msg = f"Database error for {ticker}: {str(e)}"
@@ -162,7 +811,9 @@ def generate_ma_signals(
         return pd.DataFrame()
     
     # Ensure we have the required columns
-    required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    required_columns = ['timestamp', 'close']
+    if need_ohlcv:
+        required_columns += ['open', 'high', 'low', 'volume']
     missing_columns = [col for col in required_columns if col not in df.columns]
     if missing_columns:
         error_msg = f"Missing required columns in data for {ticker}: {', '.join(missing_columns)}"
@@ -190,94 +841,43 @@ def generate_ma_signals(
         # Take first 12 characters (YYYYMMDDHHMM) if longer
         date_str = date_str[:12]
     
-    # Only load historical data if no DataFrame was provided
-    if df is None or df.empty:
-        try:
-            from core.db.deps import get_db
-            with get_db() as db:
-                prices = get_prices_for_ticker(db, ticker)
-                if not prices:
-                    logger.error(f"No historical data found for {ticker} in database")
-                    return pd.DataFrame()
-                
-                # Convert to DataFrame
-                data = []
-                for p in prices:
-                    data.append({
-                        'timestamp': p.timestamp,
-                        'open': p.open,
-                        'high': p.high,
-                        'low': p.low,
-                        'close': p.close,
-                        'volume': p.volume,
-                        'ticker': ticker
-                    })
-                
-                df = pd.DataFrame(data)
-                
-                # Ensure timestamp is timezone-naive
-                if not df.empty and 'timestamp' in df.columns:
-                    df['timestamp'] = pd.to_datetime(df['timestamp']).dt.tz_localize(None)
-                    
-        except Exception as e:
-            logger.error(f"Error loading historical data for {ticker}: {str(e)}", exc_info=True)
-            return pd.DataFrame()
-            
-        if df is None or df.empty:
-            logger.error(f"No historical data found for {ticker}")
-            return pd.DataFrame()
-    
-    # Initialize _is_new_data as True for all rows by default
     df = df.copy()  # Create a copy to avoid modifying the input DataFrame
-    df['_is_new_data'] = True
-        
-    # Try to find existing signals to determine which data is new
+    
+    # Find the last signalled timestamp. Indicators still run over the full
+    # history, so the moving averages keep their warm-up; only rows up to
+    # this timestamp are dropped from the output
     signal_dir = Path(get_signal_file_path(ticker, "*", "dynamic")).parent
-    signal_files = list(signal_dir.glob(f"*{ticker}*dynamic*.csv"))
-    latest_signal_file = None
+    signal_files = [
+        f for f in signal_dir.glob(f"*{ticker}*dynamic*")
+        if f.suffix in SIGNAL_FILE_SUFFIXES.values()
+        and (f.suffix != ".parquet" or _HAVE_PYARROW)
+    ]
+    last_signalled = None
     
     if signal_files:
-        latest_signal_file = None
         try:
             # Find the most recent signal file
             latest_signal_file = max(signal_files, key=lambda x: x.stat().st_mtime)
             # Read the last timestamp from the signal file
-            last_signals = pd.read_csv(latest_signal_file)
-            if not last_signals.empty and 'timestamp' in last_signals.columns:
-                last_timestamp = pd.to_datetime(last_signals['timestamp']).max()
-                logger.info(f"Found existing signal file with last timestamp: {last_timestamp}")
-                
-                # Filter data to only include new data points
-                df = df[df['timestamp'] > last_timestamp]
-                
-                if df.empty:
-                    logger.info(f"No new data points since last signal generation for {ticker}")
-                    return pd.DataFrame()
+            last_signalled = _read_last_signal_timestamp(latest_signal_file)
+            has_new_rows = last_signalled is None or (df['timestamp'] > last_signalled).any()
         except Exception as e:
             logger.warning(f"Error reading existing signal file: {str(e)}")
-            # Continue with full data if there's an error reading the file
-            df['_is_new_data'] = True
-        finally:
-            # Ensure we close any open resources here
-            pass
-    
-    # The signal file handling is now done in the first block
-    # No duplicate code needed here
+            # Signal every row if the last timestamp can't be read
+            last_signalled = None
+            has_new_rows = True
         
+        if last_signalled is not None:
+            logger.info(f"Found existing signal file with last timestamp: {last_signalled}")
+        if not has_new_rows:
+            logger.info(f"No new data points since last signal generation for {ticker}")
+            return pd.DataFrame()
+    
     # Adjust window sizes if we don't have enough data
-    if len(df) < long_window * 2:
-        # If we don't have enough data for the default windows, adjust them
-        max_possible_window = max(5, len(df) // 2)  # Ensure at least 5 for short window
-        if max_possible_window < 5:  # If we have very little data, just use what we have
-            logger.warning(f"Very limited data for {ticker} ({len(df)} rows). Using all available data.")
-            short_window = 3
-            long_window = 5
-        else:
-            # Scale down the windows proportionally
-            ratio = max_possible_window / long_window
-            short_window = max(5, int(short_window * ratio))
-            long_window = max(10, int(long_window * ratio))
-            logger.warning(f"Adjusted windows for {ticker} to short={short_window}, long={long_window} based on available data")
+    requested_windows = (short_window, long_window)
+    short_window, long_window = _adjusted_windows(len(df), short_window, long_window)
+    if (short_window, long_window) != requested_windows:
+        logger.warning(f"Adjusted windows for {ticker} to short={short_window}, long={long_window} based on available data")
     
     logger.info(f"Using {len(df)} rows of data for {ticker} with windows: short={short_window}, long={long_window}")
         
@@ -285,7 +885,9 @@ def generate_ma_signals(
     
     # Ensure we have the required columns (case-insensitive)
     df.columns = [col.lower() for col in df.columns]
-    required_columns = ['open', 'high', 'low', 'close', 'volume']
+    required_columns = ['close']
+    if need_ohlcv:
+        required_columns = ['open', 'high', 'low', 'close', 'volume']
     
     for col in required_columns:
         if col not in df.columns:
@@ -298,7 +900,8 @@ def generate_ma_signals(
     # Ensure the index is datetime and sort
     if not isinstance(df.index, pd.DatetimeIndex):
         if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+                df['timestamp'] = pd.to_datetime(df['timestamp'], infer_datetime_format=True)
             df.set_index('timestamp', inplace=True)
         else:
             df.index = pd.to_datetime(df.index)
@@ -316,82 +919,39 @@ def generate_ma_signals(
             progress.update(task_id, description=f"[red]{error_msg}")
         return None
     
-    # Ensure output directory exists (use dynamic path as base)
-    output_dir = Path(get_signal_file_path(ticker, date_str, 'dynamic')).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
     # Debug: Show info about the loaded data
-    if progress is None:
-        console.print(f"[green]Successfully loaded {len(df)} rows of historical data for {ticker}")
-        if not df.empty:
-            console.print(f"Date range: {df.index.min()} to {df.index.max()}")
-            console.print(f"Columns: {', '.join(df.columns)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Loaded %d rows for %s (%s to %s), columns: %s",
+            len(df), ticker, df.index.min(), df.index.max(), ", ".join(df.columns)
+        )
     
     # Ensure we have the required columns
-    required_cols = ['open', 'high', 'low', 'close', 'volume']
+    required_cols = ['open', 'high', 'low', 'close', 'volume'] if need_ohlcv else ['close']
     missing_cols = [col for col in required_cols if col not in df.columns]
     if missing_cols:
-        console.print(f"[red]Missing required columns: {', '.join(missing_cols)}")
+        logger.error(f"Missing required columns for {ticker}: {', '.join(missing_cols)}")
         return None
     
-    # Calculate moving averages and peak detection
-    # If no external progress bar is provided, create a local one
-    if progress is None:
-        with Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=None),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=console,
-            transient=True
-        ) as local_progress:
-            task = local_progress.add_task("Calculating indicators...", total=3)
-            
-            # Calculate short-term moving average
-            df["ma_short"] = df["close"].rolling(window=short_window).mean()
-            local_progress.update(task, advance=1)
-            
-            # Calculate long-term moving average
-            df["ma_long"] = df["close"].rolling(window=long_window).mean()
-            local_progress.update(task, advance=1)
-            
-            # Calculate recent price maximum for peak detection
-            df["recent_max"] = df["close"].rolling(window=peak_window).max()
-            df["is_peak_zone"] = df["close"] >= df["recent_max"] * peak_threshold
-            local_progress.update(task, advance=1)
-    else:
-        # Use the provided external progress bar
-        # Calculate short-term moving average
-        df["ma_short"] = df["close"].rolling(window=short_window).mean()
-        
-        # Calculate long-term moving average
-        df["ma_long"] = df["close"].rolling(window=long_window).mean()
-        
-        # Calculate recent price maximum for peak detection
-        df["recent_max"] = df["close"].rolling(window=peak_window).max()
-        df["is_peak_zone"] = df["close"] >= df["recent_max"] * peak_threshold
+    # Calculate moving averages, peak detection and raw signals on plain arrays
+    close = df["close"].to_numpy(dtype=np.float32 if float32 else np.float64)
+    if rolling is not None and (
+        len(rolling[0]) != len(close)
+        or rolling[0].dtype != close.dtype
+        or (short_window, long_window) != requested_windows
+    ):
+        rolling = None
+    indicators = _generate_ma_signals_arrays(
+        close, short_window, long_window, peak_window, peak_threshold,
+        emit_recent_max=emit_recent_max, rolling=rolling
+    )
     
     # Generate signals
-    console.print("[bold blue]Generating signals with dynamic confidence filtering and peak detection...[/bold blue]")
-    
-    # Calculate raw confidence as normalized absolute distance between MAs
-    df["confidence"] = abs(df["ma_short"] - df["ma_long"]) / df["ma_long"]
-    
-    # Initialize signal column
-    df["signal"] = "STAY"
-    
-    # Apply signal logic
-    mask_buy = (df["ma_short"] > df["ma_long"])
-    mask_sell = (df["ma_short"] < df["ma_long"])
-    
-    # Apply initial signals
-    df.loc[mask_buy, "signal"] = "BUY"
-    df.loc[mask_sell, "signal"] = "SELL"
-    
-    # Handle insufficient data (NaN values in moving averages)
-    mask_insufficient = df["ma_short"].isna() | df["ma_long"].isna() | df["recent_max"].isna()
-    df.loc[mask_insufficient, "signal"] = "STAY"
-    df.loc[mask_insufficient, "confidence"] = 0.0
+    for col in ("ma_short", "ma_long", "recent_max", "is_peak_zone", "confidence"):
+        if col in indicators:
+            df[col] = indicators[col]
+    df["signal"] = pd.Categorical.from_codes(indicators["signal"], dtype=_SIGNAL_DTYPE)
+    mask_insufficient = indicators["insufficient"].copy()
     
     # Apply confidence threshold filter
     df = apply_confidence_filter(
@@ -402,88 +962,75 @@ def generate_ma_signals(
         fallback_threshold=confidence_threshold
     )
     
-    # Create masks for statistics
-    mask_low_confidence = (df['confidence'] < df['threshold_used']) & (df['signal'] != 'STAY')
-    mask_sell_not_peak = (df['signal'] == 'SELL') & ~df['is_peak_zone']
+    # Encode the filtered signals once, then drop SELLs outside the peak zone
+    if df["signal"].dtype == _SIGNAL_DTYPE:
+        # Category codes are the SIGNAL_* codes
+        state = df["signal"].cat.codes.to_numpy(dtype=np.int8, copy=True)
+    else:
+        signal_values = df["signal"].to_numpy()
+        state = np.full(len(df), SIGNAL_STAY, dtype=np.int8)
+        state[signal_values == "BUY"] = SIGNAL_BUY
+        state[signal_values == "SELL"] = SIGNAL_SELL
+    sell_not_peak = (state == SIGNAL_SELL) & ~df["is_peak_zone"].to_numpy(dtype=bool)
+    state *= ~sell_not_peak
 
     # Get the threshold method for logging
     threshold_method = df.get('threshold_method', 'unknown').iloc[0] if not df.empty else 'unknown'
-    console.print(f"[cyan]Using dynamic confidence threshold: {threshold_method}[/cyan]")
+    logger.debug("Using dynamic confidence threshold for %s: %s", ticker, threshold_method)
     
     # Apply peak zone filtering for SELL signals
-    df.loc[mask_sell_not_peak, "signal"] = "STAY"
+    df["signal"] = pd.Categorical.from_codes(state, dtype=_SIGNAL_DTYPE)
     
     # Debug info
-    if progress is None or DEBUG:
-        console.print("[yellow]Confidence statistics (last 5 rows):[/yellow]")
+    if logger.isEnabledFor(logging.DEBUG):
         debug_cols = ["confidence", "threshold_used"]
         if 'conf_mean' in df.columns and 'conf_std' in df.columns:
             debug_cols.extend(["conf_mean", "conf_std"])
-        console.print(df[debug_cols].tail())
+        logger.debug("Confidence statistics for %s (last 5 rows):\n%s", ticker, df[debug_cols].tail())
     
-    # Add reasoning if requested
+    # Record why each row ended up with its signal; the text itself is only
+    # materialized once, when the output columns are assembled
     if include_reasoning:
-        # Initialize reasoning column
-        df["reasoning"] = ""
-        
-        # Add reasoning for BUY signals
-        mask_buy = (df["signal"] == "BUY")
-        df.loc[mask_buy, "reasoning"] = (
-            "BUY: Short MA crossed above Long MA with confidence " +
-            df["confidence"].apply(lambda x: f"{x:.4f}") +
-            " (threshold: " + df["threshold_used"].apply(lambda x: f"{x:.4f}") + ")"
-        )
-        
-        # Add reasoning for SELL signals
-        mask_sell = (df["signal"] == "SELL")
-        df.loc[mask_sell, "reasoning"] = (
-            "SELL: Short MA crossed below Long MA with confidence " +
-            df["confidence"].apply(lambda x: f"{x:.4f}") +
-            " (threshold: " + df["threshold_used"].apply(lambda x: f"{x:.4f}") + 
-            ") and price near recent peak"
-        )
-        
-        # Add reasoning for STAY signals (filtered by confidence)
-        mask_stay_conf = (df["signal"] == "STAY") & ~mask_insufficient & ~mask_sell_not_peak
-        df.loc[mask_stay_conf, "reasoning"] = (
-            "STAY: Confidence too low (" +
-            df["confidence"].apply(lambda x: f"{x:.4f}")
-            + " < " + 
-            df["threshold_used"].apply(lambda x: f"{x:.4f}") + ")"
-        )
-        
-        # Add reasoning for STAY signals (filtered by peak detection)
-        mask_stay_peak = (df["signal"] == "STAY") & mask_sell_not_peak
-        df.loc[mask_stay_peak, "reasoning"] = "STAY: Price not near recent peak"
-        
-        # Add reasoning for insufficient data
-        df.loc[mask_insufficient, "reasoning"] = "STAY: Insufficient data for signal generation"
+        lut_index = mask_insufficient.view(np.int8) << 3
+        lut_index |= sell_not_peak.view(np.int8) << 2
+        lut_index |= state
+        reason_code = _REASON_LUT[lut_index]
     
     # Select columns for output
     columns = [
         "timestamp", "open", "high", "low", "close", "volume",
-        "ma_short", "ma_long", "recent_max", "is_peak_zone",
+        "ma_short", "ma_long", "is_peak_zone",
         "signal", "confidence", "threshold_used"
     ]
+    if emit_recent_max:
+        columns.insert(columns.index("is_peak_zone"), "recent_max")
     
     # Add any additional confidence-related columns that exist
     for col in ["conf_mean", "conf_std", "threshold_method"]:
         if col in df.columns:
             columns.append(col)
     
-    if include_reasoning and "reasoning" in df.columns:
+    if include_reasoning:
+        df["reasoning"] = _materialize_reasoning(
+            reason_code,
+            df["confidence"].to_numpy(),
+            df["threshold_used"].to_numpy()
+        )
         columns.append("reasoning")
         
     # Ensure all required columns exist
-    for col in ["ma_short", "ma_long", "recent_max", "is_peak_zone", "confidence", "threshold_used"]:
+    for col in ["ma_short", "ma_long", "is_peak_zone", "confidence", "threshold_used"]:
         if col not in df.columns:
             df[col] = np.nan
     
+    # Expose the timestamp index as a column so it survives column selection
+    if "timestamp" not in df.columns:
+        df = df.reset_index()
+    
     # Select and reorder columns
     df = df[[col for col in columns if col in df.columns]]
     
-    # Ensure the signal directory exists
-    signal_dir = Path(get_signal_file_path(ticker, date_str, "dynamic")).parent
+    # Ensure the signal directory exists (same directory for every confidence type)
     signal_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate signals with both fixed and dynamic confidence
@@ -533,8 +1080,6 @@ def generate_ma_signals(
                 
                 # Get the appropriate output path
                 conf_output_file = get_signal_file_path(ticker, date_str, conf_type)
-                output_dir = Path(conf_output_file).parent
-                output_dir.mkdir(parents=True, exist_ok=True)
                 
                 # Ensure we have valid signals to process
                 if current_signals is None or current_signals.empty:
@@ -549,73 +1094,77 @@ def generate_ma_signals(
                 # Sort by timestamp to ensure we're getting the latest
                 current_signals = current_signals.sort_values('timestamp')
                 
+                # Rows already in the last signal file are not written again
+                if last_signalled is not None:
+                    current_signals = current_signals[current_signals['timestamp'] > last_signalled]
+                
+                # Persist the signal file used for incremental runs
+                signal_file = _signal_output_path(conf_output_file, output_format)
+                if batch_writer is not None:
+                    batch_writer.write(current_signals, signal_file)
+                else:
+                    _write_signal_file(current_signals, signal_file)
+                
                 # Get the last timestamp from the current data
-                last_timestamp = pd.to_datetime(current_signals['timestamp']).max()
+                last_timestamp = current_signals['timestamp'].max()
                 
                 # Filter for the most recent data points (last 5 minutes)
                 time_threshold = last_timestamp - pd.Timedelta(minutes=5)
-                new_signals = current_signals[pd.to_datetime(current_signals['timestamp']) >= time_threshold]
+                new_signals = current_signals[current_signals['timestamp'] >= time_threshold]
                 
                 if new_signals.empty:
                     continue
                 
-                # Ensure output directory exists
-                output_dir = Path(conf_output_file).parent
-                output_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Prepare signals for insertion
-                signals_to_insert = []
-                for _, row in new_signals.iterrows():
-                    signal_data = {
+                # Prepare signals for insertion, column-wise rather than per row
+                timestamps = pd.DatetimeIndex(new_signals['timestamp']).to_pydatetime()
+                signal_names = new_signals['signal'].astype(str).str.upper().tolist()
+                confidences = new_signals['confidence'].fillna(0.0).astype(float).tolist()
+                reasonings = (
+                    new_signals['reasoning'].astype(str).tolist()
+                    if 'reasoning' in new_signals.columns else [''] * len(new_signals)
+                )
+                signal_type = f'ma_{conf_type}'  # e.g., 'ma_dynamic' or 'ma_fixed'
+                signals_to_insert = [
+                    {
                         'ticker': ticker.upper(),  # Ensure consistent case
-                        'timestamp': row['timestamp'].to_pydatetime() if hasattr(row['timestamp'], 'to_pydatetime') else row['timestamp'],
-                        'signal': str(row['signal']).upper(),  # Ensure uppercase signal
-                        'signal_type': f'ma_{conf_type}',  # e.g., 'ma_dynamic' or 'ma_fixed'
-                        'confidence': float(row.get('confidence', 0.0)),
-                        'reasoning': str(row.get('reasoning', ''))  # Optional field
+                        'timestamp': ts,
+                        'signal': sig,
+                        'signal_type': signal_type,
+                        'confidence': conf,
+                        'reasoning': reason
                     }
-                    # Log the signal being prepared for debugging
-                    logger.debug(f"Preparing signal for {ticker}: {signal_data}")
-                    signals_to_insert.append(signal_data)
+                    for ts, sig, conf, reason in zip(timestamps, signal_names, confidences, reasonings)
+                ]
                 
-                # Insert signals one at a time with error handling
-                from core.db.crud.tickers_signals_db import insert_signal
+                # Insert all signals for this confidence type in one statement
+                from core.db.crud.tickers_signals_db import bulk_insert_signals
                 from core.db.deps import get_db
-                from sqlalchemy.exc import SQLAlchemyError
                 
-                inserted_count = 0
-                try:
-                    # Use context manager for database session
-                    with get_db() as db:
-                        for signal_data in signals_to_insert:
-                            try:
-                                # Insert one signal at a time
-                                insert_signal(db, signal_data)
-                                db.commit()
-                                inserted_count += 1
-                                logger.debug(f"Inserted signal for {ticker} at {signal_data.get('timestamp')}")
-                            except SQLAlchemyError as e:
-                                db.rollback()
-                                error_msg = f"Error inserting signal for {ticker} at {signal_data.get('timestamp')}: {str(e)}"
-                                logger.error(error_msg, exc_info=True)
-                                if progress is not None and task_id is not None:
-                                    progress.print(f"[red]{error_msg}[/red]")
-                except Exception as e:
-                    error_msg = f"Database error for {ticker}: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    if progress is not None and task_id is not None:
-                        progress.print(f"[red]{error_msg}[/red]")
+                if db_writer is not None:
+                    # The writer inserts the rows and reports failures when it flushes
+                    db_writer.add(signals_to_insert)
+                    logger.info(f"Queued {len(signals_to_insert)} signals for {ticker}")
+                else:
+                    inserted_count = 0
+                    try:
+                        with get_db() as db:
+                            inserted_count = bulk_insert_signals(db, signals_to_insert)
+                    except Exception as e:
+                        error_msg = f"Database error for {ticker}: {str(e)}"
+                        logger.error(error_msg, exc_info=True)
+                        if progress is not None and task_id is not None:
+                            progress.print(f"[red]{error_msg}[/red]")
+                    
+                    if inserted_count > 0:
+                        logger.info(f"Successfully inserted {inserted_count} signals for {ticker}")
+                    else:
+                        logger.warning(f"No signals were inserted for {ticker}")
                 
                 # Log the results
                 buy_count = (new_signals["signal"] == "BUY").sum()
                 sell_count = (new_signals["signal"] == "SELL").sum()
                 stay_count = (new_signals["signal"] == "STAY").sum()
                 
-                if inserted_count > 0:
-                    logger.info(f"Successfully inserted {inserted_count} signals for {ticker}")
-                else:
-                    logger.warning(f"No signals were inserted for {ticker}")
-                
                 success_msg = f"✓ Processed {len(new_signals)} {conf_type} signals for {ticker} (BUY: {buy_count}, SELL: {sell_count}, STAY: {stay_count})"
                 logger.info(success_msg)
                 
@@ -641,6 +1190,381 @@ def generate_ma_signals(
         logger.error(f"Error in signal generation for {ticker}: {str(e)}")
         return pd.DataFrame()
 
+def generate_signals_bulk(
+    df: pd.DataFrame,
+    short_window: int = 5,
+    long_window: int = 20,
+    include_reasoning: bool = True,
+    confidence_threshold: float = 0.005,
+    peak_window: int = 12,
+    peak_threshold: float = 0.99
+) -> pd.DataFrame:
+    """
+    Generate moving average signals for many tickers in one pass.
+    
+    All rows are sorted by ticker and timestamp into one flat close array. The
+    rolling windows run per ticker segment, so they never cross a ticker
+    boundary, and the signal decision then runs vectorized over the whole
+    array. Signals use the fixed confidence threshold, as in the ``fixed``
+    signal files written by generate_ma_signals, and tickers with less than
+    two long windows of history get the same scaled-down windows. Nothing is
+    written to disk or the database, which suits back-fills over many tickers.
+    
+    Args:
+        df: Price data with ``ticker``, ``timestamp`` and ``close`` columns
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        include_reasoning: Whether to include reasoning text with signals
+        confidence_threshold: Fixed confidence threshold for BUY/SELL signals
+        peak_window: Window for detecting local price peaks
+        peak_threshold: Threshold for peak detection (0-1)
+        
+    Returns:
+        pd.DataFrame: ticker, timestamp, close, ma_short, ma_long,
+        is_peak_zone, signal, confidence, threshold_used and optionally
+        reasoning, sorted by ticker and timestamp
+    """
+    df = df.sort_values(["ticker", "timestamp"], kind="mergesort")
+    close = df["close"].to_numpy(dtype=np.float64)
+    
+    # Segment offsets: the start of each ticker's rows plus the total length
+    _, inverse = np.unique(df["ticker"].to_numpy(), return_inverse=True)
+    offsets = np.append(np.flatnonzero(np.diff(inverse, prepend=-1)), len(close)).astype(np.int64)
+    
+    def segment_indicators(start: int, end: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        windows = _adjusted_windows(end - start, short_window, long_window)
+        return _rolling_indicators(close[start:end], *windows, peak_window)
+    
+    if HAVE_NUMBA:
+        rolling = batch_compute_indicators(
+            np.ascontiguousarray(close), offsets, short_window, long_window, peak_window
+        )
+        # Short histories are recomputed with their scaled-down windows
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            if end - start < long_window * 2:
+                for out, values in zip(rolling, segment_indicators(start, end)):
+                    out[start:end] = values
+    else:
+        segments = [
+            segment_indicators(start, end) for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+        rolling = tuple(
+            np.concatenate([segment[i] for segment in segments]) if segments else np.empty(0)
+            for i in range(3)
+        )
+    indicators = _generate_ma_signals_arrays(
+        close, short_window, long_window, peak_window, peak_threshold, rolling=rolling
+    )
+    
+    # Fixed confidence filter, then drop SELLs outside the peak zone
+    confidence = indicators["confidence"].copy()
+    is_peak_zone = indicators["is_peak_zone"].copy()
+    state = indicators["signal"].copy()
+    state[confidence < confidence_threshold] = SIGNAL_STAY
+    sell_not_peak = (state == SIGNAL_SELL) & ~is_peak_zone
+    state *= ~sell_not_peak
+    
+    signals = pd.DataFrame({
+        "ticker": df["ticker"].to_numpy(),
+        "timestamp": df["timestamp"].to_numpy(),
+        "close": close,
+        "ma_short": indicators["ma_short"],
+        "ma_long": indicators["ma_long"],
+        "is_peak_zone": is_peak_zone,
+        "signal": pd.Categorical.from_codes(state, dtype=_SIGNAL_DTYPE),
+        "confidence": confidence,
+        "threshold_used": confidence_threshold,
+    })
+    if include_reasoning:
+        lut_index = indicators["insufficient"].view(np.int8) << 3
+        lut_index |= sell_not_peak.view(np.int8) << 2
+        lut_index |= state
+        signals["reasoning"] = _materialize_reasoning(
+            _REASON_LUT[lut_index], confidence, np.full(len(signals), confidence_threshold)
+        )
+    return signals
+
+def tail_dynamic_threshold(
+    confidences: np.ndarray,
+    n_rows: int,
+    window: int = WINDOW_CONF,
+    fallback_threshold: float = 0.005
+) -> float:
+    """
+    Dynamic confidence threshold for the last row, as calculate_dynamic_threshold
+    computes it for that row.
+    
+    Args:
+        confidences: Confidence values ending at the last row (at least the
+            last ``window`` of them)
+        n_rows: Total number of rows the confidences belong to
+        window: Rolling window size for the statistics
+        fallback_threshold: Threshold used during the initial window and when
+            the window's confidences are constant
+        
+    Returns:
+        float: Threshold for the last row
+    """
+    if n_rows - 1 < window:
+        return fallback_threshold
+    values = confidences[-window:]
+    values = values[~np.isnan(values)]
+    if values.size < 2 or values.max() == values.min():
+        return fallback_threshold
+    if USE_QUANTILE:
+        return float(np.quantile(values, QUANTILE_MIN))
+    return float(values.mean() + Z_MIN * values.std(ddof=1))
+
+
+def decide_last_signal(
+    state: int,
+    insufficient: bool,
+    is_peak_zone: bool,
+    confidence: float,
+    confidence_threshold: float,
+    dynamic_threshold: float
+) -> Tuple[str, str]:
+    """
+    Final signal and reasoning for one row of the dynamic signal output.
+    
+    Applies the fixed confidence filter and the peak-zone rule, records the
+    reasoning, then applies the dynamic threshold. As in generate_ma_signals,
+    the dynamic filter does not update the reasoning text.
+    
+    Shared by generate_ma_signal_last and the streaming state of
+    SignalGenerator, so both decide the last row the same way.
+    
+    Args:
+        state: Raw crossover signal code (SIGNAL_STAY when insufficient)
+        insufficient: Whether a window is not yet full
+        is_peak_zone: Whether the close is near the peak-window max
+        confidence: Confidence of the row
+        confidence_threshold: Fixed confidence threshold
+        dynamic_threshold: Dynamic threshold for the row
+        
+    Returns:
+        Tuple[str, str]: (signal, reasoning)
+    """
+    if state != SIGNAL_STAY and confidence < confidence_threshold:
+        state = SIGNAL_STAY
+    sell_not_peak = state == SIGNAL_SELL and not is_peak_zone
+    if sell_not_peak:
+        state = SIGNAL_STAY
+    
+    reason_code = _REASON_LUT[np.array([(insufficient << 3) | (sell_not_peak << 2) | state])]
+    reasoning = _materialize_reasoning(
+        reason_code, np.array([confidence]), np.array([confidence_threshold])
+    )[0]
+    
+    if state != SIGNAL_STAY and confidence < dynamic_threshold:
+        state = SIGNAL_STAY
+    return _SIGNAL_NAMES[state], reasoning
+
+
+def generate_ma_signal_last(
+    df: pd.DataFrame,
+    short_window: int = 5,
+    long_window: int = 20,
+    confidence_threshold: float = 0.005,
+    peak_window: int = 12,
+    peak_threshold: float = 0.99,
+    window: int = WINDOW_CONF
+) -> Optional[Dict[str, Any]]:
+    """
+    Compute only the latest signal generate_ma_signals would return for a frame.
+    
+    The indicators are computed over the last ``window`` rows plus the
+    warm-up the rolling windows need, and the fixed and dynamic thresholds
+    are only evaluated for the last row. Nothing is read from or written to
+    signal files or the database.
+    
+    Args:
+        df: Chronological price data with a ``close`` column
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        confidence_threshold: Fixed confidence threshold (dynamic fallback)
+        peak_window: Window for detecting local price peaks
+        peak_threshold: Threshold for peak detection (0-1)
+        window: Rolling window of the dynamic confidence threshold
+        
+    Returns:
+        Optional[Dict[str, Any]]: ``signal``, ``confidence`` and ``reasoning``
+        of the last row, or None if the frame has fewer than
+        ``2 * long_window`` rows (generate_ma_signals shrinks its windows then)
+    """
+    n = len(df)
+    if n < long_window * 2:
+        return None
+    
+    # The first row of the confidence window needs a full warm-up before it
+    lookback = window + max(short_window, long_window, peak_window) - 1
+    close = df["close"].to_numpy(dtype=np.float64)[-lookback:]
+    indicators = _generate_ma_signals_arrays(
+        close, short_window, long_window, peak_window, peak_threshold
+    )
+    
+    confidence = float(indicators["confidence"][-1])
+    signal, reasoning = decide_last_signal(
+        int(indicators["signal"][-1]),
+        bool(indicators["insufficient"][-1]),
+        bool(indicators["is_peak_zone"][-1]),
+        confidence,
+        confidence_threshold,
+        tail_dynamic_threshold(indicators["confidence"], n, window, confidence_threshold)
+    )
+    return {"signal": signal, "confidence": confidence, "reasoning": reasoning}
+
+def generate_ma_signals_tail(
+    df: pd.DataFrame,
+    n_rows: int,
+    short_window: int = 5,
+    long_window: int = 20,
+    confidence_threshold: float = 0.005,
+    peak_window: int = 12,
+    peak_threshold: float = 0.99,
+    window: int = WINDOW_CONF
+) -> Optional[pd.DataFrame]:
+    """
+    Compute the signals generate_ma_signals would return for the last rows of a frame.
+    
+    The indicators are computed once over the last ``n_rows`` plus the
+    warm-up the rolling windows and the dynamic threshold need, and the
+    fixed and dynamic filters run vectorized over those rows. Each row gets
+    the signal generate_ma_signal_last would return for the frame ending at
+    that row. Nothing is read from or written to signal files or the database.
+    
+    Args:
+        df: Chronological price data with a ``close`` column
+        n_rows: Number of trailing rows to compute signals for
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        confidence_threshold: Fixed confidence threshold (dynamic fallback)
+        peak_window: Window for detecting local price peaks
+        peak_threshold: Threshold for peak detection (0-1)
+        window: Rolling window of the dynamic confidence threshold
+        
+    Returns:
+        Optional[pd.DataFrame]: ``signal``, ``confidence`` and ``reasoning``
+        of the last ``n_rows`` rows, or None if the frame has fewer than
+        ``2 * long_window`` rows (generate_ma_signals shrinks its windows then)
+    """
+    n = len(df)
+    if n < long_window * 2:
+        return None
+    n_rows = min(n_rows, n)
+    
+    # The first row of the first confidence window needs a full warm-up before it
+    lookback = n_rows + window + max(short_window, long_window, peak_window) - 1
+    close = df["close"].to_numpy(dtype=np.float64)[-lookback:]
+    indicators = _generate_ma_signals_arrays(
+        close, short_window, long_window, peak_window, peak_threshold
+    )
+    
+    # Fixed confidence filter, then drop SELLs outside the peak zone
+    confidence = indicators["confidence"][-n_rows:].copy()
+    state = indicators["signal"][-n_rows:].copy()
+    state[confidence < confidence_threshold] = SIGNAL_STAY
+    sell_not_peak = (state == SIGNAL_SELL) & ~indicators["is_peak_zone"][-n_rows:]
+    state *= ~sell_not_peak
+    
+    lut_index = indicators["insufficient"][-n_rows:].view(np.int8) << 3
+    lut_index |= sell_not_peak.view(np.int8) << 2
+    lut_index |= state
+    reasoning = _materialize_reasoning(
+        _REASON_LUT[lut_index], confidence, np.full(n_rows, confidence_threshold)
+    )
+    
+    # The dynamic threshold falls back to the fixed one for the first
+    # ``window`` rows of the whole frame, so index the confidences by position
+    thresholds, _ = calculate_dynamic_threshold(
+        pd.Series(indicators["confidence"], index=np.arange(n - len(close), n)),
+        window=window,
+        fallback_threshold=confidence_threshold
+    )
+    state[confidence < thresholds.to_numpy()[-n_rows:]] = SIGNAL_STAY
+    
+    return pd.DataFrame({
+        "signal": _SIGNAL_NAMES[state],
+        "confidence": confidence,
+        "reasoning": reasoning,
+    })
+
+def _load_ohlcv_frame(db, ticker: str) -> pd.DataFrame:
+    """
+    Load full OHLCV rows for a ticker from the database into a DataFrame.
+    
+    Args:
+        db: Database session
+        ticker: Ticker symbol
+        
+    Returns:
+        pd.DataFrame: OHLCV data, empty if no valid rows were found
+    """
+    from core.db.crud import get_prices_for_ticker
+    
+    price_dicts = []
+    for p in get_prices_for_ticker(db, ticker):
+        try:
+            price_dicts.append({
+                'timestamp': p.timestamp,
+                'open': float(p.open) if p.open is not None else None,
+                'high': float(p.high) if p.high is not None else None,
+                'low': float(p.low) if p.low is not None else None,
+                'close': float(p.close) if p.close is not None else None,
+                'volume': int(p.volume) if p.volume is not None else 0
+            })
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Skipping invalid price data for {ticker}: {str(e)}")
+            continue
+    return pd.DataFrame(price_dicts)
+
+
+def _count_ticker_signals(
+    ticker: str,
+    df: pd.DataFrame,
+    rolling: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    signal_kwargs: Dict[str, Any]
+) -> int:
+    """
+    Generate signals for one ticker and return the signal count.
+    
+    Module-level so generate_all_ma_signals can run it in worker processes.
+    
+    Args:
+        ticker: Ticker symbol
+        df: Price data for the ticker
+        rolling: Precomputed (ma_short, ma_long, recent_max), or None
+        signal_kwargs: Remaining keyword arguments for generate_ma_signals
+        
+    Returns:
+        int: Number of signals generated
+    """
+    signals = generate_ma_signals(ticker=ticker, df=df, rolling=rolling, **signal_kwargs)
+    # None when there were too few rows for the long window
+    if signals is None or 'signal' not in signals.columns:
+        return 0
+    # Count the number of signals (non-NaN signal values)
+    return int(signals['signal'].notna().sum())
+
+
+def count_ma_signals(ticker: str, df: Optional[pd.DataFrame] = None, **signal_kwargs) -> int:
+    """
+    Generate moving average signals for one ticker and return how many there are.
+    
+    Module-level and free of shared state, so it can be submitted to thread
+    or process pools.
+    
+    Args:
+        ticker: Ticker symbol
+        df: Price data for the ticker; loaded from the database when omitted
+        **signal_kwargs: Keyword arguments passed to generate_ma_signals
+        
+    Returns:
+        int: Number of signals generated
+    """
+    return _count_ticker_signals(ticker, df, None, signal_kwargs)
+
+
 def generate_all_ma_signals(
     date: Optional[Union[str, datetime]] = None,
     short_window: int = 5,
@@ -650,7 +1574,13 @@ def generate_all_ma_signals(
     peak_window: int = 12,
     peak_threshold: float = 0.99,
     progress: Optional[Progress] = None,
-    task_id: Optional[int] = None
+    task_id: Optional[int] = None,
+    need_ohlcv: bool = False,
+    max_workers: int = MAX_WORKERS,
+    float32: bool = False,
+    batch_writer: Optional[SignalFileBatchWriter] = None,
+    db_writer: Optional[SignalDbBatchWriter] = None,
+    use_processes: bool = False
 ) -> Dict[str, int]:
     """
     Generate moving average signals for all tickers with dynamic confidence thresholds.
@@ -670,6 +1600,19 @@ def generate_all_ma_signals(
         peak_threshold: Threshold for peak detection (0-1, default: 0.99).
         progress: Rich Progress object for tracking progress (optional).
         task_id: Task ID for the progress bar (optional).
+        need_ohlcv: Load open/high/low/volume as well as close (default: False).
+                    Only close is needed for the signals themselves.
+        max_workers: Number of worker threads generating signals (default: MAX_WORKERS).
+        float32: Compute indicators in float32 instead of float64 (default: False).
+        batch_writer: Queue signal files on this writer instead of writing each
+                      one as it is generated (optional). Ignored with use_processes.
+        db_writer: Queue database rows on this writer instead of inserting each
+                   ticker's signals separately (optional). Ignored with use_processes.
+        use_processes: Generate signals in max_workers spawned processes instead of
+                       threads (default: False). Sidesteps the GIL for the pandas
+                       parts of signal generation, at the cost of process start-up
+                       and pickling each ticker's data; worth it for large ticker
+                       sets on multi-core machines.
         
     Returns:
         Dictionary mapping ticker symbols to the number of signals generated.
@@ -681,8 +1624,9 @@ def generate_all_ma_signals(
     """
     from rich.console import Console
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    from rich.table import Table
     from core.db.deps import get_db
-    from core.db.crud import get_prices_for_ticker
+    from core.db.crud import get_close_for_ticker
     
     console = Console()
     
@@ -694,7 +1638,8 @@ def generate_all_ma_signals(
     else:
         date_str = str(date)
     
-    tickers = load_tickers()
+    tickers = get_all_tickers()
+    n_tickers = len(tickers)
     results = {}
     
     # Set up progress bar if not provided
@@ -709,95 +1654,135 @@ def generate_all_ma_signals(
             TaskProgressColumn(),
             console=console
         )
-        task = progress_bar.add_task("Generating signals...", total=len(tickers))
+        task = progress_bar.add_task("Generating signals...", total=n_tickers)
         progress_bar.start()
     
+    # Resolve progress/print callables once instead of checking on every ticker
+    has_progress = progress_bar is not None and task is not None
+    update = progress_bar.update if has_progress else lambda *args, **kwargs: None
+    printer = progress_bar.print if progress_bar is not None else console.print
+    
     # Initialize counters and trackers
     success_count = 0
     failed_tickers = []
+    successes: List[Tuple[str, int]] = []
     total_signals = 0
+    reported = 0  # Tickers already advanced on the progress bar
+    
+    # Load price data for all tickers up front
+    frames: Dict[str, pd.DataFrame] = {}
+    with get_db() as db:
+        for ticker in tickers:
+            try:
+                if need_ohlcv:
+                    frames[ticker] = _load_ohlcv_frame(db, ticker)
+                else:
+                    timestamps, closes = get_close_for_ticker(db, ticker)
+                    frames[ticker] = pd.DataFrame({'timestamp': timestamps, 'close': closes})
+            except Exception as e:
+                printer(f"✗ Error loading {ticker}: {str(e)}")
+    
+    # With Numba, compute every ticker's rolling indicators in one parallel call
+    rolling_by_ticker: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    if HAVE_NUMBA:
+        batch_tickers = [
+            t for t, frame in frames.items()
+            if not frame.empty and frame['timestamp'].is_monotonic_increasing
+        ]
+        batch_rolling = _batch_rolling_indicators(
+            [frames[t]['close'].to_numpy() for t in batch_tickers],
+            short_window, long_window, peak_window,
+            dtype=np.float32 if float32 else np.float64
+        )
+        rolling_by_ticker = dict(zip(batch_tickers, batch_rolling))
+    
+    signal_kwargs = dict(
+        date=date_str,
+        short_window=short_window,
+        long_window=long_window,
+        include_reasoning=include_reasoning,
+        confidence_threshold=confidence_threshold,
+        peak_window=peak_window,
+        peak_threshold=peak_threshold,
+        need_ohlcv=need_ohlcv,
+        float32=float32
+    )
+    if use_processes:
+        # Each process writes its own files and rows; the progress bar and
+        # the batch writers stay in this process
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    else:
+        # Workers never touch the shared progress task; passing the bar
+        # without a task id just stops generate_ma_signals from creating
+        # its own live display
+        signal_kwargs.update(
+            progress=progress_bar, task_id=None,
+            batch_writer=batch_writer, db_writer=db_writer
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers)
     
     try:
-        for i, ticker in enumerate(tickers):
-            if progress_bar is not None and task is not None:
-                progress_bar.update(task, description=f"Processing {ticker}")
+        with executor:
+            futures = {}
+            for ticker in tickers:
+                df = frames.get(ticker)
+                if df is None or df.empty:
+                    logger.warning(f"No price data available for {ticker} in database")
+                    results[ticker] = 0
+                    failed_tickers.append(ticker)
+                    continue
+                futures[executor.submit(
+                    _count_ticker_signals, ticker, df, rolling_by_ticker.get(ticker), signal_kwargs
+                )] = ticker
             
-            try:
-                # Get price data from database
-                with get_db() as db:
-                    prices = get_prices_for_ticker(db, ticker)
-                    if not prices:
-                        logger.warning(f"No price data available for {ticker} in database")
-                        results[ticker] = 0
-                        failed_tickers.append(ticker)
-                        continue
-                        
-                    # Convert to DataFrame for signal generation
-                    price_dicts = []
-                    for p in prices:
-                        try:
-                            price_dicts.append({
-                                'timestamp': p.timestamp,
-                                'open': float(p.open) if p.open is not None else None,
-                                'high': float(p.high) if p.high is not None else None,
-                                'low': float(p.low) if p.low is not None else None,
-                                'close': float(p.close) if p.close is not None else None,
-                                'volume': int(p.volume) if p.volume is not None else 0
-                            })
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"Skipping invalid price data for {ticker}: {str(e)}")
-                            continue
-                    
-                    if not price_dicts:
-                        logger.warning(f"No valid price data found for {ticker}")
-                        results[ticker] = 0
-                        failed_tickers.append(ticker)
-                        continue
-                        
-                    df = pd.DataFrame(price_dicts)
-                    
-                    # Generate signals - this will automatically save to database
-                    signals = generate_ma_signals(
-                        ticker=ticker,
-                        date=date_str,
-                        short_window=short_window,
-                        long_window=long_window,
-                        include_reasoning=include_reasoning,
-                        confidence_threshold=confidence_threshold,
-                        peak_window=peak_window,
-                        peak_threshold=peak_threshold,
-                        progress=progress_bar,
-                        task_id=task,
-                        df=df  # Pass the DataFrame directly
-                    )
-                    
-                    # Count the number of signals (non-NaN signal values)
-                    signal_count = signals['signal'].notna().sum()
+            # Tickers without data count as done straight away
+            done = n_tickers - len(futures)
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    signal_count = future.result()
                     results[ticker] = signal_count
                     total_signals += signal_count
                     success_count += 1
-                    
-                    if progress_bar is not None and task is not None:
-                        progress_bar.print(f"✓ {ticker}: Generated {signal_count} signals")
-                    
-            except Exception as e:
-                error_msg = f"✗ Error processing {ticker}: {str(e)}"
-                if progress_bar is not None:
-                    progress_bar.print(error_msg)
-                else:
-                    console.print(error_msg)
-                results[ticker] = 0
-                failed_tickers.append(ticker)
-            
-            # Update progress
-            if progress_bar is not None and task is not None:
-                progress_bar.update(task, advance=1)
+                    successes.append((ticker, signal_count))
+                except Exception as e:
+                    printer(f"✗ Error processing {ticker}: {str(e)}")
+                    results[ticker] = 0
+                    failed_tickers.append(ticker)
+                
+                # Refresh the progress bar in batches rather than once per ticker
+                done += 1
+                if done - reported >= PROGRESS_UPDATE_EVERY:
+                    update(
+                        task,
+                        advance=done - reported,
+                        description=f"Processed {ticker} ({done}/{n_tickers})"
+                    )
+                    reported = done
+        
+        update(task, advance=n_tickers - reported)
+        
+        # Report in ticker order regardless of completion order
+        order = {ticker: i for i, ticker in enumerate(tickers)}
+        successes.sort(key=lambda item: order[item[0]])
+        results = {ticker: results[ticker] for ticker in tickers if ticker in results}
     
     finally:
         # Only stop the progress bar if we created it
         if progress is None and progress_bar is not None:
             progress_bar.stop()
     
+    # Print per-ticker results in one table
+    if successes:
+        table = Table(title="Generated Signals")
+        table.add_column("Ticker", style="cyan")
+        table.add_column("Signals", justify="right", style="green")
+        for ticker, signal_count in successes:
+            table.add_row(ticker, str(signal_count))
+        console.print(table)
+    
     # Print summary
     console.print("\n[bold]Signal Generation Summary:[/bold]")
     console.print(f"[green]✓ Successfully processed: {success_count} tickers")
@@ -0,0 +1,149 @@
+"""
+Polars implementation of the moving average signal calculation.
+
+generate_ma_signals_polars computes the same indicators, signals and
+reasoning as generate_ma_signals with a fixed confidence threshold, but as one
+lazy Polars query: the rolling windows and the signal decision run in Polars'
+native kernels and the frame is collected once. It does no file or database
+IO, which makes it suited to analysis scripts that only need the signals.
+"""
+from typing import Union
+
+import numpy as np
+
+# Optional Polars support
+try:
+    import polars as pl
+    _HAVE_POLARS = True
+except ImportError:
+    _HAVE_POLARS = False
+
+from .moving_average import (
+    SIGNAL_STAY,
+    SIGNAL_BUY,
+    SIGNAL_SELL,
+    REASON_BUY,
+    REASON_SELL,
+    REASON_LOW_CONFIDENCE,
+    REASON_NOT_PEAK,
+    REASON_INSUFFICIENT,
+    _SIGNAL_NAMES,
+    _materialize_reasoning,
+)
+
+
+def generate_ma_signals_polars(
+    df: Union["pl.DataFrame", "pl.LazyFrame"],
+    short_window: int = 5,
+    long_window: int = 20,
+    include_reasoning: bool = True,
+    confidence_threshold: float = 0.005,
+    peak_window: int = 12,
+    peak_threshold: float = 0.99
+) -> "pl.DataFrame":
+    """
+    Generate moving average signals from a Polars frame of close prices.
+
+    Args:
+        df: Polars DataFrame or LazyFrame with ``timestamp`` and ``close`` columns
+        short_window: Short-term moving average window
+        long_window: Long-term moving average window
+        include_reasoning: Whether to include reasoning text with signals
+        confidence_threshold: Fixed confidence threshold for BUY/SELL signals
+        peak_window: Window for detecting local price peaks
+        peak_threshold: Threshold for peak detection (0-1)
+
+    Returns:
+        pl.DataFrame: timestamp, close, ma_short, ma_long, is_peak_zone, signal,
+        confidence, threshold_used and optionally reasoning, sorted by timestamp.
+        Use ``.to_pandas()`` at the boundary if a pandas frame is needed
+
+    Raises:
+        ImportError: If Polars is not installed
+    """
+    if not _HAVE_POLARS:
+        raise ImportError("generate_ma_signals_polars requires polars (pip install polars)")
+
+    # NaN closes become nulls, so a window holding one has no value, as in
+    # the pandas-compatible kernels of generate_ma_signals
+    close = pl.col("close").cast(pl.Float64).fill_nan(None)
+    ma_short = pl.col("ma_short")
+    ma_long = pl.col("ma_long")
+    insufficient = pl.col("_insufficient")
+
+    lazy = (
+        df.lazy()
+        .select(["timestamp", "close"])
+        .sort("timestamp")
+        .with_columns(
+            close.rolling_mean(short_window).alias("ma_short"),
+            close.rolling_mean(long_window).alias("ma_long"),
+            close.rolling_max(peak_window).alias("_recent_max"),
+        )
+        .with_columns(
+            (
+                ma_short.is_null() | ma_long.is_null() | pl.col("_recent_max").is_null()
+            ).alias("_insufficient"),
+            (pl.col("close") >= pl.col("_recent_max") * peak_threshold)
+            .fill_null(False)
+            .alias("is_peak_zone"),
+        )
+        .with_columns(
+            pl.when(insufficient)
+            .then(0.0)
+            .otherwise((ma_short - ma_long).abs() / ma_long)
+            .alias("confidence"),
+        )
+        .with_columns(
+            # Raw crossover state, downgraded to STAY below the threshold
+            pl.when(insufficient | (pl.col("confidence") < confidence_threshold))
+            .then(SIGNAL_STAY)
+            .when(ma_short > ma_long)
+            .then(SIGNAL_BUY)
+            .when(ma_short < ma_long)
+            .then(SIGNAL_SELL)
+            .otherwise(SIGNAL_STAY)
+            .cast(pl.Int8)
+            .alias("_state"),
+        )
+        .with_columns(
+            # SELL signals only count in the peak zone
+            ((pl.col("_state") == SIGNAL_SELL) & ~pl.col("is_peak_zone")).alias("_sell_not_peak"),
+        )
+        .with_columns(
+            pl.when(pl.col("_sell_not_peak"))
+            .then(SIGNAL_STAY)
+            .otherwise(pl.col("_state"))
+            .cast(pl.Int8)
+            .alias("_state"),
+            pl.when(insufficient)
+            .then(REASON_INSUFFICIENT)
+            .when(pl.col("_sell_not_peak"))
+            .then(REASON_NOT_PEAK)
+            .when(pl.col("_state") == SIGNAL_BUY)
+            .then(REASON_BUY)
+            .when(pl.col("_state") == SIGNAL_SELL)
+            .then(REASON_SELL)
+            .otherwise(REASON_LOW_CONFIDENCE)
+            .cast(pl.Int8)
+            .alias("_reason"),
+            pl.lit(confidence_threshold, dtype=pl.Float64).alias("threshold_used"),
+        )
+    )
+
+    result = lazy.collect()
+
+    state = result["_state"].to_numpy()
+    signals = pl.Series("signal", _SIGNAL_NAMES[state].tolist(), dtype=pl.Categorical)
+    columns = [
+        result["timestamp"], result["close"], result["ma_short"], result["ma_long"],
+        result["is_peak_zone"], signals, result["confidence"], result["threshold_used"],
+    ]
+    if include_reasoning:
+        reasoning = _materialize_reasoning(
+            result["_reason"].to_numpy(),
+            result["confidence"].to_numpy(),
+            np.full(len(result), confidence_threshold)
+        )
+        columns.append(pl.Series("reasoning", reasoning.tolist(), dtype=pl.Utf8))
+    return pl.DataFrame(columns)
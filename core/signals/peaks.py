@@ -0,0 +1,34 @@
+"""
+Peak detection helpers for moving average signals.
+
+The peak zone compares each close with the highest close of the last
+``peak_window`` bars. rolling_max computes that maximum in O(n) with the
+monotonic-deque kernel when Numba is installed, and with a vectorized
+sliding-window max otherwise (O(n * w), but without a Python loop).
+"""
+import numpy as np
+
+from ._ma_kernels import HAVE_NUMBA, rolling_max_deque
+
+__all__ = ["rolling_max", "rolling_max_deque"]
+
+
+def rolling_max(x: np.ndarray, w: int) -> np.ndarray:
+    """
+    Rolling max matching pandas ``rolling(w).max()``.
+
+    Args:
+        x: Input values
+        w: Window size
+
+    Returns:
+        np.ndarray: Rolling maxima, NaN where the window is not full or has NaNs
+    """
+    if HAVE_NUMBA:
+        return rolling_max_deque(np.ascontiguousarray(x), w)
+    out = np.full(x.shape[0], np.nan, dtype=x.dtype)
+    if x.shape[0] >= w:
+        # np.max propagates NaN, like pandas with min_periods=w
+        out[w - 1:] = np.lib.stride_tricks.sliding_window_view(x, w).max(axis=1)
+    return out
+
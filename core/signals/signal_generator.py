@@ -4,22 +4,310 @@ Signal Generator Module
 This module provides functionality to generate trading signals from a single data point
 by retrieving historical data and applying signal generation logic.
 """
-from typing import Dict, Optional, List
+import threading
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.orm import Session
 
 from core.db.deps import get_db
 from core.db.models.tickers_data import TickersData
 from core.db.models.tickers_signals import TickersSignals
 from core.db.crud.tickers_data_db import get_prices_for_ticker
-from core.db.crud.tickers_signals_db import insert_signal, get_latest_signal
-from core.signals.moving_average import generate_ma_signals
+from core.db.crud.tickers_signals_db import (
+    insert_signal_if_absent,
+    bulk_insert_signals,
+    get_latest_signal,
+)
+from core.config.constants import WINDOW_CONF
+from core.signals.moving_average import (
+    generate_ma_signal_last,
+    generate_ma_signals_tail,
+    SIGNAL_STAY,
+    SIGNAL_BUY,
+    SIGNAL_SELL,
+    decide_last_signal,
+    tail_dynamic_threshold,
+)
 import logging
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Columns of the historical price frame (timestamp becomes the index)
+HISTORICAL_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'ticker']
+
+# Default long moving-average window of the MA signals
+LONG_WINDOW = 20
+
+# Number of recent rows used as history for a new data point: the dynamic
+# confidence window plus the warm-up of the long moving average
+HISTORY_LIMIT = WINDOW_CONF + LONG_WINDOW - 1
+
+
+def _recent_prices_stmt(ticker: str, limit: int):
+    """
+    Build the statement selecting a ticker's most recent prices.
+    
+    The lambda statement is compiled once and cached by SQLAlchemy; ticker and
+    limit are bound as parameters on each call.
+    
+    Args:
+        ticker: Ticker symbol (upper case)
+        limit: Maximum number of rows
+        
+    Returns:
+        StatementLambdaElement: Select of HISTORICAL_COLUMNS, newest first
+    """
+    return lambda_stmt(
+        lambda: select(
+            TickersData.timestamp,
+            TickersData.open,
+            TickersData.high,
+            TickersData.low,
+            TickersData.close,
+            TickersData.volume,
+            TickersData.ticker
+        )
+        .where(TickersData.ticker == ticker)
+        .order_by(TickersData.timestamp.desc())
+        .limit(limit)
+    )
+
+
+def _bar_interval(timestamps: pd.Series) -> Optional[pd.Timedelta]:
+    """
+    Infer the bar interval of a price series.
+    
+    The most common positive spacing is used, so session breaks and the odd
+    missing bar don't skew it.
+    
+    Args:
+        timestamps: Chronological timestamps
+        
+    Returns:
+        Optional[pd.Timedelta]: Bar interval, or None with fewer than two bars
+    """
+    diffs = timestamps.diff()
+    diffs = diffs[diffs > pd.Timedelta(0)]
+    if diffs.empty:
+        return None
+    return diffs.mode().iat[0]
+
+
+def _naive_datetime(timestamp) -> datetime:
+    """
+    Convert a timestamp to a timezone-naive datetime in its own wall-clock time.
+    
+    Args:
+        timestamp: datetime, pd.Timestamp or ISO format string
+        
+    Returns:
+        datetime: The timestamp without its timezone
+    """
+    return pd.Timestamp(timestamp).to_pydatetime().replace(tzinfo=None)
+
+
+class _StreamingMA:
+    """
+    Running moving-average state for one ticker.
+    
+    Keeps the short and long window sums and a monotonic deque for the
+    peak-window max, so each new close is folded in with O(1) amortized work
+    instead of recomputing the windows over the whole history. Like the batch
+    kernels, NaN closes are left out of the sums and a window holding one
+    yields NaN until the NaN drops out. The sums are rebuilt from the window
+    every RESUM_EVERY closes so rounding errors don't accumulate.
+    """
+    
+    # Number of updates between two exact re-sums of the windows
+    RESUM_EVERY = 1024
+    
+    def __init__(
+        self,
+        short_window: int = 5,
+        long_window: int = 20,
+        peak_window: int = 12,
+        peak_threshold: float = 0.99,
+        confidence_threshold: float = 0.005
+    ):
+        """
+        Initialize empty state; the defaults match generate_ma_signals.
+        
+        Args:
+            short_window: Short-term moving average window
+            long_window: Long-term moving average window
+            peak_window: Window for detecting local price peaks
+            peak_threshold: Threshold for peak detection (0-1)
+            confidence_threshold: Minimum confidence for BUY/SELL signals
+        """
+        self.short_window = short_window
+        self.long_window = long_window
+        self.peak_window = peak_window
+        self.peak_threshold = peak_threshold
+        self.confidence_threshold = confidence_threshold
+        self.closes = deque(maxlen=long_window + 1)
+        self.confidences = deque(maxlen=WINDOW_CONF)
+        self.peak = deque()
+        # Positions of the NaN closes still inside one of the windows
+        self.nans = deque()
+        self.sum_short = 0.0
+        self.sum_long = 0.0
+        self.count = 0
+        self.last_timestamp = None
+        # Spacing of consecutive bars, set when the state is seeded
+        self.interval: Optional[pd.Timedelta] = None
+    
+    def update(self, timestamp: pd.Timestamp, close: float) -> Tuple[float, float, float, float]:
+        """
+        Add one close and return the current indicator values.
+        
+        Args:
+            timestamp: Timestamp of the close (timezone-naive)
+            close: Close price
+            
+        Returns:
+            Tuple[float, float, float, float]: (ma_short, ma_long, recent_max,
+            confidence); the windows are NaN while not yet full
+        """
+        i = self.count
+        is_nan = np.isnan(close)
+        self.closes.append(close)
+        if is_nan:
+            self.nans.append(i)
+        else:
+            self.sum_short += close
+            self.sum_long += close
+        if i >= self.short_window:
+            old = self.closes[-self.short_window - 1]
+            if not np.isnan(old):
+                self.sum_short -= old
+        if i >= self.long_window:
+            old = self.closes[-self.long_window - 1]
+            if not np.isnan(old):
+                self.sum_long -= old
+        if (i + 1) % self.RESUM_EVERY == 0:
+            self._resum()
+        
+        while self.nans and self.nans[0] <= i - max(self.short_window, self.long_window, self.peak_window):
+            self.nans.popleft()
+        while self.peak and self.peak[0][0] <= i - self.peak_window:
+            self.peak.popleft()
+        if not is_nan:
+            while self.peak and self.peak[-1][1] <= close:
+                self.peak.pop()
+            self.peak.append((i, close))
+        
+        self.count = i + 1
+        self.last_timestamp = timestamp
+        
+        ma_short = self.sum_short / self.short_window if self._full(i, self.short_window) else np.nan
+        ma_long = self.sum_long / self.long_window if self._full(i, self.long_window) else np.nan
+        recent_max = self.peak[0][1] if self._full(i, self.peak_window) else np.nan
+        
+        # Confidence is the normalized distance between the MAs, 0 while a
+        # window is not yet full
+        if np.isnan(ma_short) or np.isnan(ma_long) or np.isnan(recent_max):
+            confidence = 0.0
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                confidence = float(np.float64(abs(ma_short - ma_long)) / ma_long)
+        self.confidences.append(confidence)
+        return ma_short, ma_long, recent_max, confidence
+    
+    def _full(self, i: int, w: int) -> bool:
+        """
+        Check whether the window of size ``w`` ending at position ``i`` is
+        full and free of NaN closes.
+        
+        Args:
+            i: Position of the latest close
+            w: Window size
+            
+        Returns:
+            bool: True if the window's aggregate is defined
+        """
+        return i >= w - 1 and not any(j > i - w for j in self.nans)
+    
+    def _resum(self) -> None:
+        """Recompute both window sums exactly from the closes they cover."""
+        closes = np.fromiter(self.closes, dtype=np.float64, count=len(self.closes))
+        self.sum_short = float(np.nansum(closes[-self.short_window:]))
+        self.sum_long = float(np.nansum(closes[-self.long_window:]))
+    
+    def signal(
+        self, close: float, ma_short: float, ma_long: float, recent_max: float, confidence: float
+    ) -> Tuple[str, str]:
+        """
+        Derive the signal for the latest close, as generate_ma_signals would.
+        
+        Args:
+            close: Latest close price
+            ma_short: Short moving average at that close
+            ma_long: Long moving average at that close
+            recent_max: Peak-window max at that close
+            confidence: Confidence at that close
+            
+        Returns:
+            Tuple[str, str]: (signal, reasoning)
+        """
+        insufficient = bool(np.isnan(ma_short) or np.isnan(ma_long) or np.isnan(recent_max))
+        if insufficient:
+            state = SIGNAL_STAY
+        else:
+            state = SIGNAL_BUY if ma_short > ma_long else SIGNAL_SELL if ma_short < ma_long else SIGNAL_STAY
+        
+        # The dynamic signals returned by generate_ma_signals are filtered once
+        # more against a rolling threshold over the last WINDOW_CONF confidences
+        confidences = np.fromiter(self.confidences, dtype=np.float64, count=len(self.confidences))
+        return decide_last_signal(
+            state,
+            insufficient,
+            bool(close >= recent_max * self.peak_threshold),
+            confidence,
+            self.confidence_threshold,
+            tail_dynamic_threshold(confidences, self.count, WINDOW_CONF, self.confidence_threshold)
+        )
+
+class _TickerStateStore:
+    """
+    Streaming state of many tickers.
+    
+    A store can be shared by generators running on different threads. Each
+    ticker has its own lock, which a generator holds while it processes a
+    point for that ticker, so a ticker's ticks are applied one at a time and
+    in the order they acquire it, whichever thread they arrive on.
+    """
+    
+    def __init__(self):
+        """Initialize an empty store."""
+        # Streaming moving-average state per ticker, seeded from history
+        self.ma: Dict[str, _StreamingMA] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+    
+    def lock(self, ticker: str) -> threading.RLock:
+        """
+        Return the lock guarding a ticker's state.
+        
+        Args:
+            ticker: Ticker symbol
+            
+        Returns:
+            threading.RLock: The ticker's lock, created on first use
+        """
+        lock = self._locks.get(ticker)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(ticker, threading.RLock())
+        return lock
+
+
 class SignalGenerator:
     """
     Handles the generation of trading signals from price data.
@@ -28,18 +316,21 @@ class SignalGenerator:
     price data and historical context from the database.
     """
     
-    def __init__(self, db_session: Optional[Session] = None):
+    def __init__(self, db_session: Optional[Session] = None, state_store: Optional[_TickerStateStore] = None):
         """
         Initialize the SignalGenerator.
         
         Args:
             db_session: Optional database session. If not provided, one will be created when needed.
+            state_store: Optional per-ticker state shared with other generators.
+                If not provided, the generator keeps its own.
         """
         self.db_session = db_session
         self.owns_session = db_session is None
         self.use_context_manager = db_session is None
+        self._state = state_store if state_store is not None else _TickerStateStore()
         
-    def get_historical_data(self, ticker: str, limit: int = 150) -> pd.DataFrame:
+    def get_historical_data(self, ticker: str, limit: int = HISTORY_LIMIT) -> pd.DataFrame:
         """
         Get historical data for a ticker from the database.
         
@@ -51,8 +342,8 @@ class SignalGenerator:
             DataFrame with historical price data
         """
         try:
-            # If we have a session and it's not closed, use it
-            if self.db_session is not None and not self.db_session.bind.pool.checkedout():
+            # Reuse the provided session
+            if self.db_session is not None:
                 return self._get_historical_data_with_session(self.db_session, ticker, limit)
             
             # Otherwise, create a new session
@@ -61,8 +352,8 @@ class SignalGenerator:
                 
         except Exception as e:
             logger.error(f"Error in get_historical_data for {ticker}: {str(e)}", exc_info=True)
-            return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume', 'ticker'])
-                    
+            return pd.DataFrame(columns=HISTORICAL_COLUMNS)
+    
     def _get_historical_data_with_session(self, db: Session, ticker: str, limit: int) -> pd.DataFrame:
         """
         Get historical data for a ticker using the provided database session.
@@ -76,43 +367,28 @@ class SignalGenerator:
             DataFrame with historical price data, indexed by timestamp
         """
         try:
-            # Get all prices for the ticker (ordered by timestamp desc)
-            prices = (
-                db.query(TickersData)
-                .filter(TickersData.ticker == ticker.upper())
-                .order_by(TickersData.timestamp.desc())
-                .all()
-            )
+            # Get the most recent prices for the ticker (ordered by timestamp desc)
+            # as plain row tuples, bypassing the ORM and its identity map
+            prices = db.execute(_recent_prices_stmt(ticker.upper(), limit)).all()
             
             if not prices:
                 logger.warning(f"No price data found for {ticker}")
-                return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume', 'ticker'])
-                
-            # Apply limit in memory
-            prices = prices[:limit]
-            
-            # Convert to DataFrame with ticker included
-            data = []
-            for price in prices:
-                # Convert timestamp to timezone-naive
-                timestamp = pd.to_datetime(price.timestamp).tz_localize(None)
-                
-                data.append({
-                    'timestamp': timestamp,
-                    'open': price.open,
-                    'high': price.high,
-                    'low': price.low,
-                    'close': price.close,
-                    'volume': price.volume,
-                    'ticker': price.ticker
-                })
-            
-            # Create DataFrame and set timestamp as index
-            df = pd.DataFrame(data)
-            if not df.empty:
-                df = df.sort_values('timestamp')
-                df = df.set_index('timestamp')
-                
+                return pd.DataFrame(columns=HISTORICAL_COLUMNS)
+            
+            # Build the frame column-wise in chronological order
+            df = pd.DataFrame.from_records(prices[::-1], columns=HISTORICAL_COLUMNS)
+            
+            # Convert timestamps to timezone-naive in one pass
+            try:
+                timestamps = pd.to_datetime(df['timestamp'])
+            except ValueError:
+                # Mixed UTC offsets (e.g. across DST) can't be converted together
+                timestamps = pd.to_datetime(df['timestamp'].map(lambda ts: ts.replace(tzinfo=None)))
+            if timestamps.dt.tz is not None:
+                timestamps = timestamps.dt.tz_localize(None)
+            df['timestamp'] = timestamps
+            df = df.set_index('timestamp')
+            
             return df
             
         except Exception as e:
@@ -142,77 +418,328 @@ class SignalGenerator:
                 logger.error("No ticker provided in data point")
                 return None
                 
-            logger.info(f"Processing signal for {ticker} at {data_point.get('timestamp')}")
-            
-            # Get historical data (already has timestamp as index)
-            historical_df = self.get_historical_data(ticker)
-            
-            # Prepare the new data point as a DataFrame
-            timestamp = pd.to_datetime(data_point['timestamp']).tz_localize(None)
-            new_data = {
-                'open': data_point['open'],
-                'high': data_point['high'],
-                'low': data_point['low'],
-                'close': data_point['close'],
-                'volume': data_point['volume'],
-                'ticker': ticker
-            }
-            
-            # Create a new row with the timestamp as index
-            new_row = pd.DataFrame([new_data], index=[timestamp])
-            
-            # Combine with historical data
-            if not historical_df.empty:
-                combined_df = pd.concat([historical_df, new_row])
-            else:
-                combined_df = new_row
-            
-            # Log the current state before processing
-            logger.debug(f"Combined df columns before timestamp handling: {combined_df.columns.tolist()}")
-            logger.debug(f"Index name: {combined_df.index.name}, Index type: {type(combined_df.index)}")
-            
-            # Ensure timestamp column exists and is correct
-            if 'timestamp' not in combined_df.columns:
-                if combined_df.index.name == 'timestamp':
-                    combined_df = combined_df.reset_index()
-                elif isinstance(combined_df.index, pd.DatetimeIndex):
-                    combined_df['timestamp'] = combined_df.index
+            # Hold the ticker's lock so its points update the shared state one
+            # at a time
+            with self._state.lock(ticker):
+                logger.info("Processing signal for %s at %s", ticker, data_point.get('timestamp'))
+                
+                timestamp = pd.to_datetime(data_point['timestamp']).tz_localize(None)
+                
+                # Prepare the new data point
+                new_data = {
+                    'open': data_point['open'],
+                    'high': data_point['high'],
+                    'low': data_point['low'],
+                    'close': data_point['close'],
+                    'volume': data_point['volume'],
+                    'ticker': ticker
+                }
+                
+                # Once seeded, the next bar only updates the running windows
+                # instead of refetching the history. A gap or an out-of-order
+                # point drops the state and goes through the full history path
+                state = self._state.ma.get(ticker)
+                if state is not None:
+                    if timestamp - state.last_timestamp == state.interval:
+                        return self._stream_signal(ticker, state, timestamp, float(data_point['close']))
+                    del self._state.ma[ticker]
+                
+                # Get historical data (already has timestamp as index)
+                historical_df = self.get_historical_data(ticker)
+                
+                # No dynamic confidence threshold, and so no signal, until a
+                # full window is available
+                if len(historical_df) + 1 < WINDOW_CONF:
+                    logger.debug(
+                        "Insufficient history for %s (%d < %d)", ticker, len(historical_df) + 1, WINDOW_CONF
+                    )
+                    return None
+                
+                # Append the new point in place when it is the latest one; historical
+                # data is already sorted, so no concat or re-sort is needed
+                in_order = historical_df.empty or timestamp > historical_df.index[-1]
+                if not historical_df.empty and in_order:
+                    historical_df.loc[timestamp] = [new_data[col] for col in historical_df.columns]
+                    combined_df = historical_df
                 else:
-                    raise ValueError("No timestamp column or index found in combined_df")
+                    new_row = pd.DataFrame([new_data], index=[timestamp])
+                    combined_df = pd.concat([historical_df, new_row]) if not historical_df.empty else new_row
+                    combined_df = combined_df.sort_index(kind='mergesort')
+                
+                # The timestamps are already parsed, so the sorted index becomes the
+                # timestamp column as is
+                combined_df = combined_df.rename_axis('timestamp').reset_index()
+                
+                # Log the final data structure
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Final columns before signal generation: %s", combined_df.columns.tolist())
+                    logger.debug("Sample data:\n%s", combined_df.tail())
+                
+                # Only the latest signal is needed. The guard above leaves at
+                # least WINDOW_CONF rows, more than the 2 * LONG_WINDOW that
+                # generate_ma_signal_last needs
+                latest = generate_ma_signal_last(combined_df)
+                self._seed_ma_state(ticker, combined_df)
+                if latest is None:
+                    logger.info(f"No signals generated for {ticker}")
+                    return None
+                return {
+                    'ticker': ticker,
+                    'timestamp': combined_df['timestamp'].iat[-1],
+                    'signal_type': 'ma_dynamic',
+                    **latest
+                }
             
-            # Ensure timestamp is in the correct format and sort
-            combined_df['timestamp'] = pd.to_datetime(combined_df['timestamp'], utc=False)
-            combined_df = combined_df.sort_values('timestamp')
+        except Exception as e:
+            logger.error(f"Error processing data point: {str(e)}", exc_info=True)
+            return None
+    
+    def _seed_ma_state(self, ticker: str, combined_df: pd.DataFrame) -> None:
+        """
+        Seed the streaming moving-average state for a ticker from its history.
+        
+        The state is only kept when the history is long enough that
+        generate_ma_signals uses its default windows and its bar interval can
+        be inferred; otherwise the next point goes through the full path again.
+        
+        Args:
+            ticker: Ticker symbol
+            combined_df: Chronological price data with timestamp and close columns
+        """
+        state = _StreamingMA(long_window=LONG_WINDOW)
+        if len(combined_df) >= state.long_window * 2:
+            state.interval = _bar_interval(combined_df['timestamp'])
+        if state.interval is None:
+            self._state.ma.pop(ticker, None)
+            return
+        for ts, close in zip(combined_df['timestamp'], combined_df['close'].to_numpy(dtype=np.float64)):
+            state.update(ts, float(close))
+        self._state.ma[ticker] = state
+    
+    def _stream_signal(
+        self, ticker: str, state: _StreamingMA, timestamp: pd.Timestamp, close: float
+    ) -> Dict:
+        """
+        Generate the signal for a new point from the streaming state.
+        
+        Args:
+            ticker: Ticker symbol
+            state: Seeded streaming state for the ticker
+            timestamp: Timestamp of the new point (timezone-naive)
+            close: Close price of the new point
             
-            # Log the final data structure
-            logger.debug(f"Final columns before signal generation: {combined_df.columns.tolist()}")
-            logger.debug(f"Sample data: {combined_df[['timestamp', 'open', 'high', 'low', 'close', 'volume']].tail() if not combined_df.empty else 'Empty DataFrame'}")
+        Returns:
+            Dictionary containing the generated signal
+        """
+        ma_short, ma_long, recent_max, confidence = state.update(timestamp, close)
+        signal, reasoning = state.signal(close, ma_short, ma_long, recent_max, confidence)
+        return {
+            'ticker': ticker,
+            'timestamp': timestamp,
+            'signal': signal,
+            'signal_type': 'ma_dynamic',
+            'confidence': confidence,
+            'reasoning': reasoning
+        }
+    
+    def process_batch(self, data_points: List[Dict]) -> List[Dict]:
+        """
+        Generate signals for many data points, grouped by ticker.
+        
+        Each ticker's history is fetched once and all of its points are
+        appended to it; the signals for the new rows then come from one
+        vectorized run over the combined frame. Tickers with too little
+        history for the default windows go through process_single_data_point
+        point by point instead.
+        
+        Args:
+            data_points: List of price data dictionaries (same keys as
+                process_single_data_point)
             
-            # Generate signals using existing MA logic with the combined data
-            signals_df = generate_ma_signals(ticker=ticker, df=combined_df)
+        Returns:
+            List of generated signal dictionaries, grouped by ticker in
+            timestamp order
+        """
+        keyed = []
+        for data_point in data_points:
+            ticker = data_point.get('ticker')
+            if not ticker:
+                logger.error("No ticker provided in data point")
+                continue
+            keyed.append((ticker, pd.to_datetime(data_point['timestamp']).tz_localize(None), data_point))
+        keyed.sort(key=itemgetter(0, 1))
+        
+        signals = []
+        for ticker, group in groupby(keyed, key=itemgetter(0)):
+            signals.extend(self._process_ticker_batch(ticker, list(group)))
+        return signals
+    
+    def _process_ticker_batch(self, ticker: str, keyed: List[Tuple[str, pd.Timestamp, Dict]]) -> List[Dict]:
+        """
+        Generate the signals for one ticker's points in a single run.
+        
+        Args:
+            ticker: Ticker symbol
+            keyed: (ticker, timezone-naive timestamp, data point) tuples in
+                timestamp order
             
-            if signals_df is None or signals_df.empty:
-                logger.info(f"No signals generated for {ticker}")
-                return None
+        Returns:
+            List of generated signal dictionaries in timestamp order
+        """
+        try:
+            with self._state.lock(ticker):
+                historical_df = self.get_historical_data(ticker)
+                new_rows = pd.DataFrame.from_records(
+                    [
+                        {
+                            'timestamp': timestamp,
+                            'open': data_point['open'],
+                            'high': data_point['high'],
+                            'low': data_point['low'],
+                            'close': data_point['close'],
+                            'volume': data_point['volume'],
+                            'ticker': ticker
+                        }
+                        for _, timestamp, data_point in keyed
+                    ],
+                    columns=HISTORICAL_COLUMNS
+                )
+                new_rows['_is_new'] = True
+                if historical_df.empty:
+                    history = pd.DataFrame(columns=HISTORICAL_COLUMNS)
+                else:
+                    history = historical_df.rename_axis('timestamp').reset_index()
+                history['_is_new'] = False
+                combined_df = (
+                    pd.concat([history, new_rows], ignore_index=True)
+                    .sort_values('timestamp', kind='mergesort', ignore_index=True)
+                )
                 
-            # Get the most recent signal
-            latest_signal = signals_df.iloc[-1].to_dict()
-            
-            # Prepare signal data for database
-            signal_data = {
+                # Rows that can't be scored yet are skipped, as in
+                # process_single_data_point
+                is_new = combined_df['_is_new'].to_numpy(dtype=bool)
+                positions = np.flatnonzero(is_new)
+                first = int(positions[0])
+                tail = generate_ma_signals_tail(combined_df, len(combined_df) - first)
+                if tail is None:
+                    return self._process_points(keyed)
+                
+                self._seed_ma_state(ticker, combined_df)
+                scored = positions[positions + 1 >= WINDOW_CONF]
+                tail = tail.iloc[scored - first]
+                timestamps = combined_df['timestamp'].to_numpy()[scored]
+        
+        except Exception as e:
+            logger.error(f"Error processing batch for {ticker}: {str(e)}", exc_info=True)
+            return []
+        
+        return [
+            {
                 'ticker': ticker,
-                'timestamp': pd.to_datetime(latest_signal['timestamp']),
-                'signal': latest_signal['signal'],
+                'timestamp': pd.Timestamp(timestamp),
+                'signal': signal,
                 'signal_type': 'ma_dynamic',
-                'confidence': latest_signal.get('confidence', 0.0),
-                'reasoning': latest_signal.get('reasoning', '')
+                'confidence': float(confidence),
+                'reasoning': reasoning
             }
+            for timestamp, signal, confidence, reasoning in zip(
+                timestamps, tail['signal'], tail['confidence'], tail['reasoning']
+            )
+        ]
+    
+    def _process_points(self, keyed: List[Tuple[str, pd.Timestamp, Dict]]) -> List[Dict]:
+        """
+        Generate signals for points one at a time with process_single_data_point.
+        
+        Args:
+            keyed: (ticker, timestamp, data point) tuples in timestamp order
             
-            return signal_data
+        Returns:
+            List of generated signal dictionaries
+        """
+        signals = []
+        for _, _, data_point in keyed:
+            signal_data = self.process_single_data_point(data_point)
+            if signal_data:
+                signals.append(signal_data)
+        return signals
+    
+    def save_signals(self, signals: List[Dict]) -> int:
+        """
+        Save many signals to the database in one bulk insert.
+        
+        Signals that already exist for their ticker and timestamp are skipped,
+        as in save_signal.
+        
+        Args:
+            signals: List of signal dictionaries
             
+        Returns:
+            Number of signals inserted
+        """
+        try:
+            # Reuse the provided session
+            if self.db_session is not None:
+                return self._save_signals_with_session(self.db_session, signals)
+            
+            # Otherwise, create a new session
+            with get_db() as db:
+                return self._save_signals_with_session(db, signals)
+                
         except Exception as e:
-            logger.error(f"Error processing data point: {str(e)}", exc_info=True)
-            return None
+            logger.error(f"Error saving signals to database: {str(e)}", exc_info=True)
+            return 0
+    
+    def _save_signals_with_session(self, db: Session, signals: List[Dict]) -> int:
+        """
+        Internal method to bulk save signals with an existing session.
+        
+        Args:
+            db: Database session
+            signals: List of signal dictionaries
+            
+        Returns:
+            Number of signals inserted
+        """
+        if not signals:
+            return 0
+        
+        rows = [
+            {
+                'ticker': signal_data['ticker'],
+                'timestamp': _naive_datetime(signal_data['timestamp']),
+                'signal': signal_data.get('signal', 'STAY'),
+                'signal_type': signal_data.get('signal_type', 'ma_dynamic'),
+                'confidence': float(signal_data.get('confidence', 0.0)),
+                'reasoning': signal_data.get('reasoning', '')
+            }
+            for signal_data in signals
+        ]
+        
+        # One query for the signals already stored in the batch's time range.
+        # PostgreSQL returns timezone-aware timestamps, so compare them naive
+        timestamps = [row['timestamp'] for row in rows]
+        stored = {
+            (ticker, _naive_datetime(timestamp))
+            for ticker, timestamp in db.execute(
+                select(TickersSignals.ticker, TickersSignals.timestamp)
+                .where(
+                    TickersSignals.ticker.in_({row['ticker'] for row in rows}),
+                    TickersSignals.timestamp.between(min(timestamps), max(timestamps))
+                )
+            ).all()
+        }
+        
+        new_rows = []
+        for row in rows:
+            key = (row['ticker'], row['timestamp'])
+            if key not in stored:
+                stored.add(key)
+                new_rows.append(row)
+        
+        inserted = bulk_insert_signals(db, new_rows)
+        logger.info(f"Saved {inserted} new signals ({len(rows) - inserted} already existed)")
+        return inserted
     
     def save_signal(self, signal_data: Dict) -> Optional[Dict]:
         """
@@ -225,8 +752,8 @@ class SignalGenerator:
             Dictionary with signal info if successful, None if failed
         """
         try:
-            # If we have a session and it's not closed, use it
-            if self.db_session is not None and not self.db_session.bind.pool.checkedout():
+            # Reuse the provided session
+            if self.db_session is not None:
                 return self._save_signal_with_session(self.db_session, signal_data)
             
             # Otherwise, create a new session
@@ -252,30 +779,6 @@ class SignalGenerator:
             # Ensure timestamp is a datetime object
             if isinstance(signal_data.get('timestamp'), str):
                 signal_data['timestamp'] = pd.to_datetime(signal_data['timestamp'])
-            
-            # Check if signal already exists for this timestamp and ticker
-            existing = (
-                db.query(TickersSignals)
-                .filter(
-                    TickersSignals.ticker == signal_data['ticker'],
-                    TickersSignals.timestamp == signal_data['timestamp']
-                )
-                .first()
-            )
-            
-            if existing:
-                logger.info(f"Signal already exists for {signal_data['ticker']} at {signal_data['timestamp']}")
-                return {
-                    'id': existing.id,
-                    'ticker': existing.ticker,
-                    'timestamp': existing.timestamp,
-                    'signal': existing.signal,
-                    'signal_type': existing.signal_type,
-                    'confidence': float(existing.confidence) if existing.confidence is not None else 0.0,
-                    'reasoning': existing.reasoning or ''
-                }
-            
-            from core.db.crud.tickers_signals_db import insert_signal
                 
             # Create signal data dictionary
             signal_dict = {
@@ -287,12 +790,32 @@ class SignalGenerator:
                 'reasoning': signal_data.get('reasoning', '')
             }
             
-            # Insert the signal and get the ID
-            signal_id = insert_signal(db, signal_dict)
+            # Insert the signal unless one already exists for this timestamp and ticker
+            signal_id = insert_signal_if_absent(db, signal_dict)
             
             if signal_id is None:
-                logger.error("Failed to get signal ID after insert")
-                return None
+                existing = (
+                    db.query(TickersSignals)
+                    .filter(
+                        TickersSignals.ticker == signal_data['ticker'],
+                        TickersSignals.timestamp == signal_data['timestamp']
+                    )
+                    .first()
+                )
+                if existing is None:
+                    logger.error("Signal insert was skipped but no existing signal was found")
+                    return None
+                
+                logger.info(f"Signal already exists for {signal_data['ticker']} at {signal_data['timestamp']}")
+                return {
+                    'id': existing.id,
+                    'ticker': existing.ticker,
+                    'timestamp': existing.timestamp,
+                    'signal': existing.signal,
+                    'signal_type': existing.signal_type,
+                    'confidence': float(existing.confidence) if existing.confidence is not None else 0.0,
+                    'reasoning': existing.reasoning or ''
+                }
                 
             logger.info(f"Saved new {signal_dict['signal']} signal for {signal_dict['ticker']} "
                        f"at {signal_dict['timestamp']} with ID {signal_id}")
@@ -305,17 +828,24 @@ class SignalGenerator:
             
         except Exception as e:
             logger.error(f"Error in _save_signal_with_session: {str(e)}", exc_info=True)
-            if 'db' in locals():
-                try:
-                    db.rollback()
-                except Exception as rollback_error:
-                    logger.error(f"Error during rollback: {str(rollback_error)}")
+            try:
+                db.rollback()
+            except Exception as rollback_error:
+                logger.error(f"Error during rollback: {str(rollback_error)}")
             return None
 
+# Per-ticker state shared by every generate_signal_for_data_point call, so
+# streaming state carries over between ticks on any thread
+_shared_state = _TickerStateStore()
+
+
 def generate_signal_for_data_point(data_point: Dict) -> Optional[Dict]:
     """
     Convenience function to generate and save a signal for a single data point.
     
+    History lookup and save share one database session; the streaming
+    state is shared across calls and threads.
+    
     Args:
         data_point: Dictionary containing price data
         
@@ -323,18 +853,17 @@ def generate_signal_for_data_point(data_point: Dict) -> Optional[Dict]:
         Dictionary containing the saved signal data or None if generation/save failed
     """
     try:
-        # Create a new SignalGenerator with its own session management
-        generator = SignalGenerator()
-        
-        # Process the data point and get the signal data
-        signal_data = generator.process_single_data_point(data_point)
-        
-        if not signal_data:
-            logger.warning("No signal data generated")
-            return None
+        with get_db() as db:
+            generator = SignalGenerator(db_session=db, state_store=_shared_state)
+            
+            # Process the data point and get the signal data
+            signal_data = generator.process_single_data_point(data_point)
             
-        # Save the signal (this will create its own session if needed)
-        saved_signal = generator.save_signal(signal_data)
+            if not signal_data:
+                logger.warning("No signal data generated")
+                return None
+                
+            saved_signal = generator.save_signal(signal_data)
         
         if not saved_signal:
             logger.warning("Failed to save signal to database")
@@ -353,3 +882,35 @@ def generate_signal_for_data_point(data_point: Dict) -> Optional[Dict]:
     except Exception as e:
         logger.error(f"Error in generate_signal_for_data_point: {str(e)}", exc_info=True)
         return None
+
+def generate_signals_for_batch(data_points: List[Dict]) -> List[Dict]:
+    """
+    Convenience function to generate and save signals for many data points.
+    
+    Args:
+        data_points: List of dictionaries containing price data
+        
+    Returns:
+        List of generated signal dictionaries; signals that were already
+        stored are included but not inserted again
+    """
+    try:
+        with get_db() as db:
+            generator = SignalGenerator(db_session=db)
+            signals = generator.process_batch(data_points)
+            
+            if not signals:
+                logger.warning("No signal data generated")
+                return []
+            
+            generator.save_signals(signals)
+        
+        for signal_data in signals:
+            if hasattr(signal_data['timestamp'], 'isoformat'):
+                signal_data['timestamp'] = signal_data['timestamp'].isoformat()
+            signal_data['confidence'] = float(signal_data['confidence'])
+        return signals
+        
+    except Exception as e:
+        logger.error(f"Error in generate_signals_for_batch: {str(e)}", exc_info=True)
+        return []
@@ -14,6 +14,7 @@ from rich.table import Table
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 from core.signals.moving_average import generate_ma_signals
+from core.config.paths import get_signal_file_path
 from core.config.constants import WINDOW_CONF, Z_MIN, QUANTILE_MIN, USE_QUANTILE
 
 # Configuration
@@ -24,6 +25,24 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 console = Console()
 
+def load_strategy_signals(ticker: str, conf_type: str) -> pd.DataFrame:
+    """
+    Load the signal file generate_ma_signals wrote for one confidence type.
+    
+    Args:
+        ticker: Ticker symbol
+        conf_type: Confidence type ('fixed' or 'dynamic')
+        
+    Returns:
+        pd.DataFrame: Signals from the Parquet file, or the CSV file if no
+        Parquet file was written
+    """
+    signal_file = Path(get_signal_file_path(ticker, DATE, conf_type))
+    parquet_file = signal_file.with_suffix(".parquet")
+    if parquet_file.exists():
+        return pd.read_parquet(parquet_file)
+    return pd.read_csv(signal_file)
+
 def run_comparison():
     """Run comparison between fixed and dynamic threshold strategies."""
     results = []
@@ -31,29 +50,19 @@ def run_comparison():
     for ticker in TICKERS:
         console.print(f"\n[bold blue]Processing {ticker}...[/bold blue]")
         
-        # Run with fixed threshold
-        fixed_output = OUTPUT_DIR / f"{ticker}_fixed_{DATE}.csv"
-        console.print("\n[cyan]Running with FIXED threshold (original behavior)...[/cyan]")
+        # One run writes both strategies: the signals are computed once and
+        # filtered with the fixed and the dynamic threshold into separate files
+        console.print("\n[cyan]Running with FIXED and DYNAMIC thresholds...[/cyan]")
         generate_ma_signals(
             ticker=ticker,
             date=DATE,
-            confidence_threshold=0.005,
-            include_reasoning=True
-        )
-        
-        # Run with dynamic threshold
-        console.print("\n[cyan]Running with DYNAMIC threshold...[/cyan]")
-        dynamic_output = OUTPUT_DIR / f"{ticker}_dynamic_{DATE}.csv"
-        generate_ma_signals(
-            ticker=ticker,
-            date=DATE,
-            confidence_threshold=0.005,  # Fallback threshold
+            confidence_threshold=0.005,  # Fixed threshold and dynamic fallback
             include_reasoning=True
         )
         
         # Load and analyze results
-        fixed_df = pd.read_csv(f"tickers/{ticker}/signals/signal_{DATE}.csv")
-        dynamic_df = pd.read_csv(f"tickers/{ticker}/signals/signal_{DATE}.csv")  # Same file in this case
+        fixed_df = load_strategy_signals(ticker, "fixed")
+        dynamic_df = load_strategy_signals(ticker, "dynamic")
         
         # Save results for comparison
         fixed_output = OUTPUT_DIR / f"{ticker}_fixed_{DATE}.csv"
@@ -62,10 +71,12 @@ def run_comparison():
         dynamic_df.to_csv(dynamic_output, index=False)
         
         # Count signals
-        fixed_buys = (fixed_df['signal'] == 'BUY').sum()
-        fixed_sells = (fixed_df['signal'] == 'SELL').sum()
-        dynamic_buys = (dynamic_df['signal'] == 'BUY').sum()
-        dynamic_sells = (dynamic_df['signal'] == 'SELL').sum()
+        fixed_buys, fixed_sells = (
+            fixed_df['signal'].value_counts().reindex(['BUY', 'SELL'], fill_value=0).tolist()
+        )
+        dynamic_buys, dynamic_sells = (
+            dynamic_df['signal'].value_counts().reindex(['BUY', 'SELL'], fill_value=0).tolist()
+        )
         
         results.append({
             'Ticker': ticker,
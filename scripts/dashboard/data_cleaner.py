@@ -2,7 +2,11 @@
 Database cleaning utilities for the trading system.
 Handles clearing of ticker data and signals from the database.
 """
-from typing import Optional
+import io
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Literal, Optional
 from rich.console import Console
 from rich.panel import Panel
 from sqlalchemy import text
@@ -14,15 +18,73 @@ from core.db.base import Base
 
 # Import configuration
 from core.config import console
+from core.config.utils import get_env_variable
+
+# Tables estimated below this many rows are cleared with DELETE in "auto" mode
+DELETE_ROW_THRESHOLD = 10_000
+
+# Statements built once and reused, rather than a new TextClause per call
+_SQL_PING = text("SELECT 1")
+# Matching on regclass OIDs picks the tables on the search path, not every
+# relation with the same name in other schemas
+_SQL_ESTIMATES = text(
+    "SELECT relname, reltuples::BIGINT, relpages FROM pg_class "
+    "WHERE oid IN ('tickers_data'::regclass, 'tickers_signals'::regclass)"
+)
+_SQL_COUNT_DATA = text("SELECT COUNT(*) FROM tickers_data")
+_SQL_COUNT_SIGNALS = text("SELECT COUNT(*) FROM tickers_signals")
+# No CASCADE: nothing else references these tables, so there is no
+# dependency walk to do
+_SQL_TRUNCATE_BOTH = text("TRUNCATE TABLE ONLY tickers_data, tickers_signals")
+_SQL_TRUNCATE_BOTH_RESTART = text("TRUNCATE TABLE ONLY tickers_data, tickers_signals RESTART IDENTITY")
+_SQL_DELETE_DATA = text("DELETE FROM tickers_data")
+_SQL_DELETE_SIGNALS = text("DELETE FROM tickers_signals")
+_SQL_RESET_SEQUENCE = text("SELECT setval(pg_get_serial_sequence(:table_name, 'id'), 1, false)")
+
+def _row_estimate(reltuples: int, relpages: int) -> int:
+    """Turn a pg_class row estimate into a row count, or -1 if it is unknown.
+    
+    reltuples is -1 for a table that was never vacuumed or analyzed. Before
+    PostgreSQL 14 it is 0 in that case too, which only means "empty" when the
+    table also has no pages.
+    
+    Args:
+        reltuples: pg_class.reltuples
+        relpages: pg_class.relpages
+    
+    Returns:
+        int: Estimated row count, or -1 if the size is unknown
+    """
+    if reltuples < 0 or (reltuples == 0 and relpages > 0):
+        return -1
+    return reltuples
+
+def _use_delete(strategy: str, estimates: Dict[str, int]) -> bool:
+    """Decide whether clear_tables should DELETE instead of TRUNCATE.
+    
+    DELETE beats TRUNCATE on small tables, since it skips the file rewrite
+    and catalog updates. A negative estimate means the table was never
+    analyzed, so its size is unknown and "auto" keeps TRUNCATE, as it does
+    when an estimate is missing.
+    
+    Args:
+        strategy: "truncate", "delete" or "auto"
+        estimates: Planner row estimates by table name
+    
+    Returns:
+        bool: True to clear the tables with DELETE
+    """
+    return strategy == "delete" or (
+        strategy == "auto"
+        and len(estimates) == 2
+        and all(0 <= estimate < DELETE_ROW_THRESHOLD for estimate in estimates.values())
+    )
 
 class DataCleaner:
     """Handles cleaning of database tables."""
     
     def _log_error(self, error_msg: str, exc: Exception = None):
         """Log error to console and file."""
-        from datetime import datetime
-        import traceback
-        
         # Create logs directory if it doesn't exist
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
@@ -31,12 +93,14 @@ class DataCleaner:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"database_clean_{timestamp}.log"
         
-        with open(log_file, "w") as f:
-            f.write(f"{timestamp} - ERROR: {error_msg}\n")
-            if exc:
-                f.write(f"Exception: {str(exc)}\n")
-                f.write("Traceback:\n")
-                traceback.print_exc(file=f)
+        # Build the whole entry in memory and write it in one call
+        buf = io.StringIO()
+        buf.write(f"{timestamp} - ERROR: {error_msg}\n")
+        if exc:
+            buf.write(f"Exception: {str(exc)}\n")
+            buf.write("Traceback:\n")
+            buf.write("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+        log_file.write_text(buf.getvalue())
         
         # Print to console
         console.print(f"[red]ERROR: {error_msg}[/red]")
@@ -45,82 +109,148 @@ class DataCleaner:
         
         return str(log_file.absolute())
 
-    def clear_tables(self) -> bool:
-        """Clear all data from tickers_data and tickers_signals tables."""
+    def clear_tables(
+        self,
+        verbose: bool = False,
+        restart_identity: bool = False,
+        strategy: Literal["auto", "truncate", "delete"] = "auto"
+    ) -> bool:
+        """Clear all data from tickers_data and tickers_signals tables.
+        
+        Args:
+            verbose: Print estimated row counts before clearing and exact
+                counts afterwards. Off by default, since counting large
+                tables costs more than the TRUNCATE itself.
+            restart_identity: Also reset the tables' id sequences. Off by
+                default, since ids don't need to start from 1 again and the
+                reset is an extra catalog update.
+            strategy: "truncate", "delete", or "auto" to DELETE when both
+                tables are estimated below DELETE_ROW_THRESHOLD rows and
+                TRUNCATE otherwise
+        
+        Returns:
+            bool: True if the tables were cleared, False on error
+        """
+        if strategy not in ("auto", "truncate", "delete"):
+            raise ValueError(f"Unknown strategy: {strategy!r}")
+        
+        # Status lines are collected and printed once per phase rather than
+        # one write per message
+        msgs = []
+
+        def flush():
+            if msgs:
+                print("\n".join(msgs))
+                msgs.clear()
+
         try:
-            print("\n=== Starting database cleanup ===")
-            
-            # First, just test the database connection
-            try:
-                print("\nTesting database connection...")
-                with get_db() as db:
-                    result = db.execute(text("SELECT 1")).scalar()
-                    print(f"Database connection test result: {result}")
-            except Exception as e:
-                print(f"\n[ERROR] Database connection failed: {str(e)}")
-                import traceback
-                print("\nError details:")
-                traceback.print_exc()
-                return False
-                
-            # If we got here, the connection works
-            print("\nDatabase connection successful!")
+            msgs.append("\n=== Starting database cleanup ===")
             
-            # Now try to get table counts
-            try:
-                print("\nGetting table counts...")
-                with get_db() as db:
-                    count = db.execute(text("SELECT COUNT(*) FROM tickers_data")).scalar()
-                    print(f"Rows in tickers_data: {count}")
+            # The checks and counts share one session; the clearing itself runs
+            # on its own connection
+            with get_db() as db:
+                # First, just test the database connection
+                try:
+                    msgs.append("\nTesting database connection...")
+                    result = db.execute(_SQL_PING).scalar()
+                    msgs.append(f"Database connection test result: {result}")
+                except Exception as e:
+                    msgs.append(f"\n[ERROR] Database connection failed: {str(e)}")
+                    msgs.append("\nError details:")
+                    flush()
+                    traceback.print_exc()
+                    return False
                     
-                    count = db.execute(text("SELECT COUNT(*) FROM tickers_signals")).scalar()
-                    print(f"Rows in tickers_signals: {count}")
-            except Exception as e:
-                print(f"\n[ERROR] Failed to get table counts: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                return False
+                # If we got here, the connection works
+                msgs.append("\nDatabase connection successful!")
+                flush()
+                
+                # Planner estimates instead of full-table COUNT(*) scans. They
+                # also pick the clearing strategy in "auto" mode
+                estimates = {}
+                if verbose or strategy == "auto":
+                    try:
+                        if verbose:
+                            msgs.append("\nGetting estimated table counts...")
+                        estimates = {
+                            table_name: _row_estimate(reltuples, relpages)
+                            for table_name, reltuples, relpages in db.execute(_SQL_ESTIMATES)
+                        }
+                        if verbose:
+                            for table_name, estimate in estimates.items():
+                                shown = estimate if estimate >= 0 else "unknown"
+                                msgs.append(f"Rows in {table_name} (estimate): {shown}")
+                        flush()
+                    except Exception as e:
+                        if verbose:
+                            msgs.append(f"\n[ERROR] Failed to get table counts: {str(e)}")
+                            flush()
+                            traceback.print_exc()
+                            return False
+                        # Without estimates "auto" falls back to TRUNCATE
+                        db.rollback()
+                        estimates = {}
                 
-            # Try to clear the tables
-            try:
-                print("\nClearing tables...")
-                with get_db() as db:
-                    print("Clearing tickers_data...")
-                    db.execute(text("TRUNCATE TABLE tickers_data RESTART IDENTITY CASCADE"))
-                    print("Clearing tickers_signals...")
-                    db.execute(text("TRUNCATE TABLE tickers_signals RESTART IDENTITY CASCADE"))
-                    db.commit()
-                    print("Tables cleared successfully!")
+                use_delete = _use_delete(strategy, estimates)
+                    
+                # Try to clear the tables
+                try:
+                    msgs.append("\nClearing tables...")
+                    msgs.append("Clearing tickers_data and tickers_signals...")
+                    if use_delete:
+                        with engine.begin() as conn:
+                            conn.execute(_SQL_DELETE_DATA)
+                            conn.execute(_SQL_DELETE_SIGNALS)
+                            if restart_identity:
+                                for table_name in ("tickers_data", "tickers_signals"):
+                                    conn.execute(_SQL_RESET_SEQUENCE, {"table_name": table_name})
+                    else:
+                        # One statement truncates both tables
+                        truncate_sql = _SQL_TRUNCATE_BOTH_RESTART if restart_identity else _SQL_TRUNCATE_BOTH
+                        # Autocommit connection: no BEGIN/COMMIT around the statement,
+                        # so the ACCESS EXCLUSIVE lock is released as soon as it ends
+                        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                            conn.execute(truncate_sql)
+                    msgs.append("Tables cleared successfully!")
                     
                     # Verify tables are empty
-                    print("\nVerifying tables are empty...")
-                    count = db.execute(text("SELECT COUNT(*) FROM tickers_data")).scalar()
-                    print(f"Rows in tickers_data after clear: {count}")
+                    if verbose:
+                        msgs.append("\nVerifying tables are empty...")
+                        count = db.execute(_SQL_COUNT_DATA).scalar()
+                        msgs.append(f"Rows in tickers_data after clear: {count}")
+                        
+                        count = db.execute(_SQL_COUNT_SIGNALS).scalar()
+                        msgs.append(f"Rows in tickers_signals after clear: {count}")
                     
-                    count = db.execute(text("SELECT COUNT(*) FROM tickers_signals")).scalar()
-                    print(f"Rows in tickers_signals after clear: {count}")
+                    msgs.append("\n=== Database cleanup completed successfully! ===")
+                    flush()
+                    return True
                     
-                print("\n=== Database cleanup completed successfully! ===")
-                return True
-                
-            except Exception as e:
-                print(f"\n[ERROR] Failed to clear tables: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                return False
+                except Exception as e:
+                    msgs.append(f"\n[ERROR] Failed to clear tables: {str(e)}")
+                    flush()
+                    traceback.print_exc()
+                    return False
                 
         except Exception as e:
-            print(f"\n[ERROR] Unexpected error: {str(e)}")
-            import traceback
+            msgs.append(f"\n[ERROR] Unexpected error: {str(e)}")
+            flush()
             traceback.print_exc()
             return False
 
-    def _confirm_deletion(self) -> bool:
+    def _confirm_deletion(self, assume_yes: bool = False) -> bool:
         """Ask for confirmation before clearing tables.
         
+        Args:
+            assume_yes: Skip the prompt and confirm. Also enabled by setting
+                the TRADER_ASSUME_YES environment variable, for scripted runs
+        
         Returns:
             bool: True if user confirms, False otherwise
         """
+        if assume_yes or get_env_variable("TRADER_ASSUME_YES", False):
+            return True
+        
         print("\n" + "="*80)
         print("WARNING: This will delete ALL data from tickers_data and tickers_signals tables!")
         print("This action cannot be undone!")
@@ -137,15 +267,18 @@ class DataCleaner:
             return False
 
 
-def clean_data():
+def clean_data(assume_yes: bool = False):
     """CLI function to clear database tables.
     
+    Args:
+        assume_yes: Skip the confirmation prompt
+    
     Returns:
         bool: True if successful, False if error, None if user cancelled
     """
     try:
         cleaner = DataCleaner()
-        if not cleaner._confirm_deletion():
+        if not cleaner._confirm_deletion(assume_yes=assume_yes):
             return None  # User cancelled
             
         print("\nStarting database cleanup...")
@@ -158,11 +291,5 @@ def clean_data():
         
     except Exception as e:
         print(f"\nAn error occurred: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-    except Exception as e:
-        print(f"\nAn error occurred: {e}")
-        import traceback
         traceback.print_exc()
         return False
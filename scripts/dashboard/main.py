@@ -8,9 +8,15 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+# Optional prompt_toolkit support (line editing and history for the menu prompt)
+try:
+    from prompt_toolkit import PromptSession
+    _HAVE_PROMPT_TOOLKIT = True
+except ImportError:
+    _HAVE_PROMPT_TOOLKIT = False
+
 # Import dashboard modules
 from scripts.dashboard.data_cleaner import clean_data
-from scripts.dashboard.pipeline_operations import run_complete_pipeline, get_pipeline_status
 from scripts.dashboard.signal_operations import regenerate_signals
 
 # Initialize CLI app and console
@@ -18,7 +24,19 @@ app = typer.Typer(help="Trading System Dashboard")
 console = Console()
 
 # Add commands
-app.command(name="clean-data", help="Clean all data from the tickers/data directory")(clean_data)
+@app.command(name="clean-data", help="Clean all data from the tickers/data directory")
+def clean_data_command(
+    assume_yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Don't ask for confirmation (or set TRADER_ASSUME_YES=1)",
+    ),
+):
+    """Clear the database tables, optionally without the confirmation prompt."""
+    if clean_data(assume_yes=assume_yes) is False:
+        raise typer.Exit(1)
+
 app.command(name="regenerate-signals", help="Regenerate signal files with specified confidence threshold")(regenerate_signals)
 
 # Main menu
@@ -54,11 +72,17 @@ def show_menu():
 @app.command()
 def dashboard():
     """Start the interactive dashboard."""
+    # The menu is drawn once; results print below it and the prompt comes
+    # straight back, rather than redrawing everything behind a "Press Enter"
+    session = PromptSession() if _HAVE_PROMPT_TOOLKIT else None
+    prompt = "\nEnter your choice ('menu' to show options, 'exit' to quit): "
+    show_menu()
     while True:
-        show_menu()
-        choice = input("\nEnter your choice (or 'exit' to quit): ").strip().lower()
+        choice = (session.prompt(prompt) if session is not None else input(prompt)).strip().lower()
         
-        if choice in ['1', 'clean-data']:
+        if choice in ['', 'menu']:
+            show_menu()
+        elif choice in ['1', 'clean-data']:
             result = clean_data()
             if result is None:  # User cancelled
                 pass  # clean_data already showed a message
@@ -67,6 +91,8 @@ def dashboard():
             else:  # Error
                 console.print("\n[red]✗ Failed to clear database. Check logs for details.[/red]")
         elif choice in ['2', 'run-pipeline']:
+            # Deferred so the other menu options don't load the download stack
+            from scripts.dashboard.pipeline_operations import run_complete_pipeline
             console.print("\n[bold blue]Running complete pipeline...[/bold blue]")
             success = run_complete_pipeline()
             if success:
@@ -78,8 +104,6 @@ def dashboard():
             break
         else:
             console.print("\n[red]Invalid choice. Please try again.[/red]")
-        
-        input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
     app()
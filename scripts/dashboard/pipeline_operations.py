@@ -15,15 +15,16 @@ from rich.progress import (
     SpinnerColumn,
     TextColumn,
     BarColumn,
+    MofNCompleteColumn,
     TaskProgressColumn
 )
 
 # Add project root to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Import pipeline components
-from core.data.downloader import download_all_tickers, load_tickers
-from core.signals.moving_average import generate_all_ma_signals
+# Pipeline components (core.data.downloader pulls in pandas, yfinance and the
+# database layer) are imported inside the functions that use them, so the
+# dashboard only pays for them when the pipeline actually runs
 
 # Initialize console
 console = Console()
@@ -55,6 +56,8 @@ def run_complete_pipeline(
     Returns:
         bool: True if download completed successfully, False otherwise
     """
+    from core.data.downloader import download_all_tickers, load_tickers
+    
     # Parse date if provided, otherwise use today
     target_date = datetime.now() if not date else datetime.strptime(date, "%Y-%m-%d")
     display_date = target_date.strftime("%Y-%m-%d")
@@ -66,31 +69,29 @@ def run_complete_pipeline(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(bar_width=None),
             TaskProgressColumn(),
-            TextColumn("•"),
-            TextColumn("({task.completed}/{task.total} tickers)"),
+            MofNCompleteColumn(),
             transient=True,
-            refresh_per_second=10
+            refresh_per_second=4
         ) as progress:
-            # Add a task for the download progress
-            overall_task = progress.add_task("[cyan]Downloading ticker data...", total=100)
-            
             try:
                 # Download data for all tickers, passing our progress bar
                 console.print(f"[bold blue]Downloading data up to {display_date}...[/bold blue]")
                 
                 # Create a task for the download progress
+                tickers = load_tickers()
                 download_task = progress.add_task(
                     "[green]Downloading tickers...",
-                    total=len(load_tickers())  # We know the total number of tickers
+                    total=len(tickers)  # We know the total number of tickers
                 )
                 
-                # Download with progress updates
+                # Download concurrently, advancing the progress bar per ticker
                 download_results = download_all_tickers(
                     end_date=target_date,  # Use target_date as end_date
                     interval=interval,
                     period=period,
                     progress=progress,
-                    task_id=download_task
+                    task_id=download_task,
+                    tickers=tickers
                 )
                 
                 # Remove the download task
@@ -108,9 +109,6 @@ def run_complete_pipeline(
                     console.print("[yellow]⚠ No new data was downloaded![/yellow]")
                     return False
                 
-                # Update overall progress to 100%
-                progress.update(overall_task, completed=100, description="[green]✓ Download completed![/green]")
-                
                 return True
                 
             except Exception as e:
@@ -82,21 +82,6 @@ def regenerate_signals(
             default=no_delete
         )
     
-    # Build the command
-    cmd = [sys.executable, "scripts/regenerate_signals.py"]
-    
-    if use_dynamic is not None:
-        cmd.append("--dynamic" if use_dynamic else "--fixed")
-    
-    cmd.extend(["--threshold", str(threshold)])
-    cmd.extend(["--short-window", str(short_window)])
-    cmd.extend(["--long-window", str(long_window)])
-    
-    if date:
-        cmd.extend(["--date", date])
-    if no_delete:
-        cmd.append("--no-delete")
-    
     # Show confirmation
     console.print(Panel.fit(
         "[bold yellow]Signal Regeneration[/bold yellow]\n"
@@ -112,7 +97,99 @@ def regenerate_signals(
         console.print("[yellow]Operation cancelled.[/yellow]")
         return
     
-    # Run the command with progress
+    try:
+        from scripts import regenerate_signals as regen_script
+    except ImportError:
+        regen_script = None
+
+    if regen_script is not None:
+        returncode = _run_in_process(
+            regen_script, use_dynamic, threshold, short_window, long_window, date, no_delete
+        )
+    else:
+        returncode = _run_subprocess(
+            use_dynamic, threshold, short_window, long_window, date, no_delete
+        )
+
+    if returncode != 0:
+        console.print(f"[red]✗ Error regenerating signals (exit code {returncode})[/red]")
+        raise typer.Exit(1)
+    console.print("\n[green]✓ Signal regeneration completed successfully![/green]")
+
+
+def _run_in_process(
+    regen_script,
+    use_dynamic: Optional[bool],
+    threshold: float,
+    short_window: int,
+    long_window: int,
+    date: Optional[str],
+    no_delete: bool
+) -> int:
+    """
+    Run the regeneration script's steps in this process.
+
+    Skips a second interpreter start-up and reuses the modules (pandas, numpy,
+    the database engine) the dashboard has already loaded. The script shows
+    its own progress bar, so no spinner is wrapped around it.
+
+    Returns:
+        int: 0 on success, 1 on failure (mirrors the script's exit code)
+    """
+    from core.config import constants
+
+    # regenerate_signals overrides this global; restore it so the choice
+    # doesn't leak into later dashboard commands, as it couldn't from a subprocess
+    saved_use_dynamic = constants.USE_DYNAMIC_CONFIDENCE
+    try:
+        if not no_delete:
+            console.print("[yellow]Deleting existing signals...[/yellow]")
+            regen_script.delete_all_signals()
+        regen_script.regenerate_signals(
+            use_dynamic=use_dynamic,
+            confidence_threshold=threshold,
+            short_window=short_window,
+            long_window=long_window,
+            date=date or None
+        )
+    except Exception as e:
+        console.print(f"[red]Error: {str(e)}[/red]")
+        return 1
+    finally:
+        constants.USE_DYNAMIC_CONFIDENCE = saved_use_dynamic
+    return 0
+
+
+def _run_subprocess(
+    use_dynamic: Optional[bool],
+    threshold: float,
+    short_window: int,
+    long_window: int,
+    date: Optional[str],
+    no_delete: bool
+) -> int:
+    """
+    Run scripts/regenerate_signals.py in a child interpreter.
+
+    Fallback for when the script can't be imported.
+
+    Returns:
+        int: The script's exit code
+    """
+    cmd = [sys.executable, "scripts/regenerate_signals.py"]
+
+    if use_dynamic is not None:
+        cmd.append("--dynamic" if use_dynamic else "--fixed")
+
+    cmd.extend(["--threshold", str(threshold)])
+    cmd.extend(["--short-window", str(short_window)])
+    cmd.extend(["--long-window", str(long_window)])
+
+    if date:
+        cmd.extend(["--date", date])
+    if no_delete:
+        cmd.append("--no-delete")
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -120,19 +197,17 @@ def regenerate_signals(
         transient=True,
     ) as progress:
         progress.add_task("Regenerating signals...", total=None)
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=str(Path(__file__).parent.parent.parent),
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            console.print("\n[green]✓ Signal regeneration completed successfully![/green]")
-            if result.stdout:
-                console.print("\n" + result.stdout)
-        except subprocess.CalledProcessError as e:
-            console.print(f"[red]✗ Error regenerating signals:[/red]")
-            if e.stderr:
-                console.print(e.stderr)
-            raise typer.Exit(1)
+        # Stream the script's output as it arrives instead of buffering it all
+        # until exit; stderr is merged so errors show up in order.
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(Path(__file__).parent.parent.parent),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        with proc.stdout:
+            for line in proc.stdout:
+                console.print(line, end="", markup=False, highlight=False)
+        return proc.wait()
@@ -12,17 +12,21 @@ import time
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
+
+import pandas as pd
 
 from rich.console import Console
 from rich import print as rprint
 
 from core.data import (
-    download_ticker_data,  # Still needed for preview
+    download_all_tickers,
     load_tickers,
     process_ticker_data,
+    process_ticker_data_with_frame,
     process_all_tickers
 )
+from core.config.constants import API_RETRY_ATTEMPTS, API_RETRY_DELAY
 from ui.data_display import (
     display_download_progress,
     display_download_summary,
@@ -33,6 +37,63 @@ from ui.data_display import (
 console = Console()
 
 
+def download_ticker(
+    ticker: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    interval: str,
+    period: Optional[str],
+    save_date: Optional[datetime],
+    preview: bool
+) -> Tuple[str, Optional[pd.DataFrame]]:
+    """
+    Run one ticker through the pipeline, retrying transient failures.
+    
+    Network errors (OSError, which covers connection errors and timeouts from
+    the HTTP clients) are retried up to API_RETRY_ATTEMPTS times with
+    exponential back-off starting at API_RETRY_DELAY seconds. Anything else,
+    such as a ValueError for failed validation, is raised straight away.
+    
+    Args:
+        ticker: Ticker symbol
+        start_date: Start date for data download
+        end_date: End date for data download
+        interval: Data interval
+        period: Period to download
+        save_date: Date to use for the file name
+        preview: Keep the processed data for a preview
+    
+    Returns:
+        Tuple[str, Optional[pd.DataFrame]]: Saved file path and the preview data
+        (None unless preview is set)
+    """
+    for attempt in range(API_RETRY_ATTEMPTS + 1):
+        try:
+            if preview:
+                # The pipeline's own data serves as the preview; no second download
+                return process_ticker_data_with_frame(
+                    ticker,
+                    start_date=start_date,
+                    end_date=end_date,
+                    interval=interval,
+                    period=period,
+                    save_date=save_date
+                )
+            file_path = process_ticker_data(
+                ticker,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+                period=period,
+                save_date=save_date
+            )
+            return file_path, None
+        except OSError:
+            if attempt == API_RETRY_ATTEMPTS:
+                raise
+            time.sleep(API_RETRY_DELAY * 2 ** attempt)
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Download ticker data")
@@ -122,50 +183,54 @@ def main():
     # Process all tickers using the pipeline
     results = {}
     
+    def fetch(ticker: str) -> Tuple[str, Optional[pd.DataFrame], Optional[str]]:
+        try:
+            file_path, preview_data = download_ticker(
+                ticker,
+                args.start_date,
+                args.end_date,
+                args.interval,
+                args.period if not args.start_date else None,
+                save_date,
+                args.preview
+            )
+            return file_path, preview_data, None
+        except ValueError as e:
+            # Handle specific ValueError exceptions (like future dates or validation errors)
+            error = f"Error processing {ticker}: {str(e)}"
+        except Exception as e:
+            # Handle other exceptions
+            error = f"Unexpected error processing {ticker}: {str(e)}"
+        # Add to results with error status
+        return "ERROR", None, error
+    
+    def record(ticker: str, result: Tuple[str, Optional[pd.DataFrame], Optional[str]]) -> None:
+        file_path, preview_data, error = result
+        results[ticker] = file_path
+        if error is not None:
+            console.print(f"[bold red]{error}")
+        
+        # Preview data if requested
+        if preview_data is not None:
+            display_ticker_data_preview(ticker, preview_data)
+        
+        # Update progress
+        progress.update(ticker_tasks[ticker], completed=1)
+    
+    # Downloads run concurrently through download_all_tickers; results,
+    # progress updates and previews are handled here in the main thread as
+    # each ticker finishes
     with progress:
-        for ticker in tickers:
-            try:
-                # Process ticker data through the pipeline (download, clean, save)
-                file_path = process_ticker_data(
-                    ticker,
-                    start_date=args.start_date,
-                    end_date=args.end_date,
-                    interval=args.interval,
-                    period=args.period if not args.start_date else None,
-                    save_date=save_date
-                )
-                results[ticker] = file_path
-                
-                # Update progress
-                progress.update(ticker_tasks[ticker], completed=1)
-                progress.update(total_task, advance=1)
-                
-                # Preview data if requested
-                if args.preview:
-                    # Download data again just for preview
-                    preview_data = download_ticker_data(
-                        ticker,
-                        start_date=args.start_date,
-                        end_date=args.end_date,
-                        interval=args.interval,
-                        period=args.period if not args.start_date else None
-                    )
-                    display_ticker_data_preview(ticker, preview_data)
-                
-            except ValueError as e:
-                # Handle specific ValueError exceptions (like future dates or validation errors)
-                console.print(f"[bold red]Error processing {ticker}: {str(e)}")
-                # Add to results with error status
-                results[ticker] = "ERROR"
-                progress.update(ticker_tasks[ticker], completed=1)
-                progress.update(total_task, advance=1)
-            except Exception as e:
-                # Handle other exceptions
-                console.print(f"[bold red]Unexpected error processing {ticker}: {str(e)}")
-                # Add to results with error status
-                results[ticker] = "ERROR"
-                progress.update(ticker_tasks[ticker], completed=1)
-                progress.update(total_task, advance=1)
+        download_all_tickers(
+            progress=progress,
+            task_id=total_task,
+            tickers=tickers,
+            download_func=fetch,
+            on_result=record
+        )
+    
+    # Keep the ticker order for the summary
+    results = {ticker: results[ticker] for ticker in tickers}
                 
     # Calculate elapsed time
     elapsed_time = time.time() - start_time
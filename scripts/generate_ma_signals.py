@@ -32,8 +32,6 @@ from core.config import (
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from core.signals.moving_average import generate_ma_signals, generate_all_ma_signals
-
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -93,6 +91,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported after parsing so --help doesn't load pandas and the Numba kernels
+    from core.signals.moving_average import generate_ma_signals, generate_all_ma_signals
+    
     # Process date argument
     date = None
     if args.date:
@@ -1,7 +1,15 @@
+from sqlalchemy import text
+
 from core.db.session import engine
 from core.db.base import Base
 from core.db.models.user import User  # Ensure model is imported
 from core.db.models.tickers_data import TickersData  # Ensure model is imported
 from core.db.models.tickers_signals import TickersSignals  # Ensure model is imported
-Base.metadata.create_all(bind=engine)
-print("✅ Tables created")
\ No newline at end of file
+
+# Create every table and index in one transaction instead of one per statement
+with engine.begin() as conn:
+    if conn.dialect.name == "postgresql":
+        # Safe to skip waiting for the WAL flush: the DDL can simply be re-run
+        conn.execute(text("SET LOCAL synchronous_commit = off"))
+    Base.metadata.create_all(bind=conn)
+print("✅ Tables created")
@@ -2,16 +2,57 @@
 List all signals in the database.
 """
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 
 # Add project root to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import text
+
 from core.db.deps import get_db
 from core.db.crud.tickers_signals_db import get_signals_for_ticker
 
+# Built once so repeated calls reuse SQLAlchemy's compiled statement cache.
+# Only the printed columns are selected.
+_ALL_SIGNALS_STMT = text(
+    "SELECT ticker, signal, timestamp, confidence, signal_type, reasoning "
+    "FROM tickers_signals ORDER BY timestamp DESC LIMIT :limit"
+)
+
+# Formatted rows are written to stdout in chunks of this many signals
+WRITE_EVERY = 1000
+SEPARATOR = "-" * 80 + "\n"
+
+def _format_signal(count: int, sig) -> str:
+    """Format one signal (raw query row or ORM object) as its output lines."""
+    if isinstance(sig, Mapping):
+        # Handle raw query result
+        ticker, signal, timestamp = sig['ticker'], sig['signal'], sig['timestamp']
+        confidence = sig.get('confidence')
+        signal_type = sig.get('signal_type', 'N/A')
+        reasoning = sig.get('reasoning', 'N/A')
+    else:
+        # Handle ORM object
+        ticker, signal, timestamp = sig.ticker, sig.signal, sig.timestamp
+        confidence = sig.confidence
+        signal_type = sig.signal_type
+        reasoning = sig.reasoning
+    confidence = float(confidence or 0.0)
+    return (
+        f"{count}. {ticker} {signal} at {timestamp} (confidence: {confidence:.2f})\n"
+        f"   Type: {signal_type}, Reason: {reasoning}\n"
+        f"{SEPARATOR}"
+    )
+
 def list_signals(ticker: str = None, limit: int = 10):
-    """List signals from the database."""
+    """List signals from the database.
+    
+    Rows are formatted as they are read from the cursor instead of being
+    collected into a list first, so memory stays flat for large limits.
+    Output is written in chunks of WRITE_EVERY signals rather than one
+    print call per line.
+    """
     try:
         with get_db() as db:
             if ticker:
@@ -20,27 +61,27 @@ def list_signals(ticker: str = None, limit: int = 10):
             else:
                 print("Fetching all signals...")
                 # We'll need to use a raw query to get all signals
-                from sqlalchemy import text
-                query = text("SELECT * FROM tickers_signals ORDER BY timestamp DESC LIMIT :limit")
-                result = db.execute(query, {"limit": limit})
-                signals = [dict(row) for row in result.mappings()]
+                # yield_per streams the rows in batches rather than buffering the full result
+                result = db.execute(
+                    _ALL_SIGNALS_STMT, {"limit": limit}, execution_options={"yield_per": 1000}
+                )
+                signals = result.mappings()
+            
+            write = sys.stdout.write
+            lines = [SEPARATOR]
+            count = 0
+            for count, sig in enumerate(signals, 1):
+                lines.append(_format_signal(count, sig))
+                if len(lines) >= WRITE_EVERY:
+                    write("".join(lines))
+                    lines.clear()
             
-            if not signals:
+            if count == 0:
                 print("No signals found in the database.")
                 return
-                
-            print(f"\nFound {len(signals)} signals:")
-            print("-" * 80)
-            for i, sig in enumerate(signals, 1):
-                if isinstance(sig, dict):
-                    # Handle raw query result
-                    print(f"{i}. {sig['ticker']} {sig['signal']} at {sig['timestamp']} (confidence: {sig.get('confidence', 0):.2f})")
-                    print(f"   Type: {sig.get('signal_type', 'N/A')}, Reason: {sig.get('reasoning', 'N/A')}")
-                else:
-                    # Handle ORM object
-                    print(f"{i}. {sig.ticker} {sig.signal} at {sig.timestamp} (confidence: {sig.confidence:.2f})")
-                    print(f"   Type: {sig.signal_type}, Reason: {sig.reasoning}")
-                print("-" * 80)
+            
+            write("".join(lines))
+            print(f"\nFound {count} signals.")
                 
     except Exception as e:
         print(f"Error: {e}")
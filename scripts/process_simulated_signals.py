@@ -1,11 +1,13 @@
 """
 Process simulated data through the signal generation pipeline.
 """
+import argparse
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
@@ -13,8 +15,10 @@ from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn, T
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from core.data.simulator import DataSimulator, simulate_ticker_data
+from core.data.simulator import batch_simulate, write_simulated_data
 from core.signals.moving_average import generate_ma_signals, generate_all_ma_signals
+from core.db.deps import get_db
+from core.db.crud.tickers_data_db import get_close_for_ticker
 from core.config.paths import get_ticker_data_path, get_signal_file_path
 from core.logger import log_info, log_error, log_warning
 
@@ -47,11 +51,38 @@ logger = get_logger(__name__)
 # Configure console for rich output
 console = Console()
 
+def with_stored_history(ticker: str, candles: pd.DataFrame, db) -> pd.DataFrame:
+    """
+    Append simulated candles to a ticker's stored close history.
+    
+    generate_ma_signals needs at least a long window of rows, which a single
+    run's candles don't provide; this gives in-memory runs the same history
+    the database-backed runs use.
+    
+    Args:
+        ticker: Ticker symbol
+        candles: Simulated candles with ``timestamp`` and ``close`` columns
+        db: Database session
+        
+    Returns:
+        pd.DataFrame: timestamp and close, oldest first; a simulated candle
+        replaces a stored row with the same timestamp
+    """
+    timestamps, closes = get_close_for_ticker(db, ticker)
+    stored_timestamps = pd.DatetimeIndex(timestamps)
+    if stored_timestamps.tz is not None:
+        stored_timestamps = stored_timestamps.tz_localize(None)
+    stored = pd.DataFrame({'timestamp': stored_timestamps, 'close': closes})
+    combined = pd.concat([stored, candles[['timestamp', 'close']]], ignore_index=True)
+    combined = combined.drop_duplicates('timestamp', keep='last')
+    return combined.sort_values('timestamp', kind='mergesort').reset_index(drop=True)
+
 class SimulatedSignalProcessor:
     """Process simulated data through the signal generation pipeline."""
     
     def __init__(self, tickers: List[str], base_prices: Optional[Dict[str, float]] = None, 
-                 volatility: float = 0.015, volume_range: Tuple[int, int] = (1000, 10000)):
+                 volatility: float = 0.015, volume_range: Tuple[int, int] = (1000, 10000),
+                 seed: Optional[int] = None):
         """
         Initialize the signal processor.
         
@@ -60,28 +91,26 @@ class SimulatedSignalProcessor:
             base_prices: Optional dictionary of base prices for each ticker
             volatility: Price volatility (as a fraction of base_price)
             volume_range: Range for random volume generation (min, max)
+            seed: Optional seed for reproducible simulated data
         """
         self.tickers = tickers
-        self.base_prices = base_prices or {ticker: 100.0 for ticker in tickers}
+        self.base_prices = dict(base_prices or {ticker: 100.0 for ticker in tickers})
         self.volatility = volatility
         self.volume_range = volume_range
-        self.simulators = {
-            ticker: DataSimulator(
-                base_price=self.base_prices[ticker],
-                volatility=volatility,
-                volume_range=volume_range
-            )
-            for ticker in tickers
-        }
+        self.rng = np.random.default_rng(seed)
     
     def generate_and_process_data(self, num_candles: int = 1, 
-                               timestamp: Optional[datetime] = None) -> Dict[str, str]:
+                               timestamp: Optional[datetime] = None,
+                               in_memory: bool = False) -> Dict[str, str]:
         """
         Generate simulated data and process it through the signal pipeline.
         
         Args:
             num_candles: Number of 5-minute candles to generate
             timestamp: Starting timestamp (defaults to now - num_candles * 5 minutes)
+            in_memory: Keep the simulated candles in memory instead of writing
+                them to a ticker data file, and generate signals from the
+                stored history with the candles appended
             
         Returns:
             Dict mapping ticker symbols to their signal file paths
@@ -97,34 +126,50 @@ class SimulatedSignalProcessor:
         ) as progress:
             task = progress.add_task("Processing tickers...", total=len(self.tickers))
             
+            # Format the date part for the signal file names (YYYYMMDDHHMM) once;
+            # it is the same for every ticker in the run
+            date_str = (timestamp or datetime.now()).strftime("%Y%m%d%H%M")
+            
+            # Simulate every ticker in one vectorized call
+            frames = batch_simulate(
+                self.tickers, self.base_prices,
+                num_candles=5,  # Generate 5 candles (25 minutes of data)
+                volatility=self.volatility,
+                volume_range=self.volume_range,
+                timestamp=timestamp,
+                seed=self.rng
+            )
+            
             for ticker in self.tickers:
                 progress.update(task, description=f"Processing {ticker}...")
                 
                 try:
-                    # Generate simulated data
-                    simulator = self.simulators[ticker]
-                    data_path = simulator.save_simulated_data(
-                        ticker=ticker,
-                        num_candles=5,  # Generate 5 candles (25 minutes of data)
-                        timestamp=timestamp
-                    )
-                    
-                    if not data_path:
+                    data = frames[ticker]
+                    if data.empty:
                         logger.error(f"Failed to generate data for {ticker}")
                         continue
-                        
-                    logger.info(f"Generated data for {ticker}: {data_path}")
                     
-                    # Format the date part for the signal file name (YYYYMMDDHHMM)
-                    signal_timestamp = timestamp or datetime.now()
-                    date_str = signal_timestamp.strftime("%Y%m%d%H%M")
+                    # Continue the next run's prices from this run's last close
+                    self.base_prices[ticker] = float(data['close'].iloc[-1])
+                    
+                    data_path = None
+                    if not in_memory:
+                        data_path, data = write_simulated_data(ticker, data, timestamp)
+                        
+                    logger.info(f"Generated {len(data)} candles for {ticker}: {data_path or 'in memory'}")
                     
                     logger.info(f"Generating signals for {ticker} using historical data...")
                     
-                    # Generate signals with the exact timestamp for the output file
-                    # The function will automatically load historical data
+                    # Generate signals with the exact timestamp for the output file.
+                    # In-memory candles are appended to the stored history;
+                    # otherwise the function loads the history from the database
+                    history = None
+                    if in_memory:
+                        with get_db() as db:
+                            history = with_stored_history(ticker, data, db)
                     signal_path = generate_ma_signals(
                         ticker=ticker,
+                        df=history,
                         date=date_str,  # Pass the formatted date string
                         short_window=5,  # Short moving average window
                         long_window=20,  # Long moving average window
@@ -140,10 +185,6 @@ class SimulatedSignalProcessor:
                         logger.info(f"Successfully generated signals for {ticker}: {signal_path}")
                     else:
                         logger.warning(f"No signals generated for {ticker} (returned None)")
-                        
-                    # Verify the signal file was created
-                    if signal_path and not Path(signal_path).exists():
-                        logger.error(f"Signal file not found at expected path: {signal_path}")
                     
                 except Exception as e:
                     logger.error(f"Error processing {ticker}: {str(e)}", exc_info=True)
@@ -154,6 +195,11 @@ class SimulatedSignalProcessor:
 
 def main():
     """Main function to run the signal processing pipeline on simulated data."""
+    parser = argparse.ArgumentParser(description='Process simulated data through the signal pipeline')
+    parser.add_argument('--in-memory', action='store_true',
+                        help='Keep simulated candles in memory instead of writing CSV files')
+    args = parser.parse_args()
+    
     # Configuration
     tickers = ["AAPL", "MSFT", "GOOGL", "AMZN", "META"]
     base_prices = {
@@ -179,7 +225,7 @@ def main():
     
     # Generate 50 candles (~4 hours of 5-minute data) to ensure we have enough for signal generation
     # The moving average windows are 5 (short) and 20 (long), so we need at least 20 bars
-    signal_paths = processor.generate_and_process_data(num_candles=50)
+    signal_paths = processor.generate_and_process_data(num_candles=50, in_memory=args.in_memory)
     
     # Display results
     console.rule("[bold green]Processing Complete")
@@ -5,7 +5,9 @@ This script allows you to delete all existing signal files and regenerate them
 using either fixed or dynamic confidence thresholds.
 """
 import argparse
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -16,10 +18,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Import pipeline components
-from core.data.downloader import load_tickers
-from core.signals.moving_average import generate_ma_signals, generate_all_ma_signals
-from core.config.constants import USE_DYNAMIC_CONFIDENCE
+# The signal pipeline (pandas, Numba kernels) is imported inside
+# regenerate_signals, so --help and argument errors return without loading it
+from core.config.constants import USE_DYNAMIC_CONFIDENCE, MAX_WORKERS
 
 # Initialize console
 console = Console()
@@ -31,22 +32,44 @@ def delete_all_signals() -> None:
         console.print("[yellow]No tickers directory found.[/yellow]")
         return
     
-    deleted_count = 0
-    for ticker_dir in tickers_dir.iterdir():
-        signals_dir = ticker_dir / "signals"
-        if signals_dir.exists() and signals_dir.is_dir():
-            shutil.rmtree(signals_dir)
-            signals_dir.mkdir()  # Recreate empty directory
-            deleted_count += 1
+    # Tickers without a signals directory are skipped by _clear_directory
+    # itself, rather than stat-ing every candidate up front
+    with os.scandir(tickers_dir) as entries:
+        signal_dirs = [
+            os.path.join(entry.path, "signals") for entry in entries if entry.is_dir()
+        ]
     
-    console.print(f"[green]✓ Deleted signal files for {deleted_count} tickers[/green]")
+    # Unlinking is IO-bound, so the ticker directories are cleared in parallel
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        cleared = sum(executor.map(_clear_directory, signal_dirs))
+    
+    console.print(f"[green]✓ Deleted signal files for {cleared} tickers[/green]")
+
+def _clear_directory(path: str) -> bool:
+    """
+    Delete everything inside a directory in one pass, keeping the directory.
+    
+    Returns False if the directory does not exist.
+    """
+    try:
+        entries = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    return True
 
 def regenerate_signals(
     use_dynamic: bool = None,
     confidence_threshold: float = 0.005,
     short_window: int = 5,
     long_window: int = 20,
-    date: str = None
+    date: str = None,
+    use_processes: bool = False
 ) -> None:
     """
     Regenerate all signal files with the specified confidence threshold type.
@@ -57,8 +80,12 @@ def regenerate_signals(
         short_window: Short moving average window size.
         long_window: Long moving average window size.
         date: Date in YYYYMMDD format. If None, uses current date.
+        use_processes: Generate signals in worker processes instead of threads.
     """
     from core.config import constants
+    from core.signals.moving_average import (
+        generate_all_ma_signals, SignalFileBatchWriter, SignalDbBatchWriter
+    )
     
     # Update the dynamic confidence setting if specified
     if use_dynamic is not None:
@@ -84,17 +111,29 @@ def regenerate_signals(
         task = progress.add_task("Generating signals...", total=None)
         
         try:
-            results = generate_all_ma_signals(
-                date=date,
-                short_window=short_window,
-                long_window=long_window,
-                confidence_threshold=confidence_threshold,
-                progress=progress,
-                task_id=task
-            )
+            # Signal files and database rows are queued and written in batches
+            # rather than one ticker at a time
+            with SignalFileBatchWriter() as writer, SignalDbBatchWriter() as db_writer:
+                results = generate_all_ma_signals(
+                    date=date,
+                    short_window=short_window,
+                    long_window=long_window,
+                    confidence_threshold=confidence_threshold,
+                    progress=progress,
+                    task_id=task,
+                    batch_writer=writer,
+                    db_writer=db_writer,
+                    use_processes=use_processes
+                )
             
             success_count = len([r for r in results.values() if r is not None])
             console.print(f"\n[green]✓ Successfully generated signals for {success_count} tickers[/green]")
+            # Worker processes insert their own rows and bypass db_writer, so
+            # its counts only cover the threaded run
+            if not use_processes:
+                console.print(f"[green]✓ Inserted {db_writer.inserted} signals into the database[/green]")
+                if db_writer.failed:
+                    console.print(f"[red]✗ {db_writer.failed} signals could not be inserted; see the log for details[/red]")
             
         except Exception as e:
             console.print(f"[red]✗ Error generating signals: {str(e)}[/red]")
@@ -144,6 +183,11 @@ def main():
         action="store_true",
         help="Don't delete existing signals before regeneration"
     )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Generate signals in worker processes instead of threads"
+    )
     
     args = parser.parse_args()
     
@@ -162,7 +206,8 @@ def main():
             confidence_threshold=args.threshold,
             short_window=args.short_window,
             long_window=args.long_window,
-            date=args.date
+            date=args.date,
+            use_processes=args.processes
         )
         
     except Exception as e:
@@ -6,12 +6,20 @@ This script runs the complete trading signal pipeline:
 1. Downloads the latest ticker data
 2. Generates moving average signals with confidence filtering and peak detection
 
+The two stages overlap: signals for a ticker are generated as soon as its
+download finishes, while the remaining downloads continue. With --processes
+the signal jobs run in worker processes.
+
 The pipeline processes all tickers defined in tickers.json.
 """
 import sys
 import argparse
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -25,12 +33,99 @@ from rich.progress import (
 # Add parent directory to path to allow importing from core
 sys.path.append(str(Path(__file__).parent.parent))
 
-from core.data.downloader import download_all_tickers
-from core.signals.moving_average import generate_all_ma_signals
+from core.data.downloader import download_all_tickers, load_tickers
+from core.signals.moving_average import count_ma_signals
+from core.config.constants import MAX_WORKERS, MAX_DOWNLOAD_WORKERS
 
 # Initialize rich console
 console = Console()
 
+def download_and_generate(
+    tickers: List[str],
+    end_date: Optional[datetime],
+    interval: str,
+    period: str,
+    signal_kwargs: Dict[str, Any],
+    progress: Progress,
+    download_task: int,
+    signal_task: int,
+    max_workers: int = MAX_DOWNLOAD_WORKERS,
+    signal_workers: int = MAX_WORKERS,
+    use_processes: bool = False
+) -> Tuple[Dict[str, Tuple[int, int]], Dict[str, int]]:
+    """
+    Download ticker data and generate signals as overlapping stages.
+    
+    Downloads run through download_all_tickers. Each ticker is submitted for signal
+    generation as soon as its download finishes, so signals for fast tickers
+    are computed while slow downloads are still in flight. Tickers whose
+    download failed are still submitted, since the database may already hold
+    data for them.
+    
+    Args:
+        tickers: Ticker symbols to process
+        end_date: End date for the data download
+        interval: Data interval (e.g., "5m")
+        period: Period to download (e.g., "20d")
+        signal_kwargs: Keyword arguments passed to generate_ma_signals
+        progress: Rich Progress instance
+        download_task: Progress task for the downloads
+        signal_task: Progress task for the signal generation
+        max_workers: Maximum concurrent downloads
+        signal_workers: Maximum concurrent signal generation jobs
+        use_processes: Generate signals in spawned worker processes instead
+            of threads, so the pandas work runs on several cores
+        
+    Returns:
+        Tuple of ticker -> (inserted, updated) download counts and
+        ticker -> number of signals generated, both in ticker order
+    """
+    download_results: Dict[str, Tuple[int, int]] = {}
+    signal_results: Dict[str, int] = {}
+    
+    if use_processes:
+        # The progress bar can't cross the process boundary
+        signal_executor = ProcessPoolExecutor(
+            max_workers=signal_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    else:
+        # Passing the bar without a task id stops generate_ma_signals
+        # from starting its own live display
+        signal_kwargs = dict(signal_kwargs, progress=progress)
+        signal_executor = ThreadPoolExecutor(max_workers=signal_workers)
+    
+    def record_signals(ticker: str, future: Future) -> None:
+        try:
+            signal_results[ticker] = future.result()
+        except Exception as e:
+            progress.print(f"✗ Error generating signals for {ticker}: {str(e)}")
+            signal_results[ticker] = 0
+        progress.update(signal_task, advance=1)
+    
+    def submit_signals(ticker: str, result: Tuple[int, int]) -> None:
+        download_results[ticker] = result
+        signal_executor.submit(
+            count_ma_signals, ticker, **signal_kwargs
+        ).add_done_callback(partial(record_signals, ticker))
+    
+    with signal_executor:
+        if tickers:
+            download_all_tickers(
+                end_date=end_date,
+                interval=interval,
+                period=period,
+                progress=progress,
+                task_id=download_task,
+                max_workers=max_workers,
+                tickers=tickers,
+                on_result=submit_signals
+            )
+    
+    return (
+        {ticker: download_results[ticker] for ticker in tickers if ticker in download_results},
+        {ticker: signal_results[ticker] for ticker in tickers if ticker in signal_results}
+    )
+
 def main():
     """Main entry point for the pipeline."""
     parser = argparse.ArgumentParser(
@@ -88,6 +183,11 @@ def main():
         action="store_true", 
         help="Exclude reasoning text from signals"
     )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Generate signals in worker processes instead of threads"
+    )
     
     args = parser.parse_args()
     
@@ -111,53 +211,49 @@ def main():
             expand=False
         ))
         
-        # Step 1: Download ticker data
-        console.print("\n[bold blue]Step 1: Downloading ticker data...[/bold blue]")
-        download_results = download_all_tickers(
-            end_date=date,
-            interval=args.interval,
-            period=args.period,
-            save_date=date
-        )
-        
-        # Display download results
-        download_table = Table(title=f"Data Download Results for {date_str}")
-        download_table.add_column("Ticker", style="cyan")
-        download_table.add_column("File Path", style="green")
-        
-        for ticker, file_path in download_results.items():
-            download_table.add_row(ticker, file_path)
-        
-        console.print(download_table)
-        
-        # Step 2: Generate signals with progress bar
-        console.print("\n[bold blue]Step 2: Generating moving average signals...[/bold blue]")
+        # Download ticker data and generate signals, overlapping the two stages
+        console.print("\n[bold blue]Downloading ticker data and generating moving average signals...[/bold blue]")
+        tickers = load_tickers()
         with Progress(
             TextColumn("[bold blue]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
             console=console
         ) as progress:
-            signal_results = generate_all_ma_signals(
-                date=date,
-                short_window=args.short_window,
-                long_window=args.long_window,
-                include_reasoning=not args.no_reasoning,
-                confidence_threshold=args.confidence_threshold,
-                peak_window=args.peak_window,
-                peak_threshold=args.peak_threshold,
-                progress=progress
+            download_task = progress.add_task("Downloading ticker data", total=len(tickers))
+            signal_task = progress.add_task("Generating signals", total=len(tickers))
+            download_results, signal_results = download_and_generate(
+                tickers,
+                end_date=date,
+                interval=args.interval,
+                period=args.period,
+                signal_kwargs=dict(
+                    date=date,
+                    short_window=args.short_window,
+                    long_window=args.long_window,
+                    include_reasoning=not args.no_reasoning,
+                    confidence_threshold=args.confidence_threshold,
+                    peak_window=args.peak_window,
+                    peak_threshold=args.peak_threshold
+                ),
+                progress=progress,
+                download_task=download_task,
+                signal_task=signal_task,
+                use_processes=args.processes
             )
         
-        # Display signal results
-        signal_table = Table(title=f"Signal Generation Results for {date_str}")
-        signal_table.add_column("Ticker", style="cyan")
-        signal_table.add_column("Signal File", style="green")
+        # Display results
+        results_table = Table(title=f"Pipeline Results for {date_str}")
+        results_table.add_column("Ticker", style="cyan")
+        results_table.add_column("Inserted", style="green", justify="right")
+        results_table.add_column("Updated", style="green", justify="right")
+        results_table.add_column("Signals", style="magenta", justify="right")
         
-        for ticker, file_path in signal_results.items():
-            signal_table.add_row(ticker, file_path)
+        for ticker in tickers:
+            inserted, updated = download_results.get(ticker, (0, 0))
+            results_table.add_row(ticker, str(inserted), str(updated), str(signal_results.get(ticker, 0)))
         
-        console.print(signal_table)
+        console.print(results_table)
         
         # Display pipeline completion
         console.print(Panel(
@@ -0,0 +1,78 @@
+"""
+Tests for choosing between DELETE and TRUNCATE when clearing the tables.
+"""
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from core.db.base import Base
+from core.db.deps import get_db
+from core.db.models.tickers_data import TickersData
+from core.db.models.tickers_signals import TickersSignals
+from core.db.session import engine
+from scripts.dashboard.data_cleaner import DELETE_ROW_THRESHOLD, DataCleaner, _row_estimate, _use_delete
+
+SMALL = {"tickers_data": 10, "tickers_signals": DELETE_ROW_THRESHOLD - 1}
+
+
+@pytest.mark.parametrize("strategy, estimates, expected", [
+    ("auto", SMALL, True),
+    ("auto", dict(SMALL, tickers_data=DELETE_ROW_THRESHOLD), False),
+    # Never analyzed: size unknown
+    ("auto", dict(SMALL, tickers_signals=-1), False),
+    # Estimate query failed or a table is missing
+    ("auto", {}, False),
+    ("auto", {"tickers_data": 10}, False),
+    ("delete", {}, True),
+    ("delete", {"tickers_data": 10 ** 9, "tickers_signals": 10 ** 9}, True),
+    ("truncate", SMALL, False),
+])
+def test_use_delete(strategy, estimates, expected):
+    assert _use_delete(strategy, estimates) is expected
+
+
+@pytest.mark.parametrize("reltuples, relpages, expected", [
+    (0, 0, 0),
+    (500, 3, 500),
+    # Never analyzed, PostgreSQL 14+
+    (-1, 0, -1),
+    # Never analyzed, older PostgreSQL: pages but no row estimate
+    (0, 8, -1),
+])
+def test_row_estimate(reltuples, relpages, expected):
+    assert _row_estimate(reltuples, relpages) == expected
+
+
+def test_clear_tables_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        DataCleaner().clear_tables(strategy="drop")
+
+
+def test_clear_tables_with_delete_empties_both_tables():
+    if engine.url.get_backend_name() != "sqlite" or engine.url.database not in (None, "", ":memory:"):
+        pytest.skip("needs the in-memory SQLite test database")
+    Base.metadata.create_all(engine)
+    
+    timestamp = datetime(2025, 1, 2, 9, 30)
+    with get_db() as db:
+        db.execute(TickersData.__table__.insert(), [
+            dict(ticker="ZZCL", timestamp=timestamp, open=1.0, high=1.0, low=1.0, close=1.0, volume=1)
+        ])
+        db.execute(TickersSignals.__table__.insert(), [
+            dict(ticker="ZZCL", timestamp=timestamp, signal="BUY", signal_type="ma_dynamic",
+                 confidence=0.1, reasoning="")
+        ])
+        db.commit()
+    
+    assert DataCleaner().clear_tables(strategy="delete")
+    
+    with get_db() as db:
+        assert db.execute(select(func.count()).select_from(TickersData)).scalar() == 0
+        assert db.execute(select(func.count()).select_from(TickersSignals)).scalar() == 0
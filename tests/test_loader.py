@@ -0,0 +1,72 @@
+"""
+Tests for reading ticker data CSVs.
+
+read_price_csv uses PyArrow when it is installed and pandas otherwise; both
+readers must return the same columns for the same file.
+"""
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+# Importing the data package sets up the database engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from core.data import loader
+from core.data.loader import read_price_csv
+
+CSV = (
+    "Datetime,Open,High,Low,Close,Volume\n"
+    "2025-01-02 09:30:00,100.0,101.0,99.5,100.5,1200\n"
+    "2025-01-02 09:35:00,100.5,101.5,100.0,101.0,900\n"
+)
+
+
+@pytest.fixture(params=[True, False], ids=["pyarrow", "pandas"])
+def backend(request, monkeypatch):
+    """Run a test with each CSV reader."""
+    if request.param:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(loader, "_HAVE_PYARROW", request.param)
+
+
+def test_read_price_csv_selects_columns(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    df = read_price_csv(path, columns=["datetime", "close"])
+    assert df.index.name == "Datetime"
+    assert list(df.columns) == ["Close"]
+    assert df["Close"].tolist() == [100.5, 101.0]
+
+
+def test_read_price_csv_rejects_missing_columns(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_text(CSV)
+    with pytest.raises(ValueError, match="timestamp"):
+        read_price_csv(path, columns=["timestamp"])
+
+
+def test_read_price_csv_keeps_utc_offsets(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "Datetime,Close\n"
+        "2025-01-02 09:30:00-05:00,100.5\n"
+        "2025-01-02 09:35:00-05:00,101.0\n"
+    )
+    df = read_price_csv(path)
+    # Wall-clock time stays local, whichever reader parsed it
+    assert df.index[0].hour == 9
+    assert df.index.tz_localize(None)[0].hour == 9
+    assert df.index[0].utcoffset().total_seconds() == -5 * 3600
+
+
+def test_read_price_csv_header_with_bom_and_quotes(tmp_path, backend):
+    path = tmp_path / "data.csv"
+    path.write_bytes(
+        b'\xef\xbb\xbf"Datetime","Close","Volume"\n'
+        b"2025-01-02 09:30:00,100.5,1200\n"
+    )
+    df = read_price_csv(path, columns=["datetime", "close"])
+    assert df.index.name == "Datetime"
+    assert list(df.columns) == ["Close"]
@@ -0,0 +1,149 @@
+"""
+Tests for the streaming rolling-window kernels used by moving average signals.
+
+The kernels must match pandas rolling windows, including NaN warm-up and
+NaNs inside the window. They run as plain Python when Numba is missing.
+"""
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+# Importing the signals package sets up the database engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from core.signals._ma_kernels import (
+    rolling_mean, rolling_max_deque, compute_indicators, batch_compute_indicators,
+    rolling_mean_std, decide_signals
+)
+
+
+def make_close(n=300, with_nans=True):
+    """Generate a random-walk close series, optionally with a few NaNs."""
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    if with_nans:
+        close[[40, 41, 150]] = np.nan
+    return close
+
+
+def test_rolling_mean_matches_pandas():
+    close = make_close()
+    for w in (1, 5, 20):
+        expected = pd.Series(close).rolling(w).mean().to_numpy()
+        np.testing.assert_allclose(rolling_mean(close, w), expected, rtol=1e-9, equal_nan=True)
+
+
+def test_rolling_max_matches_pandas():
+    close = make_close()
+    for w in (1, 3, 12):
+        expected = pd.Series(close).rolling(w).max().to_numpy()
+        np.testing.assert_array_equal(rolling_max_deque(close, w), expected)
+
+
+def test_compute_indicators_matches_single_kernels():
+    close = make_close()
+    ma_short, ma_long, recent_max = compute_indicators(close, 5, 20, 12)
+    np.testing.assert_array_equal(ma_short, rolling_mean(close, 5))
+    np.testing.assert_array_equal(ma_long, rolling_mean(close, 20))
+    np.testing.assert_array_equal(recent_max, rolling_max_deque(close, 12))
+
+
+def test_short_series_is_all_nan():
+    close = make_close(n=4, with_nans=False)
+    ma_short, ma_long, recent_max = compute_indicators(close, 5, 20, 12)
+    assert np.isnan(ma_short).all()
+    assert np.isnan(ma_long).all()
+    assert np.isnan(recent_max).all()
+
+
+def test_batch_matches_per_ticker():
+    closes = [make_close(300), make_close(60, with_nans=False), make_close(4, with_nans=False)]
+    flat = np.concatenate(closes)
+    offsets = np.cumsum([0] + [len(c) for c in closes]).astype(np.int64)
+    ma_short, ma_long, recent_max = batch_compute_indicators(flat, offsets, 5, 20, 12)
+    for t, close in enumerate(closes):
+        span = slice(offsets[t], offsets[t + 1])
+        expected = compute_indicators(close, 5, 20, 12)
+        np.testing.assert_array_equal(ma_short[span], expected[0])
+        np.testing.assert_array_equal(ma_long[span], expected[1])
+        np.testing.assert_array_equal(recent_max[span], expected[2])
+
+
+def test_float32_input_keeps_dtype():
+    close = make_close()
+    ma_short, ma_long, recent_max = compute_indicators(close.astype(np.float32), 5, 20, 12)
+    assert ma_short.dtype == ma_long.dtype == recent_max.dtype == np.float32
+    expected = compute_indicators(close, 5, 20, 12)
+    np.testing.assert_allclose(ma_short, expected[0], rtol=1e-6, equal_nan=True)
+    np.testing.assert_allclose(ma_long, expected[1], rtol=1e-6, equal_nan=True)
+    np.testing.assert_allclose(recent_max, expected[2], rtol=1e-6, equal_nan=True)
+
+
+def test_rolling_mean_std_matches_pandas():
+    close = make_close()
+    # Constant stretches must give a standard deviation of exactly zero
+    close[:30] = 0.0
+    close[200:230] = 101.25
+    for w in (1, 5, 20):
+        mean, std = rolling_mean_std(close, w)
+        rolling = pd.Series(close).rolling(w, min_periods=1)
+        expected_std = rolling.std().to_numpy()
+        np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(std, expected_std, rtol=1e-6, atol=1e-12, equal_nan=True)
+        np.testing.assert_array_equal(std == 0, expected_std == 0)
+
+
+def test_decide_signals_matches_numpy():
+    for dtype in (np.float64, np.float32):
+        close = make_close().astype(dtype)
+        ma_short, ma_long, recent_max = compute_indicators(close, 5, 20, 12)
+        n = len(close)
+        confidence = np.empty(n, dtype=dtype)
+        signal = np.empty(n, dtype=np.int8)
+        insufficient = np.empty(n, dtype=bool)
+        is_peak_zone = np.empty(n, dtype=bool)
+        decide_signals(close, ma_short, ma_long, recent_max, dtype(0.99),
+                       confidence, signal, insufficient, is_peak_zone)
+
+        expected_insufficient = np.isnan(ma_short) | np.isnan(ma_long) | np.isnan(recent_max)
+        expected_signal = np.where(ma_short > ma_long, 1, np.where(ma_short < ma_long, 2, 0))
+        expected_signal[expected_insufficient] = 0
+        expected_confidence = np.abs(ma_short - ma_long) / ma_long
+        expected_confidence[expected_insufficient] = 0.0
+
+        np.testing.assert_array_equal(insufficient, expected_insufficient)
+        np.testing.assert_array_equal(is_peak_zone, close >= recent_max * dtype(0.99))
+        np.testing.assert_array_equal(signal, expected_signal)
+        np.testing.assert_array_equal(confidence, expected_confidence.astype(dtype))
+
+
+def test_peaks_rolling_max_matches_pandas():
+    from core.signals.peaks import rolling_max
+    close = make_close()
+    for w in (1, 12, 400):
+        expected = pd.Series(close).rolling(w).max().to_numpy()
+        np.testing.assert_array_equal(rolling_max(close, w), expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_numpy_rolling_indicators_match_pandas(monkeypatch, dtype):
+    from core.signals import moving_average
+    # Force the cumulative-sum fallback whatever is installed
+    monkeypatch.setattr(moving_average, "HAVE_NUMBA", False)
+    monkeypatch.setattr(moving_average, "_HAVE_TALIB", False)
+    monkeypatch.setattr(moving_average, "_HAVE_BN", False)
+    
+    close = make_close().astype(dtype)
+    # 400 is longer than the series, so that window is NaN throughout
+    ma_short, ma_long, recent_max = moving_average._rolling_indicators(close, 5, 400, 12)
+    series = pd.Series(close.astype(np.float64))
+    rtol = 1e-6 if dtype == np.float32 else 1e-9
+    
+    assert ma_short.dtype == dtype and ma_long.dtype == dtype
+    np.testing.assert_allclose(ma_short, series.rolling(5).mean(), rtol=rtol, equal_nan=True)
+    np.testing.assert_array_equal(ma_long, series.rolling(400).mean())
+    np.testing.assert_array_equal(recent_max, series.rolling(12).max().astype(dtype))
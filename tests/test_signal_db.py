@@ -0,0 +1,155 @@
+"""
+Tests for bulk signal inserts.
+
+bulk_insert_signals sends rows with executemany in general and with COPY on
+psycopg2. Both must store the same values, including NULLs and reasoning
+text that needs CSV quoting. SignalGenerator.save_signals must recognise
+stored signals whether the database returns naive or aware timestamps.
+"""
+import csv
+import io
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from core.db.base import Base
+from core.db.crud.tickers_signals_db import bulk_insert_signals
+from core.db.deps import get_db
+from core.db.models.tickers_signals import TickersSignals
+from core.db.session import engine
+
+COLUMNS = ["ticker", "timestamp", "signal", "signal_type", "confidence", "reasoning"]
+
+SIGNALS = [
+    {"ticker": "ZZDB", "timestamp": datetime(2025, 1, 2, 9, 30), "signal": "BUY",
+     "signal_type": "ma_dynamic", "confidence": 0.0123456789, "reasoning": "BUY: MA crossover"},
+    {"ticker": "ZZDB", "timestamp": datetime(2025, 1, 2, 9, 35), "signal": "STAY",
+     "signal_type": "ma_dynamic", "confidence": None, "reasoning": None},
+    {"ticker": "ZZDB", "timestamp": datetime(2025, 1, 2, 9, 40), "signal": "SELL",
+     "signal_type": "ma_fixed", "confidence": 0.5,
+     "reasoning": 'SELL: "peak" zone, confidence 0.5\nsecond line'},
+]
+
+
+class _CopyCursor:
+    """Records what bulk_insert_signals streams to COPY."""
+    
+    def __init__(self, sink):
+        self.sink = sink
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def copy_expert(self, sql, buffer):
+        self.sink.append((sql, buffer.read()))
+
+
+class _Psycopg2Session:
+    """Just enough of a Session bound to a psycopg2 engine for the COPY path."""
+    
+    def __init__(self):
+        self.copies = []
+        self.committed = False
+    
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(driver="psycopg2"))
+    
+    def connection(self):
+        # Session.connection().connection is the DBAPI connection
+        return SimpleNamespace(connection=SimpleNamespace(cursor=lambda: _CopyCursor(self.copies)))
+    
+    def commit(self):
+        self.committed = True
+    
+    def rollback(self):
+        pass
+
+
+def parse_copy_rows(payload):
+    """Read COPY csv rows back, mapping the NULL marker to None."""
+    return [
+        [None if value == r"\N" else value for value in row]
+        for row in csv.reader(io.StringIO(payload))
+    ]
+
+
+def stored_rows():
+    """Read the inserted signals back from the database."""
+    with get_db() as db:
+        rows = db.execute(
+            select(*[getattr(TickersSignals, col) for col in COLUMNS])
+            .where(TickersSignals.ticker == "ZZDB")
+            .order_by(TickersSignals.timestamp)
+        ).all()
+        db.execute(TickersSignals.__table__.delete().where(TickersSignals.ticker == "ZZDB"))
+        db.commit()
+    return rows
+
+
+def test_copy_and_executemany_store_the_same_rows():
+    if engine.url.get_backend_name() != "sqlite" or engine.url.database not in (None, "", ":memory:"):
+        pytest.skip("needs the in-memory SQLite test database")
+    Base.metadata.create_all(engine)
+    
+    with get_db() as db:
+        assert bulk_insert_signals(db, [dict(s) for s in SIGNALS]) == len(SIGNALS)
+    stored = stored_rows()
+    
+    session = _Psycopg2Session()
+    assert bulk_insert_signals(session, [dict(s) for s in SIGNALS]) == len(SIGNALS)
+    assert session.committed
+    (sql, payload), = session.copies
+    assert sql.startswith(f"COPY tickers_signals ({', '.join(COLUMNS)}) FROM STDIN")
+    copied = parse_copy_rows(payload)
+    
+    assert len(copied) == len(stored) == len(SIGNALS)
+    for copy_row, row in zip(copied, stored):
+        ticker, timestamp, signal, signal_type, confidence, reasoning = copy_row
+        assert ticker == row.ticker
+        assert datetime.fromisoformat(timestamp) == row.timestamp.replace(tzinfo=None)
+        assert (signal, signal_type, reasoning) == (row.signal, row.signal_type, row.reasoning)
+        assert (None if confidence is None else float(confidence)) == row.confidence
+
+
+def test_bulk_insert_signals_with_no_rows():
+    assert bulk_insert_signals(_Psycopg2Session(), []) == 0
+
+
+class _AwareTimestampSession:
+    """A session whose stored signals come back timezone-aware, as on PostgreSQL."""
+    
+    def __init__(self, stored):
+        self.stored = stored
+    
+    def execute(self, statement):
+        return SimpleNamespace(all=lambda: self.stored)
+
+
+def test_save_signals_skips_stored_signals_with_aware_timestamps(monkeypatch):
+    from core.signals import signal_generator
+    
+    inserted = []
+    monkeypatch.setattr(
+        signal_generator, "bulk_insert_signals", lambda db, rows: inserted.extend(rows) or len(rows)
+    )
+    eastern = timezone(timedelta(hours=-5))
+    session = _AwareTimestampSession([
+        ("ZZDB", datetime(2025, 1, 2, 9, 30, tzinfo=eastern)),
+        ("ZZDB", datetime(2025, 1, 2, 9, 35, tzinfo=eastern)),
+    ])
+    generator = signal_generator.SignalGenerator(db_session=session)
+    
+    signals = [dict(s, confidence=0.5) for s in SIGNALS]
+    assert generator.save_signals(signals) == 1
+    assert [row["timestamp"] for row in inserted] == [datetime(2025, 1, 2, 9, 40)]
@@ -0,0 +1,65 @@
+"""
+Round-trip tests for moving average signal files.
+
+Signals are written as Parquet when pyarrow is installed and as CSV
+otherwise; incremental runs read the latest timestamp back from either.
+"""
+import os
+import sys
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+# Importing the signals package sets up the database engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from core.signals import moving_average
+from core.signals.moving_average import (
+    _signal_output_path, _write_signal_file, _read_last_signal_timestamp
+)
+
+
+def make_signals(n=50):
+    """Build a small signals frame like generate_ma_signals returns."""
+    timestamps = pd.date_range("2025-01-02 09:30", periods=n, freq="5min")
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "close": [100.0 + i * 0.25 for i in range(n)],
+        "signal": ["STAY", "BUY", "SELL", "STAY", "BUY"] * (n // 5),
+        "confidence": [i / 1000 for i in range(n)],
+        "reasoning": ["STAY: Confidence too low"] * n,
+    })
+
+
+@pytest.mark.parametrize("have_pyarrow", [True, False])
+@pytest.mark.parametrize("output_format", ["parquet", "csv"])
+def test_signal_file_round_trip(tmp_path, monkeypatch, output_format, have_pyarrow):
+    if have_pyarrow:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(moving_average, "_HAVE_PYARROW", have_pyarrow)
+    signals = make_signals()
+    
+    path = _signal_output_path(tmp_path / "20250102.csv", output_format)
+    expected_suffix = ".parquet" if output_format == "parquet" and have_pyarrow else ".csv"
+    assert path.suffix == expected_suffix
+    
+    _write_signal_file(signals, path)
+    
+    if path.suffix == ".parquet":
+        written = pd.read_parquet(path)
+    else:
+        written = pd.read_csv(path, parse_dates=["timestamp"])
+    pd.testing.assert_frame_equal(written, signals, check_dtype=False)
+    assert _read_last_signal_timestamp(path) == signals["timestamp"].max()
+
+
+def test_read_last_signal_timestamp_empty_csv(tmp_path):
+    path = tmp_path / "20250102.csv"
+    make_signals().iloc[:0].to_csv(path, index=False)
+    assert _read_last_signal_timestamp(path) is None
+
+
+def test_signal_output_path_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        _signal_output_path(tmp_path / "20250102.csv", "feather")
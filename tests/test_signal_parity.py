@@ -0,0 +1,321 @@
+"""
+Parity tests for the latest-signal fast paths.
+
+generate_ma_signal_last must return what generate_ma_signals reports for
+the last row of the same frame, including around NaN closes, and
+generate_ma_signals_tail what generate_ma_signal_last returns for each of
+its rows.
+"""
+import itertools
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+# Importing the signals package sets up the database engine
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+from core.signals import moving_average
+from core.signals.moving_average import (
+    generate_ma_signals, generate_ma_signal_last, generate_ma_signals_tail, generate_signals_bulk
+)
+
+TICKER = "ZZPARITY"
+
+
+def make_prices(n=300, freq="5min"):
+    """Random-walk price frame with a few NaN closes."""
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(0, 0.4, n))
+    close[[60, 61, 200]] = np.nan
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-02 09:30", periods=n, freq=freq),
+        "close": close,
+    })
+
+
+@pytest.fixture
+def batch_last(tmp_path, monkeypatch):
+    """Return the last row generate_ma_signals produces for a frame.
+    
+    Each call writes its signal files to a fresh directory, so no call sees
+    an earlier call's files as existing signals.
+    """
+    runs = itertools.count()
+    
+    def run(df):
+        out = tmp_path / str(next(runs))
+        monkeypatch.setattr(
+            moving_average, "get_signal_file_path",
+            lambda ticker, date, confidence_type="dynamic":
+                str(out / f"{date}_{ticker}_signal_{confidence_type}.csv")
+        )
+        return generate_ma_signals(ticker=TICKER, df=df, date="20250102").iloc[-1]
+    
+    return run
+
+
+class _CaptureWriter:
+    """Stands in for the file and database batch writers of generate_ma_signals."""
+    
+    def __init__(self):
+        self.frames = {}
+    
+    def write(self, signals, path):
+        self.frames["fixed" if "fixed" in Path(path).name else "dynamic"] = signals
+    
+    def add(self, rows):
+        pass
+
+
+@pytest.fixture
+def fixed_signals(tmp_path, monkeypatch):
+    """Return the rows generate_ma_signals writes to the fixed signal file."""
+    monkeypatch.setattr(
+        moving_average, "get_signal_file_path",
+        lambda ticker, date, confidence_type="dynamic":
+            str(tmp_path / f"{date}_{ticker}_signal_{confidence_type}.csv")
+    )
+    
+    def run(df, ticker=TICKER):
+        writer = _CaptureWriter()
+        generate_ma_signals(ticker=ticker, df=df, date="20250102", batch_writer=writer, db_writer=writer)
+        return writer.frames["fixed"].reset_index(drop=True)
+    
+    return run
+
+
+def assert_same_columns(result, expected, columns=("ma_short", "ma_long", "confidence")):
+    """Compare signal frames: labels exactly, floats to rounding."""
+    assert list(result["signal"].astype(str)) == list(expected["signal"].astype(str))
+    assert list(result["reasoning"]) == list(expected["reasoning"])
+    assert list(result["is_peak_zone"]) == list(expected["is_peak_zone"])
+    for col in columns:
+        np.testing.assert_allclose(
+            result[col].to_numpy(dtype=np.float64), expected[col].to_numpy(dtype=np.float64),
+            rtol=1e-9, atol=1e-12
+        )
+
+
+def assert_same_signal(latest, expected):
+    assert latest["signal"] == expected["signal"]
+    assert latest["reasoning"] == expected["reasoning"]
+    assert latest["confidence"] == pytest.approx(expected["confidence"], rel=1e-9, abs=1e-12)
+
+
+def test_generate_ma_signal_last_matches_every_third_prefix(batch_last):
+    prices = make_prices()
+    checked = 0
+    for end in range(3, len(prices) + 1, 3):
+        prefix = prices.iloc[:end].reset_index(drop=True)
+        latest = generate_ma_signal_last(prefix)
+        if latest is None:
+            # Short frames go through generate_ma_signals' shrunken windows
+            assert end < 40
+            continue
+        assert_same_signal(latest, batch_last(prefix))
+        checked += 1
+    assert checked > 80
+
+
+def test_generate_ma_signals_tail_matches_signal_last():
+    prices = make_prices()
+    tail = generate_ma_signals_tail(prices, 150)
+    assert len(tail) == 150
+    # The tail crosses the NaN close at row 200
+    for k in range(len(tail)):
+        end = len(prices) - len(tail) + k + 1
+        assert_same_signal(tail.iloc[k], generate_ma_signal_last(prices.iloc[:end]))
+    assert generate_ma_signals_tail(prices.iloc[:39], 5) is None
+
+
+def test_streaming_ma_replay_matches_batch(batch_last):
+    from core.signals.signal_generator import _StreamingMA
+    
+    prices = make_prices()
+    seed = len(prices) - 120
+    state = _StreamingMA()
+    for ts, close in zip(prices["timestamp"][:seed], prices["close"][:seed]):
+        state.update(ts, close)
+    
+    # The replay crosses the NaN close at row 200
+    for j in range(seed, len(prices)):
+        close = prices["close"].iat[j]
+        values = state.update(prices["timestamp"].iat[j], close)
+        signal, reasoning = state.signal(close, *values)
+        expected = batch_last(prices.iloc[:j + 1].reset_index(drop=True))
+        assert_same_signal({"signal": signal, "reasoning": reasoning, "confidence": values[3]}, expected)
+
+
+def test_streaming_ma_resum_keeps_sums_exact():
+    from core.signals.signal_generator import _StreamingMA
+    
+    rng = np.random.default_rng(3)
+    close = 1e6 + np.cumsum(rng.normal(0, 50, 3 * _StreamingMA.RESUM_EVERY))
+    close[100] = np.nan
+    state = _StreamingMA()
+    for i, value in enumerate(close):
+        state.update(i, value)
+    assert state.sum_short == pytest.approx(np.nansum(close[-state.short_window:]), rel=1e-12)
+    assert state.sum_long == pytest.approx(np.nansum(close[-state.long_window:]), rel=1e-12)
+
+
+@pytest.fixture
+def stored_history():
+    """Store the first 150 bars of a price frame as TICKER's price history.
+    
+    Returns the first 160 bars, NaN closes filled; the rows are deleted again
+    after the test.
+    """
+    from core.db.base import Base
+    from core.db.deps import get_db
+    from core.db.models.tickers_data import TickersData
+    from core.db.session import engine
+    
+    if engine.url.get_backend_name() != "sqlite" or engine.url.database not in (None, "", ":memory:"):
+        pytest.skip("needs the in-memory SQLite test database")
+    Base.metadata.create_all(engine)
+    
+    prices = make_prices().iloc[:160].fillna(100.0)
+    history = prices.iloc[:150]
+    with get_db() as db:
+        db.execute(TickersData.__table__.delete().where(TickersData.ticker == TICKER))
+        db.execute(TickersData.__table__.insert(), [
+            dict(ticker=TICKER, timestamp=ts.to_pydatetime(), open=c, high=c, low=c, close=c, volume=1)
+            for ts, c in zip(history["timestamp"], history["close"])
+        ])
+        db.commit()
+    
+    yield prices
+    
+    with get_db() as db:
+        db.execute(TickersData.__table__.delete().where(TickersData.ticker == TICKER))
+        db.commit()
+
+
+def as_data_point(prices, j, ticker=TICKER):
+    close = prices["close"].iat[j]
+    return dict(
+        ticker=ticker, timestamp=prices["timestamp"].iat[j],
+        open=close, high=close, low=close, close=close, volume=1
+    )
+
+
+def test_signal_generator_refetches_history_after_a_gap(monkeypatch, stored_history):
+    from core.signals.signal_generator import SignalGenerator, HISTORY_LIMIT
+    
+    prices = stored_history
+    generator = SignalGenerator()
+    fetches = []
+    fetch = generator._get_historical_data_with_session
+    monkeypatch.setattr(
+        generator, "_get_historical_data_with_session",
+        lambda *args: fetches.append(args[1]) or fetch(*args)
+    )
+    
+    def tick(j):
+        return generator.process_single_data_point(as_data_point(prices, j))
+    
+    # Contiguous bars stream from the seeded state
+    for j in (150, 151, 152):
+        assert tick(j) is not None
+    assert len(fetches) == 1
+    assert generator._state.ma[TICKER].count == HISTORY_LIMIT + 3
+    
+    # Bar 153 is missing: the streaming state is dropped
+    assert tick(154) is not None
+    assert len(fetches) == 2
+    assert generator._state.ma[TICKER].count == HISTORY_LIMIT + 1
+    
+    # An out-of-order bar goes through the full path as well
+    assert tick(153) is not None
+    assert len(fetches) == 3
+
+
+def test_process_batch_matches_streamed_points(monkeypatch, stored_history):
+    from core.signals.signal_generator import SignalGenerator
+    
+    prices = stored_history
+    streamed = SignalGenerator()
+    expected = [streamed.process_single_data_point(as_data_point(prices, j)) for j in range(150, 160)]
+    
+    generator = SignalGenerator()
+    fetches = []
+    fetch = generator._get_historical_data_with_session
+    monkeypatch.setattr(
+        generator, "_get_historical_data_with_session",
+        lambda *args: fetches.append(args[1]) or fetch(*args)
+    )
+    # Shuffled, and with a ticker that has no history at all
+    points = [as_data_point(prices, j) for j in range(159, 149, -1)]
+    points.insert(3, as_data_point(prices, 150, ticker="ZZNOHIST"))
+    signals = generator.process_batch(points)
+    
+    # One history fetch for the whole batch of TICKER's points
+    assert fetches.count(TICKER) == 1
+    assert len(signals) == len(expected)
+    for signal, exp in zip(signals, expected):
+        assert signal["timestamp"] == exp["timestamp"]
+        assert_same_signal(signal, exp)
+    
+    # The batch leaves the streaming state seeded after its last point
+    assert generator._state.ma[TICKER].last_timestamp == prices["timestamp"].iat[159]
+
+
+def test_polars_signals_match_fixed_signal_file(fixed_signals):
+    pl = pytest.importorskip("polars")
+    from core.signals.moving_average_polars import generate_ma_signals_polars
+    
+    prices = make_prices()
+    result = generate_ma_signals_polars(pl.DataFrame({
+        "timestamp": prices["timestamp"].to_numpy(),
+        "close": prices["close"].to_numpy(),
+    }))
+    # Column by column, so the comparison doesn't need pyarrow
+    result = pd.DataFrame({col: result[col].to_numpy() for col in result.columns})
+    assert_same_columns(result, fixed_signals(prices))
+
+
+def test_generate_signals_bulk_matches_fixed_signal_files(fixed_signals):
+    prices = {
+        "ZZBULKA": make_prices(),
+        "ZZBULKB": make_prices().iloc[:120].reset_index(drop=True),
+        # Shorter than the long window; generate_ma_signals scales the windows down
+        "ZZBULKC": make_prices().iloc[:15].reset_index(drop=True),
+    }
+    # Interleaved rows, so the bulk path has to sort them into ticker segments
+    combined = pd.concat([frame.assign(ticker=t) for t, frame in prices.items()]).sort_values("timestamp")
+    result = generate_signals_bulk(combined)
+    
+    for ticker, frame in prices.items():
+        rows = result[result["ticker"] == ticker].reset_index(drop=True)
+        assert_same_columns(rows, fixed_signals(frame, ticker))
+
+
+def test_rerun_on_same_directory_matches_full_run(tmp_path, monkeypatch):
+    prices = make_prices()
+    
+    def run(out, df, date):
+        """Run generate_ma_signals into ``out`` and read back its dynamic signal file."""
+        monkeypatch.setattr(
+            moving_average, "get_signal_file_path",
+            lambda ticker, date, confidence_type="dynamic":
+                str(out / f"{date}_{ticker}_signal_{confidence_type}.csv")
+        )
+        generate_ma_signals(
+            ticker=TICKER, df=df, date=date, output_format="csv", db_writer=_CaptureWriter()
+        )
+        return pd.read_csv(out / f"{date}_{TICKER}_signal_dynamic.csv", parse_dates=["timestamp"])
+    
+    full = run(tmp_path / "full", prices, "202501020900")
+    
+    run(tmp_path / "rerun", prices.iloc[:200], "202501021000")
+    # The second run only writes the new rows, but its moving averages and
+    # thresholds still come from the whole history
+    rerun = run(tmp_path / "rerun", prices, "202501021100")
+    expected = full.iloc[200:].reset_index(drop=True)
+    assert list(rerun["timestamp"]) == list(expected["timestamp"])
+    assert_same_columns(rerun, expected, columns=("ma_short", "ma_long", "confidence", "threshold_used"))